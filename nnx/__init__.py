@@ -8,6 +8,15 @@ import nnx.classes
 from nnx.classes.simplegraphset import *
 from nnx.classes.simplegraphlist import *
 from nnx.classes.simplegrapharray import *
+from nnx.classes.simplegraphvector import *
+from nnx.classes.simplegraphcsr import *
+from nnx.classes.simpledigraphset import *
+from nnx.classes.simpledigraphlist import *
+from nnx.classes.simpledigrapharray import *
+from nnx.classes.simpledigraphcsr import *
+from nnx.classes.simpleweightedgrapharray import *
+from nnx.classes.simpleweightedgraphcsr import *
+from nnx.classes.function import *
 
 import nnx.generators
 from nnx.generators.classic import *
@@ -17,11 +26,19 @@ import nnx.algorithms
 from nnx.algorithms.traversal.breadth_first_search import *
 from nnx.algorithms.traversal.depth_first_search import *
 from nnx.algorithms.cycles import *
+from nnx.algorithms.cluster import *
+from nnx.algorithms.core import *
 from nnx.algorithms.shortest_paths.weighted import *
+from nnx.algorithms.shortest_paths.generic import *
 from nnx.algorithms.link_analysis.pagerank_alg import *
 from nnx.algorithms.components.connected import *
+from nnx.algorithms.components.dynamic import DynamicConnectivity
+from nnx.algorithms.centrality.betweenness import *
+from nnx.algorithms.centrality.closeness import *
+from nnx.algorithms.centrality.harmonic import *
 
 import nnx.operators
 from nnx.operators import *
 
 from nnx.nojit.readwrite.edgelist import *
+from nnx.nojit.readwrite.binary import *
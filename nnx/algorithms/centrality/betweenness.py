@@ -0,0 +1,158 @@
+import numba
+import numpy as np
+
+import nnx.classes.common as nnx_common
+from nnx.algorithms.shortest_paths.weighted import _heap_push_or_decrease, _heap_pop, _check_weights
+
+@numba.njit
+def _check_positive_weights(g, weights, eoff):
+    _check_weights(g, weights, eoff)
+    if weights is not None and len(weights) > 0 and weights.min() == 0:
+        raise Exception('Betweenness centrality requires positive edge weights')
+
+@numba.njit
+def _brandes_sssp(g, s, weights, eoff, dist, sigma, order, heap, pos):
+    # Shortest-path counts from s. Fill order with the reached vertices in
+    # non-decreasing distance and return how many there are.
+    dist[s] = 0.0
+    sigma[s] = 1.0
+    if weights is None:
+        order[0] = s
+        head = 0
+        tail = 1
+        while head < tail:
+            u = order[head]
+            head += 1
+            for v in g.outneighbors(u):
+                if dist[v] == np.inf:
+                    dist[v] = dist[u] + 1.0
+                    order[tail] = v
+                    tail += 1
+                if dist[v] == dist[u] + 1.0:
+                    sigma[v] += sigma[u]
+        return tail
+    nreached = 0
+    size = _heap_push_or_decrease(heap, pos, dist, 0, s)
+    while size > 0:
+        u, size = _heap_pop(heap, pos, dist, size)
+        order[nreached] = u
+        nreached += 1
+        du = dist[u]
+        k = eoff[u]
+        for v in g.outneighbors(u):
+            alt = du + weights[k]
+            k += 1
+            if alt < dist[v]:
+                dist[v] = alt
+                sigma[v] = sigma[u]
+                size = _heap_push_or_decrease(heap, pos, dist, size, v)
+            elif alt == dist[v]:
+                sigma[v] += sigma[u]
+    return nreached
+
+@numba.njit(parallel=True)
+def _chunk_sums(chunk, g, items, args, nrows):
+    # Run chunk(g, items[c::nchunks], args, out) once per thread, each with
+    # its own (nrows, nv) out since the writes are scattered over all
+    # vertices. Return the outs summed and the largest value chunk returned.
+    nchunks = max(1, min(numba.get_num_threads(), len(items)))
+    partial = np.zeros((nchunks, nrows, g.nv), dtype=np.float64)
+    rets = np.zeros(nchunks, dtype=np.float64)
+    for c in numba.prange(nchunks):
+        rets[c] = chunk(g, items[c::nchunks], args, partial[c])
+    return partial.sum(axis=0), rets.max()
+
+@numba.njit
+def _brandes_chunk(g, sources, weights, eoff, bc):
+    # Accumulate into bc the dependencies of every source in sources,
+    # reusing one set of buffers that is reset only where it was touched.
+    nvg = g.nv
+    dist = np.full(nvg, np.inf)
+    sigma = np.zeros(nvg, dtype=np.float64)
+    delta = np.zeros(nvg, dtype=np.float64)
+    order = np.empty(nvg, dtype=np.int64)
+    heap = np.empty(nvg, dtype=np.int64)
+    pos = np.full(nvg, -1, dtype=np.int64)
+    for s in sources:
+        nreached = _brandes_sssp(g, s, weights, eoff, dist, sigma, order, heap, pos)
+        # successors of w on shortest paths are settled after w, so a
+        # reverse sweep sees every delta[v] complete before it is used
+        for i in range(nreached - 1, -1, -1):
+            w = order[i]
+            dw = dist[w]
+            acc = 0.0
+            k = eoff[w]
+            for v in g.outneighbors(w):
+                if weights is None:
+                    alt = dw + 1.0
+                else:
+                    alt = dw + weights[k]
+                k += 1
+                if dist[v] == alt:
+                    acc += (1.0 + delta[v]) / sigma[v]
+            delta[w] = sigma[w] * acc
+            if w != s:
+                bc[w] += delta[w]
+        for i in range(nreached):
+            w = order[i]
+            dist[w] = np.inf
+            sigma[w] = 0.0
+            delta[w] = 0.0
+            pos[w] = -1
+
+@numba.njit
+def _brandes_rows(g, sources, args, out):
+    # _brandes_chunk in the _chunk_sums form; weights stays a direct
+    # argument there, so its None branches are still pruned
+    _brandes_chunk(g, sources, args[0], args[1], out[0])
+    return 0.0
+
+@numba.njit
+def _betweenness(g, sources, weights, parallel):
+    eoff = nnx_common.edge_offsets(g)
+    _check_positive_weights(g, weights, eoff)
+    if parallel:
+        out, _ = _chunk_sums(_brandes_rows, g, sources, (weights, eoff), 1)
+        return out[0]
+    bc = np.zeros(g.nv, dtype=np.float64)
+    _brandes_chunk(g, sources, weights, eoff, bc)
+    return bc
+
+@numba.njit
+def betweenness_centrality(g, k=None, weights=None, parallel=True, normalized=True, seed=None):
+    """
+    betweenness_centrality(g, k=None, weights=None, parallel=True, normalized=True, seed=None)
+    Compute the betweenness centrality of every vertex of `g` with
+    Brandes' algorithm, using Dijkstra over positive `weights` (one per
+    edge in adjacency order, by default the graph's own) and BFS otherwise.
+    With `k`, only `k` random sources seeded by `seed` are used and the
+    result is scaled by nv / k. Normalization follows networkx.
+    """
+    nvg = g.nv
+    if k is None:
+        sources = np.arange(nvg)
+        scale_k = 1.0
+    else:
+        if k < 1 or k > nvg:
+            raise Exception('k must be between 1 and the number of vertices')
+        if seed is not None:
+            np.random.seed(seed)
+        sources = np.random.permutation(nvg)[:k]
+        scale_k = nvg / k
+    if nvg == 0:
+        return np.zeros(0, dtype=np.float64)
+
+    if weights is None:
+        bc = _betweenness(g, sources, nnx_common.graph_weights(g), parallel)
+    else:
+        bc = _betweenness(g, sources, weights, parallel)
+
+    if normalized:
+        if nvg <= 2:
+            return bc
+        scale = 1.0 / ((nvg - 1) * (nvg - 2))
+    elif g.is_directed():
+        scale = 1.0
+    else:
+        scale = 0.5
+    return bc * (scale * scale_k)
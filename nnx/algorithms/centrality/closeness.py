@@ -0,0 +1,158 @@
+import numba
+import numpy as np
+
+from nnx.algorithms.centrality.betweenness import _chunk_sums
+
+@numba.njit
+def _bfs_distances(g, s, reverse, dist, queue):
+    # hop distances from s (to s when reverse) into an all -1 dist; the n
+    # reached vertices are queue[:n], so callers reset only those
+    dist[s] = 0
+    queue[0] = s
+    head = 0
+    tail = 1
+    while head < tail:
+        u = queue[head]
+        head += 1
+        if reverse:
+            adj = g.inneighbors(u)
+        else:
+            adj = g.outneighbors(u)
+        for v in adj:
+            if dist[v] < 0:
+                dist[v] = dist[u] + 1
+                queue[tail] = v
+                tail += 1
+    return tail
+
+@numba.njit
+def _distance_sums_chunk(g, targets, sums, reach, harm):
+    # per target u: total distance to u, vertices reaching u (u included)
+    # and the sum of inverse distances, from one reverse BFS each
+    nvg = g.nv
+    dist = np.full(nvg, -1, dtype=np.int64)
+    queue = np.empty(nvg, dtype=np.int64)
+    for u in targets:
+        n = _bfs_distances(g, u, True, dist, queue)
+        total = 0
+        h = 0.0
+        for i in range(1, n):
+            d = dist[queue[i]]
+            total += d
+            h += 1.0 / d
+        for i in range(n):
+            dist[queue[i]] = -1
+        sums[u] = total
+        reach[u] = n
+        harm[u] = h
+
+@numba.njit(parallel=True)
+def _distance_sums_parallel(g, targets, sums, reach, harm):
+    # every chunk owns its buffers and writes disjoint entries of the output
+    nchunks = min(numba.get_num_threads(), len(targets))
+    for c in numba.prange(nchunks):
+        _distance_sums_chunk(g, targets[c::nchunks], sums, reach, harm)
+
+@numba.njit
+def _distance_sums(g, parallel):
+    nvg = g.nv
+    targets = np.arange(nvg)
+    sums = np.zeros(nvg, dtype=np.int64)
+    reach = np.zeros(nvg, dtype=np.int64)
+    harm = np.zeros(nvg, dtype=np.float64)
+    if parallel:
+        _distance_sums_parallel(g, targets, sums, reach, harm)
+    else:
+        _distance_sums_chunk(g, targets, sums, reach, harm)
+    return sums, reach, harm
+
+@numba.njit
+def _sample_pivots(nvg, k, seed):
+    if k < 1 or k > nvg:
+        raise Exception('k must be between 1 and the number of vertices')
+    if seed is not None:
+        np.random.seed(seed)
+    return np.random.permutation(nvg)[:k]
+
+@numba.njit
+def _pivot_sums_chunk(g, pivots, args, out):
+    # accumulate d(p, v), one count and 1 / d(p, v) over the pivots p into
+    # out[0], out[1] and out[2] at every reached vertex v, and return the
+    # largest pivot eccentricity seen
+    nvg = g.nv
+    dist = np.full(nvg, -1, dtype=np.int64)
+    queue = np.empty(nvg, dtype=np.int64)
+    ecc = 0
+    for p in pivots:
+        n = _bfs_distances(g, p, False, dist, queue)
+        for i in range(1, n):
+            v = queue[i]
+            d = dist[v]
+            out[0, v] += d
+            out[1, v] += 1
+            out[2, v] += 1.0 / d
+        ecc = max(ecc, dist[queue[n - 1]])
+        for i in range(n):
+            dist[queue[i]] = -1
+    return ecc
+
+@numba.njit
+def _pivot_sums(g, pivots, parallel):
+    if parallel:
+        out, ecc = _chunk_sums(_pivot_sums_chunk, g, pivots, (), 3)
+    else:
+        out = np.zeros((3, g.nv), dtype=np.float64)
+        ecc = _pivot_sums_chunk(g, pivots, (), out)
+    return out[0], out[1], out[2], ecc
+
+@numba.njit
+def _hoeffding_eps(nvg, k, delta):
+    # half-width of a mean of k samples in [0, 1], holding for all nvg
+    # vertices at once with probability at least 1 - delta
+    return np.sqrt(np.log(2.0 * nvg / delta) / (2.0 * k))
+
+@numba.njit
+def closeness_centrality(g, wf_improved=True, parallel=True):
+    """
+    closeness_centrality(g, wf_improved=True, parallel=True)
+    Return the closeness centrality (r - 1) / S of every vertex u of `g`,
+    where S is the sum of the hop distances from the r vertices that reach
+    u (u included). With `wf_improved` the value is further scaled by
+    (r - 1) / (nv - 1), as in networkx. One reverse BFS is run per vertex;
+    with `parallel=True` vertices are split in one chunk per thread, each
+    allocating its distance buffer once.
+    """
+    nvg = g.nv
+    sums, reach, _ = _distance_sums(g, parallel)
+    c = np.zeros(nvg, dtype=np.float64)
+    for u in range(nvg):
+        if sums[u] > 0:
+            c[u] = (reach[u] - 1) / sums[u]
+            if wf_improved:
+                c[u] *= (reach[u] - 1) / (nvg - 1)
+    return c
+
+@numba.njit
+def approximate_closeness_centrality(g, k, seed=None, delta=0.05, wf_improved=True, parallel=True):
+    """
+    approximate_closeness_centrality(g, k, seed=None, delta=0.05, wf_improved=True, parallel=True)
+    Estimate `closeness_centrality` from BFS runs out of `k` random pivots
+    (Eppstein-Wang sampling), seeded with `seed`. Return `(c, eps)`. On a
+    connected undirected graph, with probability at least 1 - delta, every
+    estimated average distance 1 / c[u] is within `eps` of the exact one.
+    """
+    nvg = g.nv
+    pivots = _sample_pivots(nvg, k, seed)
+    c = np.zeros(nvg, dtype=np.float64)
+    if nvg < 2:
+        return c, 0.0
+    sums, cnt, _, ecc = _pivot_sums(g, pivots, parallel)
+    scale = nvg / k
+    for u in range(nvg):
+        if sums[u] > 0:
+            c[u] = cnt[u] / sums[u]
+            if wf_improved:
+                c[u] *= cnt[u] * scale / (nvg - 1)
+    # distances lie in [0, 2 * ecc(p)] for any pivot p
+    eps = 2.0 * ecc * nvg / (nvg - 1) * _hoeffding_eps(nvg, k, delta)
+    return c, eps
@@ -0,0 +1,28 @@
+import numba
+import numpy as np
+
+from nnx.algorithms.centrality.closeness import _distance_sums, _sample_pivots, _pivot_sums, _hoeffding_eps
+
+@numba.njit
+def harmonic_centrality(g, parallel=True):
+    """
+    harmonic_centrality(g, parallel=True)
+    Return the harmonic centrality of every vertex u of `g`, the sum of
+    1 / d(v, u) over the vertices v != u that reach u, with d the hop
+    distance. Runs like `closeness_centrality`.
+    """
+    _, _, harm = _distance_sums(g, parallel)
+    return harm
+
+@numba.njit
+def approximate_harmonic_centrality(g, k, seed=None, delta=0.05, parallel=True):
+    """
+    approximate_harmonic_centrality(g, k, seed=None, delta=0.05, parallel=True)
+    Estimate `harmonic_centrality` from BFS runs out of `k` random pivots,
+    seeded with `seed`. Return `(h, eps)`. With probability at least
+    1 - delta every h[u] is within `eps` of the exact value.
+    """
+    nvg = g.nv
+    pivots = _sample_pivots(nvg, k, seed)
+    _, _, harm, _ = _pivot_sums(g, pivots, parallel)
+    return harm * (nvg / k), nvg * _hoeffding_eps(nvg, k, delta)
@@ -0,0 +1,145 @@
+import numba
+import numpy as np
+
+@numba.njit
+def _oriented_csr(g):
+    # loop-free degrees and the sorted CSR keeping each edge once, oriented
+    # up the (degree, id) order so no row exceeds O(sqrt(E))
+    nvg = g.nv
+    deg = np.zeros(nvg, dtype=np.int64)
+    for u in range(nvg):
+        for v in g.neighbors(u):
+            if v != u:
+                deg[u] += 1
+    order = np.argsort(deg, kind='mergesort')
+    rank = np.empty(nvg, dtype=np.int64)
+    rank[order] = np.arange(nvg)
+    offsets = np.zeros(nvg + 1, dtype=np.int64)
+    for u in range(nvg):
+        c = 0
+        for v in g.neighbors(u):
+            if rank[v] > rank[u]:
+                c += 1
+        offsets[u + 1] = offsets[u] + c
+    indices = np.empty(offsets[nvg], dtype=np.int64)
+    for u in range(nvg):
+        k = offsets[u]
+        for v in g.neighbors(u):
+            if rank[v] > rank[u]:
+                indices[k] = v
+                k += 1
+        indices[offsets[u]:k] = np.sort(indices[offsets[u]:k])
+    return deg, offsets, indices
+
+@numba.njit
+def _triangles_row(offsets, indices, u, c):
+    # every triangle is found once, from its lowest ranked vertex u, by
+    # merging the sorted out-rows of u and of each out-neighbor v; the hit
+    # is counted on the row-u edges (u, v) and (u, w), so only u's slots of
+    # c are written. Return the triangles found from u.
+    a0 = offsets[u]
+    a = indices[a0:offsets[u + 1]]
+    found = 0
+    for p in range(len(a)):
+        b = indices[offsets[a[p]]:offsets[a[p] + 1]]
+        i = 0
+        j = 0
+        while i < len(a) and j < len(b):
+            if a[i] == b[j]:
+                c[a0 + p] += 1
+                c[a0 + i] += 1
+                found += 1
+                i += 1
+                j += 1
+            elif a[i] < b[j]:
+                i += 1
+            else:
+                j += 1
+    return found
+
+@numba.njit
+def _credit_edges(indices, c, t):
+    # the triangles counted on an oriented edge (u, v) all pass through v
+    for k in range(len(indices)):
+        t[indices[k]] += c[k]
+
+@numba.njit(parallel=True)
+def _triangles_parallel(offsets, indices, t, c):
+    # strided chunks balance the rows; each vertex owns t[u] and its row of c
+    nvg = len(offsets) - 1
+    nchunks = max(1, min(numba.get_num_threads(), nvg))
+    for i in numba.prange(nchunks):
+        # prange indices are unsigned; graph methods take int64
+        for u in range(np.int64(i), nvg, nchunks):
+            t[u] = _triangles_row(offsets, indices, u, c)
+
+@numba.njit
+def _triangles(g, parallel):
+    if g.is_directed():
+        raise Exception('Triangle counting is not defined for directed graphs')
+    deg, offsets, indices = _oriented_csr(g)
+    t = np.zeros(g.nv, dtype=np.int64)
+    c = np.zeros(len(indices), dtype=np.int64)
+    if parallel:
+        _triangles_parallel(offsets, indices, t, c)
+    else:
+        for u in range(g.nv):
+            t[u] = _triangles_row(offsets, indices, u, c)
+    _credit_edges(indices, c, t)
+    return deg, t
+
+@numba.njit
+def triangles(g, parallel=True):
+    """
+    triangles(g, parallel=True)
+    Return the number of triangles through every vertex of the undirected
+    graph `g`. Edges are oriented by degree order and the sorted oriented
+    neighbor arrays are merge-intersected; with `parallel=True` vertices
+    are split over threads. Self loops are ignored.
+    """
+    _, t = _triangles(g, parallel)
+    return t
+
+@numba.njit
+def clustering(g, parallel=True):
+    """
+    clustering(g, parallel=True)
+    Return the local clustering coefficient 2 T(u) / (d(u) (d(u) - 1)) of
+    every vertex u, with T(u) its triangles and d(u) its degree without
+    self loops. Vertices of degree below 2 get 0.
+    """
+    deg, t = _triangles(g, parallel)
+    c = np.zeros(g.nv, dtype=np.float64)
+    for u in range(g.nv):
+        if deg[u] > 1:
+            c[u] = 2.0 * t[u] / (deg[u] * (deg[u] - 1))
+    return c
+
+@numba.njit
+def average_clustering(g, count_zeros=True, parallel=True):
+    """
+    average_clustering(g, count_zeros=True, parallel=True)
+    Return the mean of `clustering(g)`, leaving out the vertices with a zero
+    coefficient when `count_zeros` is False.
+    """
+    c = clustering(g, parallel)
+    if not count_zeros:
+        c = c[c > 0]
+    if len(c) == 0:
+        return 0.0
+    return c.mean()
+
+@numba.njit
+def transitivity(g, parallel=True):
+    """
+    transitivity(g, parallel=True)
+    Return 3 * (number of triangles) / (number of connected triples) of
+    the undirected graph `g`.
+    """
+    deg, t = _triangles(g, parallel)
+    triads = 0
+    for u in range(g.nv):
+        triads += deg[u] * (deg[u] - 1)
+    if triads == 0:
+        return 0.0
+    return 2.0 * t.sum() / triads
@@ -2,9 +2,14 @@ import numba
 import nnx
 import numpy as np
 
+import nnx.classes.common as nnx_common
+
 @numba.njit
 def _connected_components(g):
+    # directed graphs are searched along both edge directions, giving their
+    # weakly connected components as in connected_component_labels
     nvg = g.nv
+    directed = g.is_directed()
     label = np.full(nvg, -1)
     
     for u in g.vertices:
@@ -14,10 +19,15 @@ def _connected_components(g):
         Q = [u]
         while len(Q) > 0:
             src = Q.pop()
-            for vertex in g.neighbors(src):
+            for vertex in g.outneighbors(src):
                 if label[vertex] == -1:
                     Q.append(vertex)
-                label[vertex] = u
+                    label[vertex] = u
+            if directed:
+                for vertex in g.inneighbors(src):
+                    if label[vertex] == -1:
+                        Q.append(vertex)
+                        label[vertex] = u
     return label
 
 @numba.njit
@@ -43,4 +53,121 @@ def _components(labels):
 def connected_components(g):
     label = _connected_components(g)
     c, d = _components(label)
-    return c
\ No newline at end of file
+    return c
+
+############## union-find and label propagation engines #################
+
+@numba.njit
+def _find(parent, v):
+    # path halving: every visited vertex is pointed at its grandparent
+    while parent[v] != v:
+        parent[v] = parent[parent[v]]
+        v = parent[v]
+    return v
+
+@numba.njit
+def _union(parent, u, v):
+    # link the larger root below the smaller one, so roots are minimal ids
+    ru = _find(parent, u)
+    rv = _find(parent, v)
+    if ru == rv:
+        return False
+    if ru < rv:
+        parent[rv] = ru
+    else:
+        parent[ru] = rv
+    return True
+
+@numba.njit
+def _compact_labels(parent):
+    # relabel the roots as 0..k-1 in order of their smallest vertex
+    n = len(parent)
+    labels = np.empty(n, dtype=np.int32)
+    root_label = np.full(n, -1, dtype=np.int64)
+    k = 0
+    for v in range(n):
+        r = _find(parent, v)
+        if root_label[r] == -1:
+            root_label[r] = k
+            k += 1
+        labels[v] = root_label[r]
+    sizes = np.zeros(k, dtype=np.int64)
+    for v in range(n):
+        sizes[labels[v]] += 1
+    return labels, sizes
+
+@numba.njit
+def _union_find_components(g):
+    # weakly connected components for directed graphs
+    nvg = g.nv
+    directed = g.is_directed()
+    parent = np.arange(nvg)
+    for u in range(nvg):
+        for v in g.outneighbors(u):
+            if directed or v > u:
+                _union(parent, u, v)
+    return parent
+
+@numba.njit(parallel=True)
+def _label_propagation_components(g):
+    # min-label propagation with pointer jumping; concurrent writes only
+    # ever lower a label, so races delay but never break convergence
+    nvg = g.nv
+    directed = g.is_directed()
+    comp = np.arange(nvg)
+    changed = 1
+    while changed > 0:
+        changed = 0
+        for i in numba.prange(nvg):
+            v = np.int64(i) # prange indices are unsigned; graph methods take int64
+            m = comp[v]
+            for u in g.outneighbors(v):
+                if comp[u] < m:
+                    m = comp[u]
+            if directed:
+                for u in g.inneighbors(v):
+                    if comp[u] < m:
+                        m = comp[u]
+            if m < comp[v]:
+                comp[v] = m
+                changed += 1
+        for v in numba.prange(nvg):
+            while comp[comp[v]] != comp[v]:
+                comp[v] = comp[comp[v]]
+    return comp
+
+@numba.njit
+def connected_component_labels(g, parallel=False):
+    """
+    connected_component_labels(g, parallel=False)
+    Compact form of `connected_components`: return `(labels, sizes)` where
+    `labels` is an int32 array giving the component id of every vertex (ids
+    are numbered by smallest member vertex) and `sizes[c]` the number of
+    vertices in component c. The sequential engine is union-find with path
+    compression; `parallel=True` uses label propagation over all threads.
+    Directed graphs get their weakly connected components.
+    """
+    if parallel:
+        parent = _label_propagation_components(g)
+    else:
+        parent = _union_find_components(g)
+    return _compact_labels(parent)
+
+@numba.njit
+def edge_array_component_labels(src, dst, n=None):
+    """
+    edge_array_component_labels(src, dst, n=None)
+    `connected_component_labels` computed by union-find directly over the
+    parallel endpoint arrays `src` and `dst`, without building a graph.
+    `n` defaults to one more than the largest endpoint.
+    """
+    if len(src) != len(dst):
+        raise Exception("src and dst must have the same length")
+    if n is None:
+        nvg = nnx_common.edge_array_nv(src, dst)
+    else:
+        nvg = n
+    parent = np.arange(nvg)
+    for i in range(len(src)):
+        _union(parent, src[i], dst[i])
+    return _compact_labels(parent)
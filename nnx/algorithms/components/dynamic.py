@@ -0,0 +1,135 @@
+import numba
+from numba.types import int64, boolean
+from numba.experimental import jitclass
+import numpy as np
+
+from nnx.algorithms.components.connected import _find, _union, _union_find_components
+
+# one jitclass per wrapped graph type, created on first use
+_dynamic_connectivity_classes = {}
+
+def _dynamic_connectivity_class(graph_type):
+    if graph_type in _dynamic_connectivity_classes:
+        return _dynamic_connectivity_classes[graph_type]
+
+    spec = {
+        'graph': graph_type,
+        'parent': int64[:],
+        'nv': int64,
+        'ncomponents': int64,
+        'dirty': boolean
+    }
+    @jitclass(spec)
+    class _DynamicConnectivity(object):
+        # union-find following inserts; removals rebuild it on the next query
+        def __init__(self, graph):
+            self.graph = graph
+            self.parent = np.empty(0, dtype=np.int64)
+            self.nv = 0
+            self.ncomponents = 0
+            self.dirty = True
+            self._rebuild()
+
+        def _rebuild(self):
+            self.parent = _union_find_components(self.graph)
+            self.nv = self.graph.nv
+            self.ncomponents = 0
+            for v in range(self.nv):
+                if self.parent[v] == v:
+                    self.ncomponents += 1
+            self.dirty = False
+
+        def _sync_vertices(self):
+            # new vertices start as singleton components; grow by doubling
+            nvg = self.graph.nv
+            if nvg <= self.nv:
+                return
+            if nvg > len(self.parent):
+                parent = np.arange(max(nvg, 2 * len(self.parent)))
+                parent[:self.nv] = self.parent[:self.nv]
+                self.parent = parent
+            else:
+                for v in range(self.nv, nvg):
+                    self.parent[v] = v
+            self.ncomponents += nvg - self.nv
+            self.nv = nvg
+
+        def _refresh(self):
+            if self.dirty or self.graph.nv < self.nv:
+                self._rebuild()
+            else:
+                self._sync_vertices()
+
+        def mark_dirty(self):
+            # call after mutating the wrapped graph directly
+            self.dirty = True
+
+        def add_vertex(self):
+            self.graph.add_vertex()
+            if not self.dirty:
+                self._sync_vertices()
+
+        def add_vertices(self, n):
+            self.graph.add_vertices(n)
+            if not self.dirty:
+                self._sync_vertices()
+
+        def add_edge(self, s, d, add_nodes=False):
+            added = self.graph.add_edge(s, d, add_nodes)
+            if added and not self.dirty:
+                self._sync_vertices()
+                if _union(self.parent, s, d):
+                    self.ncomponents -= 1
+            return added
+
+        def add_edges_from(self, edge_iter, add_nodes=False):
+            for e in edge_iter:
+                self.add_edge(e[0], e[1], add_nodes)
+
+        def rem_edge(self, s, d):
+            removed = self.graph.rem_edge(s, d)
+            if removed:
+                self.dirty = True
+            return removed
+
+        def rem_vertex(self, v):
+            removed = self.graph.rem_vertex(v)
+            if removed:
+                self.dirty = True
+            return removed
+
+        def same_component(self, u, v):
+            self._refresh()
+            if max(u, v) >= self.nv:
+                return False # parent has spare capacity beyond nv
+            return _find(self.parent, u) == _find(self.parent, v)
+
+        def component_of(self, v):
+            # components are identified by their smallest vertex
+            self._refresh()
+            if v >= self.nv:
+                raise Exception('Vertex is not in the graph')
+            return _find(self.parent, v)
+
+        def number_of_components(self):
+            self._refresh()
+            return self.ncomponents
+
+    _dynamic_connectivity_classes[graph_type] = _DynamicConnectivity
+    return _DynamicConnectivity
+
+@numba.generated_jit(nopython=True)
+def DynamicConnectivity(g):
+    """
+    DynamicConnectivity(g)
+    Wrap the nnx graph `g` in an object that answers `same_component(u, v)`,
+    `component_of(v)` and `number_of_components()` in near-constant time
+    while edges are inserted through its `add_edge`/`add_edges_from`
+    methods. `rem_edge`/`rem_vertex` mark the components dirty and they are
+    recomputed lazily on the next query. The wrapped graph is available as
+    the `graph` attribute.
+    """
+    cls = _dynamic_connectivity_class(g)
+    def impl(g):
+        return cls(g)
+    return impl
@@ -0,0 +1,89 @@
+import numba
+import numpy as np
+
+import nnx.classes.function as nnx_function
+from nnx.operators import induced_subgraph
+
+@numba.njit
+def _peel_neighbor(u, v, deg, pos, vert, bins):
+    # u loses its edge to the vertex v being peeled: swap u to the front of
+    # its degree bin, then shrink the bin so u falls into the one below
+    if deg[u] > deg[v]:
+        du = deg[u]
+        pu = pos[u]
+        pw = bins[du]
+        w = vert[pw]
+        if u != w:
+            pos[u] = pw
+            vert[pu] = w
+            pos[w] = pu
+            vert[pw] = u
+        bins[du] += 1
+        deg[u] -= 1
+
+@numba.njit
+def core_number(g):
+    """
+    core_number(g)
+    Return the core number of every vertex of `g`: the largest k such that
+    the vertex belongs to a subgraph whose vertices all have degree at
+    least k. Uses the O(V + E) bin-sort peeling of Batagelj and Zaversnik.
+    Directed graphs use the total degree (in plus out). Graphs with self
+    loops are not supported.
+    """
+    if g.has_self_loops():
+        raise Exception('core_number is not implemented for graphs with self loops')
+    nvg = g.nv
+    deg = nnx_function.degrees(g)
+    md = 0
+    if nvg > 0:
+        md = deg.max()
+
+    # bins[d] starts as the first position of degree d in vert
+    bins = np.zeros(md + 1, dtype=np.int64)
+    for v in range(nvg):
+        bins[deg[v]] += 1
+    start = 0
+    for d in range(md + 1):
+        num = bins[d]
+        bins[d] = start
+        start += num
+    pos = np.empty(nvg, dtype=np.int64)
+    vert = np.empty(nvg, dtype=np.int64)
+    for v in range(nvg):
+        pos[v] = bins[deg[v]]
+        vert[pos[v]] = v
+        bins[deg[v]] += 1
+    for d in range(md, 0, -1):
+        bins[d] = bins[d - 1]
+    bins[0] = 0
+
+    for i in range(nvg):
+        v = vert[i]
+        for u in g.outneighbors(v):
+            _peel_neighbor(u, v, deg, pos, vert, bins)
+        if g.is_directed():
+            for u in g.inneighbors(v):
+                _peel_neighbor(u, v, deg, pos, vert, bins)
+    return deg
+
+@numba.njit
+def k_core(g, k=None, core=None):
+    """
+    k_core(g, k=None, core=None)
+    Return `(h, vmap)`, the subgraph of `g` induced by the vertices with
+    core number at least `k` and its vertex map, as from
+    `induced_subgraph`. `k` defaults to the largest core number; `core`
+    may hold precomputed core numbers.
+    """
+    if core is None:
+        cn = core_number(g)
+    else:
+        cn = core
+    if k is None:
+        kk = 0
+        if len(cn) > 0:
+            kk = cn.max()
+    else:
+        kk = k
+    return induced_subgraph(g, np.nonzero(cn >= kk)[0])
@@ -1,16 +1,66 @@
 import numba
 import numpy as np
 
+import nnx.classes.common as nnx_common
+
+@numba.njit(parallel=True)
+def _pagerank_parallel(g, alpha, n, e):
+    nvv = g.nv
+    a_div_outdegree = np.zeros(nvv, dtype=np.float64)
+    dangling = np.zeros(nvv, dtype=np.bool_)
+    for i in numba.prange(nvv):
+        v = np.int64(i) # prange indices are unsigned; graph methods take int64
+        if g.outdegree(v) == 0:
+            dangling[v] = True
+        else:
+            a_div_outdegree[v] = alpha / g.outdegree(v)
+    x = np.full(nvv, 1.0/nvv)
+    xlast = np.empty(nvv, dtype=np.float64)
+    for _ in range(0, n):
+        dangling_sum = 0.0
+        for v in numba.prange(nvv):
+            if dangling[v]:
+                dangling_sum += x[v]
+        base = (1 - alpha + alpha * dangling_sum) * (1.0 / nvv)
+        err = 0.0
+        for i in numba.prange(nvv):
+            v = np.int64(i)
+            acc = base
+            for u in g.inneighbors(v):
+                acc += x[u] * a_div_outdegree[u]
+            xlast[v] = acc
+            err += abs(acc - x[v])
+        x, xlast = xlast, x
+        if err < (nvv * e):
+            return x
+    raise Exception("Pagerank did not converge after n iterations.")
+
 @numba.njit
-def pagerank(g, alpha=0.85, n=100, e=1.0e-6):
+def pagerank(g, alpha=0.85, n=100, e=1.0e-6, parallel=False):
     """
-    pagerank(g, alpha=0.85, n=100, e=1.0e-6)
+    pagerank(g, alpha=0.85, n=100, e=1.0e-6, parallel=False)
     Calculate the [PageRank](https://en.wikipedia.org/wiki/PageRank) of the
     graph `g` parameterized by damping factor `alpha`, number of iterations 
     `n`, and convergence threshold `e`. Return a vector representing the
     centrality calculated for each node in `g`, or an error if convergence
-    is not reached within `n` iterations.
+    is not reached within `n` iterations. With `parallel=True` the pull
+    update and the error reduction are spread over all threads. Weighted
+    graphs follow their edge weights through `pagerank_spmv`, or through
+    `personalized_pagerank_batch` when `parallel=True`.
     """
+    weights = nnx_common.graph_weights(g)
+    if weights is not None:
+        if parallel:
+            # one uniform personalization column is plain PageRank
+            X, _, converged = personalized_pagerank_batch(g, np.ones((g.nv, 1)), alpha, n, e, weights)
+            x = X[:, 0].copy()
+        else:
+            x, _, converged = pagerank_spmv(g, alpha, n, e, None, None, weights)
+        if not converged:
+            raise Exception("Pagerank did not converge after n iterations.")
+        return x
+    if parallel:
+        return _pagerank_parallel(g, alpha, n, e)
     nvv = g.nv
     a_div_outdegree = np.empty(nvv, dtype=np.float64)
     dangling_nodes = []
@@ -37,4 +87,157 @@ def pagerank(g, alpha=0.85, n=100, e=1.0e-6):
             x[v] = xlast[v]
         if err < (nvv * e):
             return x
-    raise Exception("Pagerank did not converge after n iterations.")
\ No newline at end of file
+    raise Exception("Pagerank did not converge after n iterations.")
+
+@numba.njit
+def _pagerank_transition(g, weights=None):
+    # pull-form CSR of the transition matrix: in-edges of v are
+    # srcs[offsets[v]:offsets[v + 1]] with probabilities in vals
+    nvv = g.nv
+    outw = np.zeros(nvv, dtype=np.float64)
+    offsets = np.zeros(nvv + 1, dtype=np.int64)
+    k = 0
+    for u in range(nvv):
+        for v in g.outneighbors(u):
+            offsets[v + 1] += 1
+            if weights is None:
+                outw[u] += 1.0
+            else:
+                outw[u] += weights[k]
+            k += 1
+    if weights is not None:
+        if len(weights) != k:
+            raise Exception("weights must hold one entry per edge in adjacency order")
+    offsets = np.cumsum(offsets)
+    srcs = np.empty(k, dtype=np.int64)
+    vals = np.empty(k, dtype=np.float64)
+    pos = offsets[:-1].copy()
+    k = 0
+    for u in range(nvv):
+        for v in g.outneighbors(u):
+            if weights is None:
+                w = 1.0
+            else:
+                w = weights[k]
+            srcs[pos[v]] = u
+            if outw[u] > 0.0:
+                vals[pos[v]] = w / outw[u]
+            else:
+                vals[pos[v]] = 0.0 # zero out-weight: u is dangling
+            pos[v] += 1
+            k += 1
+    dangling = np.nonzero(outw == 0.0)[0]
+    return offsets, srcs, vals, dangling
+
+@numba.njit
+def _normalized_vector(x, nvv):
+    if len(x) != nvv:
+        raise Exception("Vector length must match the number of vertices")
+    total = x.sum()
+    if total <= 0.0:
+        raise Exception("Vector must have a positive sum")
+    return x.astype(np.float64) / total
+
+@numba.njit
+def pagerank_spmv(g, alpha=0.85, n=100, e=1.0e-6, x0=None, personalization=None, weights=None):
+    """
+    pagerank_spmv(g, alpha=0.85, n=100, e=1.0e-6, x0=None, personalization=None, weights=None)
+    Calculate the PageRank of `g` like `pagerank` as one sparse
+    matrix-vector product per iteration, warm-started from `x0`, teleporting
+    to `personalization` and following `weights` (one per edge in the order
+    `for u in g.vertices: for v in g.outneighbors(u)`, by default the
+    graph's own). Return `(x, residuals, converged)` instead of raising on
+    non-convergence.
+    """
+    nvv = g.nv
+    if weights is None:
+        offsets, srcs, vals, dangling = _pagerank_transition(g, nnx_common.graph_weights(g))
+    else:
+        offsets, srcs, vals, dangling = _pagerank_transition(g, weights)
+    if personalization is None:
+        p = np.full(nvv, 1.0/nvv)
+    else:
+        p = _normalized_vector(personalization, nvv)
+    if x0 is None:
+        x = np.full(nvv, 1.0/nvv)
+    else:
+        x = _normalized_vector(x0, nvv)
+    xlast = np.empty(nvv, dtype=np.float64)
+    residuals = np.empty(n, dtype=np.float64)
+    for it in range(n):
+        dangling_sum = 0.0
+        for u in dangling:
+            dangling_sum += x[u]
+        teleport = 1 - alpha + alpha * dangling_sum
+        err = 0.0
+        for v in range(nvv):
+            acc = 0.0
+            for k in range(offsets[v], offsets[v + 1]):
+                acc += vals[k] * x[srcs[k]]
+            xv = alpha * acc + teleport * p[v]
+            err += abs(xv - x[v])
+            xlast[v] = xv
+        x, xlast = xlast, x
+        residuals[it] = err
+        if err < (nvv * e):
+            return x, residuals[:it + 1], True
+    return x, residuals, False
+
+
+@numba.njit(parallel=True)
+def personalized_pagerank_batch(g, seeds_matrix, alpha=0.85, n=100, e=1.0e-6, weights=None):
+    """
+    personalized_pagerank_batch(g, seeds_matrix, alpha=0.85, n=100, e=1.0e-6, weights=None)
+    Calculate one personalized PageRank per column of the (nv, k)
+    `seeds_matrix`, streaming the graph once per iteration for all columns.
+    Return `(X, residuals, converged)` as in `pagerank_spmv`, with one
+    column per personalization.
+    """
+    nvv = g.nv
+    if seeds_matrix.shape[0] != nvv:
+        raise Exception("seeds_matrix must have one row per vertex")
+    nk = seeds_matrix.shape[1]
+    if weights is None:
+        offsets, srcs, vals, dangling = _pagerank_transition(g, nnx_common.graph_weights(g))
+    else:
+        offsets, srcs, vals, dangling = _pagerank_transition(g, weights)
+
+    totals = np.zeros(nk, dtype=np.float64)
+    for v in range(nvv):
+        for j in range(nk):
+            totals[j] += seeds_matrix[v, j]
+    if np.any(totals <= 0.0):
+        raise Exception("Every personalization column must have a positive sum")
+    P = np.empty((nvv, nk), dtype=np.float64)
+    for v in numba.prange(nvv):
+        for j in range(nk):
+            P[v, j] = seeds_matrix[v, j] / totals[j]
+    X = P.copy()
+    Xlast = np.empty((nvv, nk), dtype=np.float64)
+    teleport = np.empty(nk, dtype=np.float64)
+    residuals = np.zeros((n, nk), dtype=np.float64)
+    for it in range(n):
+        for j in numba.prange(nk):
+            dangling_sum = 0.0
+            for u in dangling:
+                dangling_sum += X[u, j]
+            teleport[j] = 1 - alpha + alpha * dangling_sum
+        for v in numba.prange(nvv):
+            for j in range(nk):
+                Xlast[v, j] = teleport[j] * P[v, j]
+            for k in range(offsets[v], offsets[v + 1]):
+                u = srcs[k]
+                w = alpha * vals[k]
+                for j in range(nk):
+                    Xlast[v, j] += w * X[u, j]
+        maxerr = 0.0
+        for j in range(nk):
+            err = 0.0
+            for v in numba.prange(nvv):
+                err += abs(Xlast[v, j] - X[v, j])
+            residuals[it, j] = err
+            maxerr = max(maxerr, err)
+        X, Xlast = Xlast, X
+        if maxerr < (nvv * e):
+            return X, residuals[:it + 1], True
+    return X, residuals, False
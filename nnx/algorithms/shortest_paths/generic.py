@@ -0,0 +1,321 @@
+import numba
+from numba.types import int64, float64, boolean
+from numba.experimental import jitclass
+import numpy as np
+
+import nnx.classes.common as nnx_common
+from nnx.algorithms.shortest_paths.weighted import _heap_push_or_decrease, _heap_pop
+
+scratch_spec = {
+    'nv': int64,
+    'eoff': int64[:],
+    'distf': float64[:],
+    'distb': float64[:],
+    'predf': int64[:],
+    'predb': int64[:],
+    'heapf': int64[:],
+    'heapb': int64[:],
+    'posf': int64[:],
+    'posb': int64[:],
+    'touched': int64[:],
+    'ntouched': int64,
+    'roff': int64[:],
+    'rsrc': int64[:],
+    'ridx': int64[:],
+    'has_reverse': boolean
+}
+@jitclass(scratch_spec)
+class _ShortestPathScratch(object):
+    # per-graph query buffers; reset only where the last query touched them
+    def __init__(self, nv, eoff):
+        self.nv = nv
+        self.eoff = eoff
+        self.distf = np.full(nv, np.inf)
+        self.distb = np.full(nv, np.inf)
+        self.predf = np.full(nv, -1, dtype=np.int64)
+        self.predb = np.full(nv, -1, dtype=np.int64)
+        self.heapf = np.empty(nv, dtype=np.int64)
+        self.heapb = np.empty(nv, dtype=np.int64)
+        self.posf = np.full(nv, -1, dtype=np.int64)
+        self.posb = np.full(nv, -1, dtype=np.int64)
+        self.touched = np.empty(nv, dtype=np.int64)
+        self.ntouched = 0
+        # in-edge index for weighted backward searches on directed graphs,
+        # built by the first query that needs it
+        self.roff = np.zeros(1, dtype=np.int64)
+        self.rsrc = np.empty(0, dtype=np.int64)
+        self.ridx = np.empty(0, dtype=np.int64)
+        self.has_reverse = False
+
+    def touch(self, v):
+        if self.distf[v] == np.inf and self.distb[v] == np.inf:
+            self.touched[self.ntouched] = v
+            self.ntouched += 1
+
+    def reset(self):
+        for i in range(self.ntouched):
+            v = self.touched[i]
+            self.distf[v] = np.inf
+            self.distb[v] = np.inf
+            self.predf[v] = -1
+            self.predb[v] = -1
+            self.posf[v] = -1
+            self.posb[v] = -1
+        self.ntouched = 0
+
+@numba.njit
+def shortest_path_scratch(g):
+    """
+    shortest_path_scratch(g)
+    Allocate the reusable buffers used by `shortest_path` and
+    `shortest_path_length` for queries against the fixed graph `g`.
+    """
+    return _ShortestPathScratch(g.nv, nnx_common.edge_offsets(g))
+
+@numba.njit
+def _unidirectional_bfs(g, s, t, sc):
+    sc.touch(s)
+    sc.distf[s] = 0.0
+    if s == t:
+        return 0.0, s
+    q = sc.heapf
+    q[0] = s
+    head = 0
+    tail = 1
+    while head < tail:
+        u = q[head]
+        head += 1
+        for v in g.outneighbors(u):
+            if sc.distf[v] == np.inf:
+                sc.touch(v)
+                sc.distf[v] = sc.distf[u] + 1.0
+                sc.predf[v] = u
+                if v == t:
+                    return sc.distf[v], v
+                q[tail] = v
+                tail += 1
+    return np.inf, -1
+
+@numba.njit
+def _reverse_edges(g, eoff):
+    # the in-edges of u are rsrc[roff[u]:roff[u + 1]], the k-th one carrying
+    # the weight at position ridx[k] of the adjacency order
+    nvg = g.nv
+    roff = np.zeros(nvg + 1, dtype=np.int64)
+    for u in range(nvg):
+        for v in g.outneighbors(u):
+            roff[v + 1] += 1
+    roff = np.cumsum(roff)
+    pos = roff[:-1].copy()
+    rsrc = np.empty(eoff[nvg], dtype=np.int64)
+    ridx = np.empty(eoff[nvg], dtype=np.int64)
+    for u in range(nvg):
+        k = eoff[u]
+        for v in g.outneighbors(u):
+            rsrc[pos[v]] = u
+            ridx[pos[v]] = k
+            pos[v] += 1
+            k += 1
+    return roff, rsrc, ridx
+
+@numba.njit
+def _relax(sc, u, v, w, dist, pred, heap, pos, other, size, mu, meet):
+    alt = dist[u] + w
+    if alt < dist[v]:
+        sc.touch(v)
+        dist[v] = alt
+        pred[v] = u
+        size = _heap_push_or_decrease(heap, pos, dist, size, v)
+    if other[v] != np.inf and dist[v] + other[v] < mu:
+        mu = dist[v] + other[v]
+        meet = v
+    return size, mu, meet
+
+@numba.njit
+def _dijkstra_scan(g, u, forward, weights, sc, size, mu, meet):
+    # relax the edges leaving the settled vertex u, or entering it for the
+    # backward search of a directed graph, and track where the searches meet
+    if forward:
+        dist, pred, heap, pos, other = sc.distf, sc.predf, sc.heapf, sc.posf, sc.distb
+    else:
+        dist, pred, heap, pos, other = sc.distb, sc.predb, sc.heapb, sc.posb, sc.distf
+    if forward or not g.is_directed():
+        k = sc.eoff[u]
+        for v in g.outneighbors(u):
+            size, mu, meet = _relax(sc, u, v, weights[k], dist, pred, heap, pos, other, size, mu, meet)
+            k += 1
+    else:
+        for k in range(sc.roff[u], sc.roff[u + 1]):
+            v = sc.rsrc[k]
+            size, mu, meet = _relax(sc, u, v, weights[sc.ridx[k]], dist, pred, heap, pos, other, size, mu, meet)
+    return size, mu, meet
+
+@numba.njit
+def _unidirectional_dijkstra(g, s, t, weights, sc):
+    sc.touch(s)
+    sc.distf[s] = 0.0
+    size = _heap_push_or_decrease(sc.heapf, sc.posf, sc.distf, 0, s)
+    while size > 0:
+        u, size = _heap_pop(sc.heapf, sc.posf, sc.distf, size)
+        if u == t:
+            return sc.distf[u], u
+        size, _, _ = _dijkstra_scan(g, u, True, weights, sc, size, np.inf, -1)
+    return np.inf, -1
+
+@numba.njit
+def _bfs_expand_level(g, sc, forward, q, lo, hi, mu, meet):
+    # expand one full BFS level q[lo:hi] on one side, appending the next
+    # level after hi; return the new end of the queue and the best meeting
+    if forward:
+        dist, pred, other = sc.distf, sc.predf, sc.distb
+    else:
+        dist, pred, other = sc.distb, sc.predb, sc.distf
+    tail = hi
+    for i in range(lo, hi):
+        u = q[i]
+        if forward:
+            nbrs = g.outneighbors(u)
+        else:
+            nbrs = g.inneighbors(u)
+        for v in nbrs:
+            if dist[v] == np.inf:
+                sc.touch(v)
+                dist[v] = dist[u] + 1.0
+                pred[v] = u
+                q[tail] = v
+                tail += 1
+            if other[v] != np.inf and dist[u] + 1.0 + other[v] < mu:
+                mu = dist[u] + 1.0 + other[v]
+                meet = v
+    return tail, mu, meet
+
+@numba.njit
+def _bidirectional_bfs(g, s, t, sc):
+    sc.touch(s)
+    sc.distf[s] = 0.0
+    sc.touch(t)
+    sc.distb[t] = 0.0
+    if s == t:
+        return 0.0, s
+    qf = sc.heapf
+    qb = sc.heapb
+    qf[0] = s
+    qb[0] = t
+    lof, hif = 0, 1
+    lob, hib = 0, 1
+    mu = np.inf
+    meet = -1
+    while hif > lof and hib > lob:
+        # grow the side with the smaller frontier by one full level
+        if hif - lof <= hib - lob:
+            tail, mu, meet = _bfs_expand_level(g, sc, True, qf, lof, hif, mu, meet)
+            lof, hif = hif, tail
+        else:
+            tail, mu, meet = _bfs_expand_level(g, sc, False, qb, lob, hib, mu, meet)
+            lob, hib = hib, tail
+        if meet != -1:
+            break
+    return mu, meet
+
+@numba.njit
+def _bidirectional_dijkstra(g, s, t, weights, sc):
+    if g.is_directed() and not sc.has_reverse:
+        roff, rsrc, ridx = _reverse_edges(g, sc.eoff)
+        sc.roff = roff
+        sc.rsrc = rsrc
+        sc.ridx = ridx
+        sc.has_reverse = True
+    sc.touch(s)
+    sc.distf[s] = 0.0
+    sc.touch(t)
+    sc.distb[t] = 0.0
+    if s == t:
+        return 0.0, s
+    sizef = _heap_push_or_decrease(sc.heapf, sc.posf, sc.distf, 0, s)
+    sizeb = _heap_push_or_decrease(sc.heapb, sc.posb, sc.distb, 0, t)
+    mu = np.inf
+    meet = -1
+    while sizef > 0 and sizeb > 0:
+        if sc.distf[sc.heapf[0]] + sc.distb[sc.heapb[0]] >= mu:
+            break
+        if sizef <= sizeb:
+            u, sizef = _heap_pop(sc.heapf, sc.posf, sc.distf, sizef)
+            sizef, mu, meet = _dijkstra_scan(g, u, True, weights, sc, sizef, mu, meet)
+        else:
+            u, sizeb = _heap_pop(sc.heapb, sc.posb, sc.distb, sizeb)
+            sizeb, mu, meet = _dijkstra_scan(g, u, False, weights, sc, sizeb, mu, meet)
+    return mu, meet
+
+@numba.njit
+def _path_query(g, s, t, weights, bidirectional, sc):
+    if max(s, t) >= g.nv:
+        raise Exception('Source and target must be vertices of the graph')
+    if sc.nv != g.nv:
+        raise Exception('Scratch buffers were allocated for a different graph')
+    sc.reset()
+    if weights is None:
+        if bidirectional:
+            return _bidirectional_bfs(g, s, t, sc)
+        return _unidirectional_bfs(g, s, t, sc)
+    else:
+        if len(weights) != sc.eoff[g.nv]:
+            raise Exception('weights must hold one entry per edge in adjacency order')
+        if bidirectional:
+            return _bidirectional_dijkstra(g, s, t, weights, sc)
+        return _unidirectional_dijkstra(g, s, t, weights, sc)
+
+@numba.njit
+def _reconstruct_path(sc, s, t, meet):
+    if meet == -1:
+        return np.empty(0, dtype=np.int64)
+    nf = 1
+    v = meet
+    while v != s:
+        v = sc.predf[v]
+        nf += 1
+    nb = 0
+    v = meet
+    while v != t:
+        v = sc.predb[v]
+        nb += 1
+    path = np.empty(nf + nb, dtype=np.int64)
+    v = meet
+    for i in range(nf - 1, -1, -1):
+        path[i] = v
+        v = sc.predf[v]
+    v = meet
+    for i in range(nf, nf + nb):
+        v = sc.predb[v]
+        path[i] = v
+    return path
+
+@numba.njit
+def shortest_path_length(g, s, t, weights=None, bidirectional=False, scratch=None):
+    """
+    shortest_path_length(g, s, t, weights=None, bidirectional=False, scratch=None)
+    Distance from `s` to `t` in hops, or over non-negative `weights` in
+    adjacency order (both entries of an undirected edge must match), or inf
+    if `t` is unreachable. The search stops once `t` is settled, or once
+    the two searches meet when `bidirectional`. Pass
+    `scratch=shortest_path_scratch(g)` to reuse buffers across queries.
+    """
+    if scratch is None:
+        sc = shortest_path_scratch(g)
+    else:
+        sc = scratch
+    d, meet = _path_query(g, s, t, weights, bidirectional, sc)
+    return d
+
+@numba.njit
+def shortest_path(g, s, t, weights=None, bidirectional=False, scratch=None):
+    """
+    shortest_path(g, s, t, weights=None, bidirectional=False, scratch=None)
+    Vertices of a shortest path from `s` to `t` as an int64 array, empty if
+    `t` is unreachable. Arguments are the same as `shortest_path_length`.
+    """
+    if scratch is None:
+        sc = shortest_path_scratch(g)
+    else:
+        sc = scratch
+    d, meet = _path_query(g, s, t, weights, bidirectional, sc)
+    return _reconstruct_path(sc, s, t, meet)
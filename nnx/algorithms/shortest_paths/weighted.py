@@ -2,14 +2,48 @@ import numba
 import numpy as np
 import heapq
 
+import nnx.classes.common as nnx_common
+
 @numba.njit
 def standard_distance(s, d):
     return 1.0
 
+@numba.generated_jit(nopython=True)
+def _is_standard_distance(distf):
+    # distf is typed by its dispatcher, so this is decided at compile time
+    flag = getattr(distf, 'dispatcher', None) is standard_distance
+    return lambda distf: flag
+
+@numba.njit
+def _parent_preds(parents):
+    # the single-predecessor preds of dijkstra_shortest_paths
+    preds = numba.typed.List.empty_list(_pred_list_type)
+    for p in parents:
+        ps = numba.typed.List.empty_list(numba.types.int64)
+        if p != -1:
+            ps.append(p)
+        preds.append(ps)
+    return preds
+
 @numba.njit
 def dijkstra_shortest_paths(g, srcs, allpaths, distf):
+    """
+    dijkstra_shortest_paths(g, srcs, allpaths, distf)
+    Dijkstra where the length of edge (u, v) is `distf(u, v)`. On a
+    weighted graph with `distf=standard_distance` the stored weights are
+    followed instead, as in `dijkstra_shortest_paths_weighted`; any other
+    `distf` is rejected there.
+    """
     if not srcs:
         raise Exception('Please provide at least one source node')
+    weights = nnx_common.graph_weights(g)
+    if weights is not None:
+        if not _is_standard_distance(distf):
+            raise Exception('distf cannot be combined with stored edge weights')
+        parents, dists, preds = _dijkstra_heap(g, srcs, weights, allpaths)
+        if not allpaths:
+            preds = _parent_preds(parents)
+        return parents, dists, preds
     nvg = g.nv
     
     dists = np.ones(nvg) * np.infty
@@ -60,4 +94,253 @@ def dijkstra_shortest_paths(g, srcs, allpaths, distf):
         parents[src] = -1
         preds[src] = numba.typed.List.empty_list(0)
             
-    return parents, dists, preds
\ No newline at end of file
+    return parents, dists, preds
+
+############## indexed binary heap with decrease-key #################
+
+@numba.njit
+def _heap_sift_up(heap, pos, keys, i):
+    v = heap[i]
+    while i > 0:
+        parent = (i - 1) >> 1
+        p = heap[parent]
+        if keys[p] <= keys[v]:
+            break
+        heap[i] = p
+        pos[p] = i
+        i = parent
+    heap[i] = v
+    pos[v] = i
+
+@numba.njit
+def _heap_sift_down(heap, pos, keys, size, i):
+    v = heap[i]
+    while True:
+        child = 2 * i + 1
+        if child >= size:
+            break
+        if child + 1 < size and keys[heap[child + 1]] < keys[heap[child]]:
+            child += 1
+        c = heap[child]
+        if keys[v] <= keys[c]:
+            break
+        heap[i] = c
+        pos[c] = i
+        i = child
+    heap[i] = v
+    pos[v] = i
+
+@numba.njit
+def _heap_push_or_decrease(heap, pos, keys, size, v):
+    # keys[v] has already been lowered; pos[v] == -1 means v is not queued
+    if pos[v] == -1:
+        heap[size] = v
+        pos[v] = size
+        size += 1
+    _heap_sift_up(heap, pos, keys, pos[v])
+    return size
+
+@numba.njit
+def _heap_pop(heap, pos, keys, size):
+    v = heap[0]
+    size -= 1
+    pos[v] = -2 # settled
+    if size > 0:
+        heap[0] = heap[size]
+        pos[heap[0]] = 0
+        _heap_sift_down(heap, pos, keys, size, 0)
+    return v, size
+
+_pred_list_type = numba.types.ListType(numba.types.int64)
+
+@numba.njit
+def _empty_preds(nvg, allpaths):
+    preds = numba.typed.List.empty_list(_pred_list_type)
+    if allpaths:
+        for _ in range(nvg):
+            preds.append(numba.typed.List.empty_list(numba.types.int64))
+    return preds
+
+@numba.njit
+def _check_weights(g, weights, eoff):
+    # weights is None for unit weights; eoff is nnx_common.edge_offsets(g)
+    if weights is not None:
+        if len(weights) != eoff[g.nv]:
+            raise Exception('weights must hold one entry per edge in adjacency order')
+        if len(weights) > 0 and weights.min() < 0:
+            raise Exception('Dijkstra requires non-negative edge weights')
+
+@numba.njit
+def _check_integral_weights(weights):
+    if weights is not None:
+        for w in weights:
+            if w != np.floor(w):
+                raise Exception('Dial requires integer edge weights')
+
+@numba.njit
+def _max_weight(weights):
+    if weights is None:
+        return 1
+    if len(weights) == 0:
+        return 0
+    return np.int64(weights.max())
+
+@numba.njit
+def dijkstra_shortest_paths_weighted(g, srcs, weights=None, allpaths=False):
+    """
+    dijkstra_shortest_paths_weighted(g, srcs, weights=None, allpaths=False)
+    Dijkstra from `srcs` over an indexed binary heap, where `weights[k]` is
+    the weight of the k-th edge in the order `for u in g.vertices: for v in
+    g.outneighbors(u)` (by default the graph's own, or unit weights).
+    Return `(parents, dists, preds)`; `preds` lists every shortest-path
+    predecessor and is only filled when `allpaths` is True.
+    """
+    if weights is None:
+        return _dijkstra_heap(g, srcs, nnx_common.graph_weights(g), allpaths)
+    return _dijkstra_heap(g, srcs, weights, allpaths)
+
+@numba.njit
+def _dijkstra_heap(g, srcs, weights, allpaths):
+    if len(srcs) == 0:
+        raise Exception('Please provide at least one source node')
+    nvg = g.nv
+    eoff = nnx_common.edge_offsets(g)
+    _check_weights(g, weights, eoff)
+
+    dists = np.full(nvg, np.inf)
+    parents = np.full(nvg, -1, dtype=np.int64)
+    heap = np.empty(nvg, dtype=np.int64)
+    pos = np.full(nvg, -1, dtype=np.int64)
+    preds = _empty_preds(nvg, allpaths)
+    size = 0
+    for src in srcs:
+        if dists[src] == 0.0:
+            continue
+        dists[src] = 0.0
+        size = _heap_push_or_decrease(heap, pos, dists, size, src)
+
+    while size > 0:
+        u, size = _heap_pop(heap, pos, dists, size)
+        du = dists[u]
+        k = eoff[u]
+        for v in g.outneighbors(u):
+            if weights is None:
+                alt = du + 1.0
+            else:
+                alt = du + weights[k]
+            k += 1
+            if alt < dists[v]:
+                dists[v] = alt
+                parents[v] = u
+                if allpaths:
+                    preds[v].clear()
+                    preds[v].append(u)
+                size = _heap_push_or_decrease(heap, pos, dists, size, v)
+            elif allpaths and alt == dists[v] and pos[v] != -2:
+                preds[v].append(u)
+
+    for src in srcs:
+        parents[src] = -1
+        if allpaths:
+            preds[src].clear()
+    return parents, dists, preds
+
+@numba.njit
+def dial_shortest_paths(g, srcs, weights=None, allpaths=False):
+    """
+    dial_shortest_paths(g, srcs, weights=None, allpaths=False)
+    `dijkstra_shortest_paths_weighted` for small non-negative integer
+    weights, using Dial's circular bucket queue of `max(weights) + 1`
+    buckets. Return `(parents, dists, preds)` as there, with int64
+    distances and -1 marking unreachable vertices.
+    """
+    if weights is None:
+        return _dijkstra_dial(g, srcs, nnx_common.graph_weights(g), allpaths)
+    return _dijkstra_dial(g, srcs, weights, allpaths)
+
+@numba.njit
+def _dijkstra_dial(g, srcs, weights, allpaths):
+    if len(srcs) == 0:
+        raise Exception('Please provide at least one source node')
+    nvg = g.nv
+    eoff = nnx_common.edge_offsets(g)
+    _check_weights(g, weights, eoff)
+    _check_integral_weights(weights)
+    nb = _max_weight(weights) + 1
+
+    unreached = np.iinfo(np.int64).max
+    dists = np.full(nvg, unreached, dtype=np.int64)
+    parents = np.full(nvg, -1, dtype=np.int64)
+    settled = np.zeros(nvg, dtype=np.bool_)
+    head = np.full(nb, -1, dtype=np.int64)
+    nxt = np.full(nvg, -1, dtype=np.int64)
+    prv = np.full(nvg, -1, dtype=np.int64)
+    queued = np.zeros(nvg, dtype=np.bool_)
+    preds = _empty_preds(nvg, allpaths)
+    count = 0
+
+    for src in srcs:
+        if queued[src]:
+            continue
+        dists[src] = 0
+        queued[src] = True
+        nxt[src] = head[0]
+        if head[0] != -1:
+            prv[head[0]] = src
+        head[0] = src
+        count += 1
+
+    cur = 0
+    while count > 0:
+        b = cur % nb
+        while head[b] != -1:
+            u = head[b]
+            head[b] = nxt[u]
+            if nxt[u] != -1:
+                prv[nxt[u]] = -1
+            queued[u] = False
+            settled[u] = True
+            count -= 1
+            du = dists[u]
+            k = eoff[u]
+            for v in g.outneighbors(u):
+                if weights is None:
+                    alt = du + 1
+                else:
+                    alt = du + np.int64(weights[k])
+                k += 1
+                if alt < dists[v]:
+                    if queued[v]:
+                        # unlink v from its old bucket
+                        if prv[v] != -1:
+                            nxt[prv[v]] = nxt[v]
+                        else:
+                            head[dists[v] % nb] = nxt[v]
+                        if nxt[v] != -1:
+                            prv[nxt[v]] = prv[v]
+                    else:
+                        queued[v] = True
+                        count += 1
+                    dists[v] = alt
+                    parents[v] = u
+                    if allpaths:
+                        preds[v].clear()
+                        preds[v].append(u)
+                    nb_v = alt % nb
+                    prv[v] = -1
+                    nxt[v] = head[nb_v]
+                    if head[nb_v] != -1:
+                        prv[head[nb_v]] = v
+                    head[nb_v] = v
+                elif allpaths and alt == dists[v] and not settled[v]:
+                    preds[v].append(u)
+        cur += 1
+
+    for v in range(nvg):
+        if dists[v] == unreached:
+            dists[v] = -1
+    for src in srcs:
+        parents[src] = -1
+        if allpaths:
+            preds[src].clear()
+    return parents, dists, preds
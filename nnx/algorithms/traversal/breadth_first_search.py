@@ -30,4 +30,138 @@ def bfs_traversal(g, ss, neighborfn=_standard_neighborfn):
         cur_level, next_level = next_level, cur_level
         cur_level.sort()
     
-    return parents
\ No newline at end of file
+    return parents
+
+@numba.njit
+def bfs_direction_optimizing(g, ss, alpha=15, beta=18):
+    """
+    bfs_direction_optimizing(g, ss, alpha=15, beta=18)
+    Breadth-first search from the sources `ss` that switches to bottom-up
+    steps when the frontier's edges exceed `1/alpha` of the unexplored
+    edges, and back when it shrinks below `nv/beta` vertices (Beamer).
+    Return `(parents, dists)`; sources are their own parent and unreached
+    vertices have parent and distance -1.
+    """
+    n = g.nv
+    parents = np.full(n, -1, dtype=np.int64)
+    dists = np.full(n, -1, dtype=np.int64)
+    frontier = np.empty(n, dtype=np.int64)
+    next_frontier = np.empty(n, dtype=np.int64)
+    in_frontier = np.zeros(n, dtype=np.bool_)
+
+    mu = 0 # out-edges of unexplored vertices
+    for v in range(n):
+        mu += g.outdegree(v)
+    nf = 0
+    mf = 0 # out-edges of the frontier
+    for s in ss:
+        if parents[s] != -1:
+            continue
+        parents[s] = s
+        dists[s] = 0
+        frontier[nf] = s
+        nf += 1
+        mf += g.outdegree(s)
+    mu -= mf
+
+    level = 0
+    bottom_up = False
+    prev_nf = 0
+    while nf > 0:
+        if not bottom_up:
+            if mf > mu / alpha and nf > prev_nf:
+                bottom_up = True
+        elif nf < n / beta and nf < prev_nf:
+            bottom_up = False
+        level += 1
+        nnext = 0
+        mnext = 0
+        if bottom_up:
+            for i in range(nf):
+                in_frontier[frontier[i]] = True
+            for v in range(n):
+                if parents[v] != -1:
+                    continue
+                for u in g.inneighbors(v):
+                    if in_frontier[u]:
+                        parents[v] = u
+                        dists[v] = level
+                        next_frontier[nnext] = v
+                        nnext += 1
+                        mnext += g.outdegree(v)
+                        break
+            for i in range(nf):
+                in_frontier[frontier[i]] = False
+        else:
+            for i in range(nf):
+                u = frontier[i]
+                for v in g.outneighbors(u):
+                    if parents[v] == -1:
+                        parents[v] = u
+                        dists[v] = level
+                        next_frontier[nnext] = v
+                        nnext += 1
+                        mnext += g.outdegree(v)
+        mu -= mnext
+        prev_nf = nf
+        frontier, next_frontier = next_frontier, frontier
+        nf = nnext
+        mf = mnext
+
+    return parents, dists
+
+
+@numba.njit
+def multi_source_bfs(g, sources):
+    """
+    multi_source_bfs(g, sources)
+    Hop distances from every vertex in `sources` to every vertex of `g`.
+    Sources are processed in batches of 64 whose visit states are packed
+    into one uint64 bitmask per vertex, so a single pass over each
+    adjacency list advances all the searches of a batch. Return an int32
+    array of shape (len(sources), nv), with -1 for unreachable vertices.
+    """
+    n = g.nv
+    ns = len(sources)
+    dists = np.full((ns, n), -1, dtype=np.int32)
+    seen = np.empty(n, dtype=np.uint64)
+    visit = np.empty(n, dtype=np.uint64)
+    visit_next = np.empty(n, dtype=np.uint64)
+    zero = np.uint64(0)
+    one = np.uint64(1)
+    for b0 in range(0, ns, 64):
+        b1 = min(b0 + 64, ns)
+        seen[:] = zero
+        visit[:] = zero
+        for i in range(b0, b1):
+            s = sources[i]
+            bit = one << np.uint64(i - b0)
+            seen[s] |= bit
+            visit[s] |= bit
+            dists[i, s] = 0
+        level = 0
+        active = True
+        while active:
+            level += 1
+            active = False
+            visit_next[:] = zero
+            for v in range(n):
+                if visit[v] == zero:
+                    continue
+                for u in g.outneighbors(v):
+                    visit_next[u] |= visit[v]
+            for u in range(n):
+                newbits = visit_next[u] & ~seen[u]
+                visit_next[u] = newbits
+                if newbits == zero:
+                    continue
+                active = True
+                seen[u] |= newbits
+                i = b0
+                while newbits != zero:
+                    if newbits & one:
+                        dists[i, u] = level
+                    newbits >>= one
+                    i += 1
+            visit, visit_next = visit_next, visit
+    return dists
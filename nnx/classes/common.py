@@ -0,0 +1,289 @@
+import numba
+import numpy as np
+
+@numba.njit
+def edge_array_nv(src, dst):
+    # number of vertices needed to hold every endpoint of (src, dst)
+    if len(src) == 0:
+        return 0
+    return max(src.max(), dst.max()) + 1
+
+# largest vertex count for which the key s * nvg + d fits in an int64
+_MAX_KEY_NV = 3037000499
+
+@numba.njit
+def _edge_order(s, d, nvg):
+    # stable permutation sorting the edges (s[i], d[i]) by (s, d)
+    if nvg <= _MAX_KEY_NV:
+        return np.argsort(s * nvg + d, kind='mergesort')
+    order = np.argsort(d, kind='mergesort')
+    return order[np.argsort(s[order], kind='mergesort')]
+
+@numba.njit
+def _first_of_runs(s, d):
+    # mask of the first entry of every run of equal (s, d) in sorted edges
+    keep = np.empty(len(s), dtype=np.bool_)
+    if len(s) > 0:
+        keep[0] = True
+        keep[1:] = (s[1:] != s[:-1]) | (d[1:] != d[:-1])
+    return keep
+
+@numba.njit
+def _row_offsets(s, nvg):
+    offsets = np.zeros(nvg + 1, dtype=np.int64)
+    for i in range(len(s)):
+        offsets[s[i] + 1] += 1
+    return np.cumsum(offsets)
+
+@numba.njit
+def edge_array_to_csr(src, dst, nvg, directed):
+    """
+    edge_array_to_csr(src, dst, nvg, directed)
+    Build the sorted, deduplicated (ne, offsets, indices) adjacency of a
+    graph with `nvg` vertices from the endpoint arrays `src` and `dst`.
+    Undirected edges are mirrored; self loops are stored once.
+    """
+    if len(src) != len(dst):
+        raise Exception("src and dst must have the same length")
+    if len(src) == 0:
+        return 0, np.zeros(nvg + 1, dtype=np.int64), np.empty(0, dtype=np.int64)
+    if min(src.min(), dst.min()) < 0 or max(src.max(), dst.max()) >= nvg:
+        raise Exception("Edge endpoints must be in the range [0, n)")
+
+    if directed:
+        s = src.astype(np.int64)
+        d = dst.astype(np.int64)
+    else:
+        s = np.concatenate((src.astype(np.int64), dst.astype(np.int64)))
+        d = np.concatenate((dst.astype(np.int64), src.astype(np.int64)))
+    order = _edge_order(s, d, nvg)
+    s = s[order]
+    d = d[order]
+    # drops duplicates and the mirrored copy of self loops
+    keep = _first_of_runs(s, d)
+    s = s[keep]
+    indices = d[keep]
+    offsets = _row_offsets(s, nvg)
+
+    if directed:
+        ne = len(indices)
+    else:
+        ne = np.count_nonzero(s <= indices)
+    return ne, offsets, indices
+
+@numba.njit
+def weighted_edge_array_to_csr(src, dst, weights, nvg, directed):
+    """
+    weighted_edge_array_to_csr(src, dst, weights, nvg, directed)
+    Weighted `edge_array_to_csr`, returning (ne, offsets, indices, weights).
+    The first occurrence of a duplicated edge keeps its weight.
+    """
+    if len(src) != len(dst) or len(src) != len(weights):
+        raise Exception("src, dst and weights must have the same length")
+    if len(src) == 0:
+        return 0, np.zeros(nvg + 1, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+    if min(src.min(), dst.min()) < 0 or max(src.max(), dst.max()) >= nvg:
+        raise Exception("Edge endpoints must be in the range [0, n)")
+
+    s = src.astype(np.int64)
+    d = dst.astype(np.int64)
+    w = weights.astype(np.float64)
+    if not directed:
+        # canonical orientation so that (u, v) and (v, u) are one edge
+        lo = np.minimum(s, d)
+        d = np.maximum(s, d)
+        s = lo
+    order = _edge_order(s, d, nvg)
+    s = s[order]
+    d = d[order]
+    w = w[order]
+    keep = _first_of_runs(s, d)
+    s = s[keep]
+    d = d[keep]
+    w = w[keep]
+    ne = len(s)
+
+    if not directed:
+        mirror = s != d
+        s, d = np.concatenate((s, d[mirror])), np.concatenate((d, s[mirror]))
+        w = np.concatenate((w, w[mirror]))
+        order = _edge_order(s, d, nvg)
+        s = s[order]
+        d = d[order]
+        w = w[order]
+    return ne, _row_offsets(s, nvg), d, w
+
+@numba.njit
+def fadjlist_to_csr(fadjlist):
+    # flatten a list of neighbor arrays into (offsets, indices), sorting each row
+    nvg = len(fadjlist)
+    offsets = np.zeros(nvg + 1, dtype=np.int64)
+    for v in range(nvg):
+        offsets[v + 1] = offsets[v] + len(fadjlist[v])
+    indices = np.empty(offsets[nvg], dtype=np.int64)
+    for v in range(nvg):
+        indices[offsets[v]:offsets[v + 1]] = np.sort(fadjlist[v])
+    return offsets, indices
+
+@numba.njit
+def graph_to_csr(g):
+    """
+    graph_to_csr(g)
+    Return the (ne, offsets, indices) out-adjacency of any nnx graph, with
+    the neighbors of every vertex sorted.
+    """
+    nvg = g.nv
+    offsets = np.zeros(nvg + 1, dtype=np.int64)
+    for v in range(nvg):
+        offsets[v + 1] = offsets[v] + g.outdegree(v)
+    indices = np.empty(offsets[nvg], dtype=np.int64)
+    for v in range(nvg):
+        k = offsets[v]
+        for d in g.outneighbors(v):
+            indices[k] = d
+            k += 1
+        indices[offsets[v]:k] = np.sort(indices[offsets[v]:k])
+    return g.ne, offsets, indices
+
+@numba.njit
+def _gallop(adj, x, lo):
+    # first index i >= lo with adj[i] >= x: doubling steps, then bisection
+    n = len(adj)
+    hi = lo
+    step = 1
+    while hi < n and adj[hi] < x:
+        lo = hi + 1
+        hi += step
+        step *= 2
+    hi = min(hi, n)
+    return lo + np.searchsorted(adj[lo:hi], x)
+
+@numba.njit
+def has_edges(g, src, dst):
+    """
+    has_edges(g, src, dst)
+    Vectorized `has_edge` over the pairs (src[i], dst[i]) of a graph with
+    sorted neighbor arrays, answered by galloping through each array once.
+    """
+    if len(src) != len(dst):
+        raise Exception("src and dst must have the same length")
+    nq = len(src)
+    nvg = g.nv
+    found = np.zeros(nq, dtype=np.bool_)
+    # search the shorter of outneighbors(s) (row s) and inneighbors(d) (row nvg + d)
+    qidx = np.empty(nq, dtype=np.int64)
+    rows = np.empty(nq, dtype=np.int64)
+    targets = np.empty(nq, dtype=np.int64)
+    m = 0
+    for i in range(nq):
+        s = src[i]
+        d = dst[i]
+        if s < 0 or d < 0 or s >= nvg or d >= nvg:
+            continue
+        qidx[m] = i
+        if g.indegree(d) < g.outdegree(s):
+            rows[m] = nvg + d
+            targets[m] = s
+        else:
+            rows[m] = s
+            targets[m] = d
+        m += 1
+    rows = rows[:m]
+    targets = targets[:m]
+    order = _edge_order(rows, targets, 2 * nvg)
+    i = 0
+    while i < m:
+        row = rows[order[i]]
+        if row >= nvg:
+            adj = g.inneighbors(row - nvg)
+        else:
+            adj = g.outneighbors(row)
+        pos = 0
+        j = i
+        while j < m and rows[order[j]] == row:
+            k = order[j]
+            pos = _gallop(adj, targets[k], pos)
+            if pos < len(adj) and adj[pos] == targets[k]:
+                found[qidx[k]] = True
+            j += 1
+        i = j
+    return found
+
+@numba.njit
+def number_of_self_loops(g):
+    """
+    number_of_self_loops(g)
+    Return the number of self loops of `g`, one `has_edge(v, v)` per
+    vertex and without building the list of loop edges. The graph classes'
+    `number_of_self_loops` methods delegate here.
+    """
+    count = 0
+    for v in range(g.nv):
+        if g.has_edge(v, v):
+            count += 1
+    return count
+
+@numba.njit
+def edge_offsets(g):
+    """
+    edge_offsets(g)
+    Return the int64 array `eoff` of length nv + 1 such that the out-edges
+    of v occupy positions eoff[v]:eoff[v + 1] of an array aligned with the
+    adjacency order `for v in g.vertices: for d in g.outneighbors(v)`.
+    """
+    nvg = g.nv
+    eoff = np.zeros(nvg + 1, dtype=np.int64)
+    for v in range(nvg):
+        eoff[v + 1] = eoff[v] + g.outdegree(v)
+    return eoff
+
+@numba.njit
+def transpose_csr(offsets, indices):
+    """
+    transpose_csr(offsets, indices)
+    Return the (offsets, indices) of the reversed graph. Rows come out
+    sorted because sources are scanned in increasing order.
+    """
+    nvg = len(offsets) - 1
+    toffsets = np.zeros(nvg + 1, dtype=np.int64)
+    for d in indices:
+        toffsets[d + 1] += 1
+    toffsets = np.cumsum(toffsets)
+    tindices = np.empty(len(indices), dtype=np.int64)
+    pos = toffsets[:-1].copy()
+    for u in range(nvg):
+        for k in range(offsets[u], offsets[u + 1]):
+            d = indices[k]
+            tindices[pos[d]] = u
+            pos[d] += 1
+    return toffsets, tindices
+
+@numba.generated_jit(nopython=True)
+def graph_weights(g):
+    """
+    graph_weights(g)
+    Return the float64 edge weights of a weighted graph aligned with the
+    adjacency order `for v in g.vertices: for d in g.outneighbors(v)`, or
+    None for an unweighted graph. CSR-backed graphs return their weight
+    array without copying.
+    """
+    if isinstance(g, numba.types.ClassInstanceType):
+        if 'weights' in g.struct:
+            return lambda g: g.weights
+        if 'neighbors_with_weights' in g.jit_methods:
+            def impl(g):
+                eoff = edge_offsets(g)
+                w = np.empty(eoff[g.nv], dtype=np.float64)
+                for v in range(g.nv):
+                    _, wv = g.neighbors_with_weights(v)
+                    w[eoff[v]:eoff[v + 1]] = wv
+                return w
+            return impl
+    return lambda g: None
+
+@numba.generated_jit(nopython=True)
+def _has_weights(g):
+    # whether graph_weights(g) is an array, decided from the type of g
+    flag = isinstance(g, numba.types.ClassInstanceType) and (
+        'weights' in g.struct or 'neighbors_with_weights' in g.jit_methods)
+    return lambda g: flag
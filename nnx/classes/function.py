@@ -0,0 +1,67 @@
+import numba
+import numpy as np
+
+from nnx.classes.common import number_of_self_loops
+
+@numba.njit
+def degrees(g):
+    """
+    degrees(g)
+    Return the int64 array of `g.degree(v)` for every vertex, in one
+    compiled pass (in plus out degree on directed graphs).
+    """
+    nvg = g.nv
+    deg = np.empty(nvg, dtype=np.int64)
+    for v in range(nvg):
+        deg[v] = g.degree(v)
+    return deg
+
+@numba.njit
+def in_degrees(g):
+    """
+    in_degrees(g)
+    Return the int64 array of `g.indegree(v)` for every vertex.
+    """
+    nvg = g.nv
+    deg = np.empty(nvg, dtype=np.int64)
+    for v in range(nvg):
+        deg[v] = g.indegree(v)
+    return deg
+
+@numba.njit
+def out_degrees(g):
+    """
+    out_degrees(g)
+    Return the int64 array of `g.outdegree(v)` for every vertex.
+    """
+    nvg = g.nv
+    deg = np.empty(nvg, dtype=np.int64)
+    for v in range(nvg):
+        deg[v] = g.outdegree(v)
+    return deg
+
+@numba.njit
+def degree_histogram(g):
+    """
+    degree_histogram(g)
+    Return the int64 array whose entry d is the number of vertices of
+    degree d, for d from 0 to the maximum degree.
+    """
+    if g.nv == 0:
+        return np.zeros(0, dtype=np.int64)
+    return np.bincount(degrees(g)).astype(np.int64)
+
+@numba.njit
+def density(g):
+    """
+    density(g)
+    Return ne / (nv (nv - 1)) for directed graphs and twice that for
+    undirected graphs, or 0 when `g` has no edges or fewer than 2 vertices.
+    """
+    nvg = g.nv
+    if g.ne == 0 or nvg <= 1:
+        return 0.0
+    d = g.ne / (nvg * (nvg - 1))
+    if not g.is_directed():
+        d *= 2
+    return d
@@ -0,0 +1,234 @@
+import numba
+from numba.types import int64
+from numba.experimental import jitclass
+import numpy as np
+
+import nnx.classes.types as nnx_types
+import nnx.classes.common as nnx_common
+import nnx.classes.simpledigraphcsr as nnx_dicsr
+
+mock_fadj = numba.typed.List()
+mock_fadj.append(np.empty(0, dtype=np.int64))
+
+simple_dig_spec = {
+    'ne': int64,
+    'fadjlist': numba.typeof(mock_fadj),
+    'badjlist': numba.typeof(mock_fadj)
+}
+@jitclass(simple_dig_spec)
+class _SimpleDiGraphArray(object):
+    # base constructor, providing ne, fadjlist (out-neighbors) and
+    # badjlist (in-neighbors), both kept sorted
+    def __init__(self, ne, fadjlist, badjlist):
+        self.ne = ne
+        self.fadjlist = fadjlist
+        self.badjlist = badjlist
+
+    @property
+    def badj(self):
+        return self.badjlist
+
+    @property
+    def nv(self):
+        return len(self.fadjlist)
+
+    @property
+    def vertices(self):
+        for i in range(self.nv):
+            #keep this as generator for now
+            yield(i)
+
+    @property
+    def edges(self):
+        for s in range(self.nv):
+            for d in self.outneighbors(s):
+                yield (s, d)
+
+    def neighbors(self, v):
+        return self.fadjlist[v]
+
+    def inneighbors(self, v):
+        return self.badjlist[v]
+
+    def outneighbors(self, v):
+        return self.fadjlist[v]
+
+    def indegree(self, v):
+        return len(self.inneighbors(v))
+
+    def outdegree(self, v):
+        return len(self.outneighbors(v))
+
+    def degree(self, v):
+        return self.indegree(v) + self.outdegree(v)
+
+    def add_edge(self, s, d, add_nodes=False):
+        nvv = self.nv
+        m = max(s, d)
+        if m >= nvv:
+            if not add_nodes:
+                return False
+            self.add_vertices((m - nvv) + 1)
+        search_adjlist = self.fadjlist[s]
+        index = np.searchsorted(search_adjlist, d)
+        if index < len(search_adjlist) and search_adjlist[index] == d:
+            return False # Edge already in graph
+        self.fadjlist[s] = np.concatenate((search_adjlist[:index], np.array([d]), search_adjlist[index:]))
+        search_adjlist = self.badjlist[d]
+        index = np.searchsorted(search_adjlist, s)
+        self.badjlist[d] = np.concatenate((search_adjlist[:index], np.array([s]), search_adjlist[index:]))
+        self.ne += 1
+        return True
+
+    def add_edges_from(self, edge_iter, add_nodes=False):
+        for e in edge_iter:
+            self.add_edge(e[0], e[1], add_nodes)
+
+    def rem_edge(self, s, d):
+        nvv = self.nv
+        if max(s, d) >= nvv:
+            return False
+        search_adjlist = self.fadjlist[s]
+        index = np.searchsorted(search_adjlist, d)
+        if not(index < len(search_adjlist) and search_adjlist[index] == d):
+            #edge not in graph
+            return False
+        self.fadjlist[s] = np.delete(search_adjlist, index)
+        search_adjlist = self.badjlist[d]
+        index = np.searchsorted(search_adjlist, s)
+        self.badjlist[d] = np.delete(search_adjlist, index)
+        self.ne -= 1
+        return True
+
+    def add_vertex(self):
+        #check for overflow?
+        self.fadjlist.append(np.empty(0, dtype=np.int64))
+        self.badjlist.append(np.empty(0, dtype=np.int64))
+
+    def add_vertices(self, n):
+        for _ in range(n):
+            self.add_vertex()
+
+    def has_edge(self, s, d):
+        if max(s, d) >= self.nv:
+            return False #edge out of bounds
+        adj = self.fadjlist[s]
+        x = d
+        if len(self.badjlist[d]) < len(adj):
+            adj = self.badjlist[d] # search the shorter neighbor array
+            x = s
+        index = np.searchsorted(adj, x)
+        return index < len(adj) and adj[index] == x
+
+    def has_edges(self, src, dst):
+        # vectorized has_edge over the pairs (src[i], dst[i])
+        return nnx_common.has_edges(self, src, dst)
+
+    def has_vertex(self, v):
+        if v >= self.nv:
+            return False
+        else:
+            return True
+
+    def rem_vertex(self, v):
+        n = self.nv - 1
+        if v > n:
+            return False
+        for d in self.outneighbors(v).copy():
+            self.rem_edge(v, d)
+        for s in self.inneighbors(v).copy():
+            self.rem_edge(s, v)
+
+        if v != n:
+            # move the last vertex into slot v
+            outs = self.outneighbors(n).copy()
+            ins = self.inneighbors(n).copy()
+            for d in outs:
+                self.rem_edge(n, d)
+            for s in ins:
+                self.rem_edge(s, n)
+            for d in outs:
+                if d == n:
+                    self.add_edge(v, v)
+                else:
+                    self.add_edge(v, d)
+            for s in ins:
+                if s != n:
+                    self.add_edge(s, v)
+
+        self.fadjlist.pop()
+        self.badjlist.pop()
+        return True
+
+    def is_directed(self):
+        return True
+
+    def is_multigraph(self):
+        return False
+
+    def has_self_loops(self):
+        for v in range(self.nv):
+            if self.has_edge(v, v):
+                return True
+        return False
+
+    def self_loop_edges(self):
+        self_loops = []
+        for v in range(self.nv):
+            if self.has_edge(v, v):
+                self_loops.append((v, v))
+        return self_loops
+
+    def number_of_self_loops(self):
+        return nnx_common.number_of_self_loops(self)
+
+    def freeze(self):
+        # immutable SimpleDiGraphCSR snapshot, built in O(V + E)
+        return nnx_dicsr.SimpleDiGraphCSR(nnx_common.graph_to_csr(self))
+
+    def _get_generator_function(self):
+        return SimpleDiGraphArray
+
+
+@numba.njit
+def sdg_with_vertices(constructor=0):
+    # Create SimpleDiGraph with n vertices and 0 edges
+    fadjlist = numba.typed.List()
+    badjlist = numba.typed.List()
+    for _ in range(constructor):
+        fadjlist.append(np.empty(0, dtype=np.int64))
+        badjlist.append(np.empty(0, dtype=np.int64))
+    return _SimpleDiGraphArray(0, fadjlist, badjlist)
+
+@numba.njit
+def _from_csr_arrays(ne, offsets, indices):
+    boffsets, bindices = nnx_common.transpose_csr(offsets, indices)
+    fadjlist = numba.typed.List()
+    badjlist = numba.typed.List()
+    for v in range(len(offsets) - 1):
+        fadjlist.append(indices[offsets[v]:offsets[v + 1]].copy())
+        badjlist.append(bindices[boffsets[v]:boffsets[v + 1]].copy())
+    return _SimpleDiGraphArray(ne, fadjlist, badjlist)
+
+@numba.njit
+def _from_csr_constructor_tuple(constructor):
+    # (ne, offsets, indices) of the out-adjacency
+    return _from_csr_arrays(constructor[0], constructor[1], constructor[2])
+
+@numba.njit
+def _from_grapharray_constructor_tuple(constructor):
+    # fadjlist is read as out-neighbor lists; a symmetric list yields both
+    # directions of every edge, so ne is recounted
+    offsets, indices = nnx_common.fadjlist_to_csr(constructor[1])
+    return _from_csr_arrays(len(indices), offsets, indices)
+
+@numba.generated_jit(nopython=True)
+def SimpleDiGraphArray(constructor=0):
+    if isinstance(constructor, numba.types.Integer) or isinstance(constructor, numba.types.Omitted):
+        return sdg_with_vertices
+    elif constructor == nnx_types.simplegrapharray_const_type:
+        return _from_grapharray_constructor_tuple
+    elif nnx_types.is_csr_const_type(constructor):
+        return _from_csr_constructor_tuple
+    else:
+        raise Exception("Constructor with type {} Not Supported Yet".format(constructor))
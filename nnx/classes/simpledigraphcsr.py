@@ -0,0 +1,151 @@
+import numba
+from numba.types import int64
+from numba.experimental import jitclass
+import numpy as np
+
+import nnx.classes.types as nnx_types
+import nnx.classes.common as nnx_common
+from nnx.classes.simplegraphcsr import csr_array_type
+
+simple_dicsr_spec = {
+    'ne': int64,
+    'offsets': csr_array_type,
+    'indices': csr_array_type,
+    'boffsets': csr_array_type,
+    'bindices': csr_array_type
+}
+@jitclass(simple_dicsr_spec)
+class _SimpleDiGraphCSR(object):
+    # immutable digraph: out-neighbors in (offsets, indices), in-neighbors
+    # in (boffsets, bindices), rows sorted
+    def __init__(self, ne, offsets, indices, boffsets, bindices):
+        self.ne = ne
+        self.offsets = offsets
+        self.indices = indices
+        self.boffsets = boffsets
+        self.bindices = bindices
+
+    @property
+    def nv(self):
+        return len(self.offsets) - 1
+
+    @property
+    def vertices(self):
+        for i in range(self.nv):
+            #keep this as generator for now
+            yield(i)
+
+    @property
+    def edges(self):
+        for s in range(self.nv):
+            for d in self.outneighbors(s):
+                yield (s, d)
+
+    def neighbors(self, v):
+        return self.outneighbors(v)
+
+    def inneighbors(self, v):
+        # zero-copy view into bindices
+        return self.bindices[self.boffsets[v]:self.boffsets[v + 1]]
+
+    def outneighbors(self, v):
+        # zero-copy view into indices
+        return self.indices[self.offsets[v]:self.offsets[v + 1]]
+
+    def indegree(self, v):
+        return self.boffsets[v + 1] - self.boffsets[v]
+
+    def outdegree(self, v):
+        return self.offsets[v + 1] - self.offsets[v]
+
+    def degree(self, v):
+        return self.indegree(v) + self.outdegree(v)
+
+    def has_edge(self, s, d):
+        if max(s, d) >= self.nv:
+            return False #edge out of bounds
+        adj = self.outneighbors(s)
+        index = np.searchsorted(adj, d)
+        return index < len(adj) and adj[index] == d
+
+    def has_edges(self, src, dst):
+        # vectorized has_edge over the pairs (src[i], dst[i])
+        return nnx_common.has_edges(self, src, dst)
+
+    def has_vertex(self, v):
+        if v >= self.nv:
+            return False
+        else:
+            return True
+
+    def is_directed(self):
+        return True
+
+    def is_multigraph(self):
+        return False
+
+    def has_self_loops(self):
+        for v in range(self.nv):
+            if self.has_edge(v, v):
+                return True
+        return False
+
+    def self_loop_edges(self):
+        self_loops = []
+        for v in range(self.nv):
+            if self.has_edge(v, v):
+                self_loops.append((v, v))
+        return self_loops
+
+    def number_of_self_loops(self):
+        return nnx_common.number_of_self_loops(self)
+
+    def freeze(self):
+        return self
+
+    def thaw(self, create_using):
+        # mutable copy, create_using receives the out-adjacency CSR tuple
+        return create_using((self.ne, self.offsets, self.indices))
+
+    def _get_generator_function(self):
+        return SimpleDiGraphCSR
+
+
+@numba.njit
+def dicsr_with_vertices(constructor=0):
+    # Create SimpleDiGraphCSR with n vertices and 0 edges
+    offsets = np.zeros(constructor + 1, dtype=np.int64)
+    indices = np.empty(0, dtype=np.int64)
+    return _SimpleDiGraphCSR(0, offsets, indices, offsets, indices)
+
+@numba.njit
+def _from_bicsr_constructor_tuple(constructor):
+    return _SimpleDiGraphCSR(constructor[0], constructor[1], constructor[2],
+                             constructor[3], constructor[4])
+
+@numba.njit
+def _from_csr_constructor_tuple(constructor):
+    # (ne, offsets, indices) of the out-adjacency
+    ne, offsets, indices = constructor
+    boffsets, bindices = nnx_common.transpose_csr(offsets, indices)
+    return _SimpleDiGraphCSR(ne, offsets, indices, boffsets, bindices)
+
+@numba.njit
+def _from_grapharray_constructor_tuple(constructor):
+    # fadjlist is read as out-neighbor lists, so ne is recounted
+    offsets, indices = nnx_common.fadjlist_to_csr(constructor[1])
+    boffsets, bindices = nnx_common.transpose_csr(offsets, indices)
+    return _SimpleDiGraphCSR(len(indices), offsets, indices, boffsets, bindices)
+
+@numba.generated_jit(nopython=True)
+def SimpleDiGraphCSR(constructor=0):
+    if isinstance(constructor, numba.types.Integer) or isinstance(constructor, numba.types.Omitted):
+        return dicsr_with_vertices
+    elif constructor == nnx_types.simplegrapharray_const_type:
+        return _from_grapharray_constructor_tuple
+    elif nnx_types.is_csr_const_type(constructor):
+        return _from_csr_constructor_tuple
+    elif nnx_types.is_bicsr_const_type(constructor):
+        return _from_bicsr_constructor_tuple
+    else:
+        raise Exception("Constructor with type {} Not Supported Yet".format(constructor))
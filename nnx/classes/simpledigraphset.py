@@ -0,0 +1,70 @@
+import numba
+from numba.types import ListType, int64, Set
+from numba.experimental import jitclass
+
+import nnx.classes.types as nnx_types
+import nnx.classes.common as nnx_common
+from nnx.classes.simpledigraphlist import _SimpleDiGraphBase
+
+simple_dig_spec = {
+    'ne': int64,
+    'fadjlist': ListType(Set(int64)),
+    'badjlist': ListType(Set(int64))
+}
+@jitclass(simple_dig_spec)
+class _SimpleDiGraphSet(_SimpleDiGraphBase):
+    def _link(self, s, d):
+        self.fadjlist[s].add(d)
+        self.badjlist[d].add(s)
+
+    def add_vertex(self):
+        #check for overflow?
+        self.fadjlist.append(set(numba.typed.List.empty_list(0)))
+        self.badjlist.append(set(numba.typed.List.empty_list(0)))
+
+    def _get_generator_function(self):
+        return SimpleDiGraphSet
+
+
+@numba.njit
+def sdgs_with_vertices(constructor=0):
+    # Create SimpleDiGraph with n vertices and 0 edges
+    fadjlist = numba.typed.List()
+    badjlist = numba.typed.List()
+    for _ in range(constructor):
+        fadjlist.append(set(numba.typed.List.empty_list(0)))
+        badjlist.append(set(numba.typed.List.empty_list(0)))
+    return _SimpleDiGraphSet(0, fadjlist, badjlist)
+
+@numba.njit
+def _from_csr_arrays(ne, offsets, indices):
+    boffsets, bindices = nnx_common.transpose_csr(offsets, indices)
+    fadjlist = numba.typed.List()
+    badjlist = numba.typed.List()
+    for v in range(len(offsets) - 1):
+        fadjlist.append(set(indices[offsets[v]:offsets[v + 1]]))
+        badjlist.append(set(bindices[boffsets[v]:boffsets[v + 1]]))
+    return _SimpleDiGraphSet(ne, fadjlist, badjlist)
+
+@numba.njit
+def _from_csr_constructor_tuple(constructor):
+    # (ne, offsets, indices) of the out-adjacency
+    return _from_csr_arrays(constructor[0], constructor[1], constructor[2])
+
+@numba.njit
+def _from_grapharray_constructor_tuple(constructor):
+    # fadjlist is read as out-neighbor lists; a symmetric list yields both
+    # directions of every edge, so ne is recounted
+    offsets, indices = nnx_common.fadjlist_to_csr(constructor[1])
+    return _from_csr_arrays(len(indices), offsets, indices)
+
+@numba.generated_jit(nopython=True)
+def SimpleDiGraphSet(constructor=0):
+    if isinstance(constructor, numba.types.Integer) or isinstance(constructor, numba.types.Omitted):
+        return sdgs_with_vertices
+    elif constructor == nnx_types.simplegrapharray_const_type:
+        return _from_grapharray_constructor_tuple
+    elif nnx_types.is_csr_const_type(constructor):
+        return _from_csr_constructor_tuple
+    else:
+        raise Exception("Constructor with type {} Not Supported Yet".format(constructor))
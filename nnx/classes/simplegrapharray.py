@@ -4,6 +4,8 @@ from numba.experimental import jitclass
 import numpy as np
 
 import nnx.classes.types as nnx_types
+import nnx.classes.common as nnx_common
+import nnx.classes.simplegraphcsr as nnx_csr
 
 mock_fadj = numba.typed.List()
 mock_fadj.append(np.empty(0, dtype=np.int64))
@@ -89,6 +91,32 @@ class _SimpleGraphArray(object):
         for e in edge_iter:
             self.add_edge(e[0], e[1], add_nodes)
 
+    def add_edges_batch(self, src, dst, add_nodes=False):
+        # one sorted merge per touched row; flags the edges actually inserted
+        if add_nodes and len(src) > 0:
+            m = max(src.max(), dst.max())
+            if m >= self.nv:
+                self.add_vertices((m - self.nv) + 1)
+        eidx, lo, hi = _batch_candidates(src, dst, self.nv)
+        flags = np.zeros(len(src), dtype=np.bool_)
+        new = np.zeros(len(eidx), dtype=np.bool_)
+        for j in range(len(eidx)):
+            adj = self.fadjlist[lo[j]]
+            index = np.searchsorted(adj, hi[j])
+            if not(index < len(adj) and adj[index] == hi[j]):
+                new[j] = True
+                flags[eidx[j]] = True
+        rows, cols = _row_updates(lo[new], hi[new], self.nv)
+        i = 0
+        while i < len(rows):
+            j = i
+            while j < len(rows) and rows[j] == rows[i]:
+                j += 1
+            self.fadjlist[rows[i]] = _merge_sorted(self.fadjlist[rows[i]], cols[i:j])
+            i = j
+        self.ne += np.count_nonzero(new)
+        return flags
+
     def rem_edge(self, s, d):
         nvv = self.nv
         if max(s, d) >= nvv:
@@ -106,6 +134,28 @@ class _SimpleGraphArray(object):
             self.fadjlist[d] = np.delete(search_adjlist, index)
         return True
 
+    def rem_edges_batch(self, src, dst):
+        # one sorted pass per touched row; flags the edges actually removed
+        eidx, lo, hi = _batch_candidates(src, dst, self.nv)
+        flags = np.zeros(len(src), dtype=np.bool_)
+        found = np.zeros(len(eidx), dtype=np.bool_)
+        for j in range(len(eidx)):
+            adj = self.fadjlist[lo[j]]
+            index = np.searchsorted(adj, hi[j])
+            if index < len(adj) and adj[index] == hi[j]:
+                found[j] = True
+                flags[eidx[j]] = True
+        rows, cols = _row_updates(lo[found], hi[found], self.nv)
+        i = 0
+        while i < len(rows):
+            j = i
+            while j < len(rows) and rows[j] == rows[i]:
+                j += 1
+            self.fadjlist[rows[i]] = _difference_sorted(self.fadjlist[rows[i]], cols[i:j])
+            i = j
+        self.ne -= np.count_nonzero(found)
+        return flags
+
     def add_vertex(self):
         #check for overflow?
         self.fadjlist.append(np.empty(0, dtype=np.int64))
@@ -117,11 +167,15 @@ class _SimpleGraphArray(object):
     def has_edge(self, s, d):
         if max(s, d) >= self.nv:
             return False #edge out of bounds
+        if len(self.fadjlist[d]) < len(self.fadjlist[s]):
+            s, d = d, s # search the shorter neighbor array
         adj = self.fadjlist[s]
-        for i in range(len(adj)):
-            if adj[i] == d:
-                return True
-        return False
+        index = np.searchsorted(adj, d)
+        return index < len(adj) and adj[index] == d
+
+    def has_edges(self, src, dst):
+        # vectorized has_edge over the pairs (src[i], dst[i])
+        return nnx_common.has_edges(self, src, dst)
 
     def has_vertex(self, v):
         if v >= self.nv:
@@ -143,6 +197,7 @@ class _SimpleGraphArray(object):
             #remove from last vertex
             neigs = self.inneighbors(n).copy()
             for s in neigs:
+                self.rem_edge(s, n)
                 if s != n:
                     self.add_edge(s, v)
                 else:
@@ -165,7 +220,7 @@ class _SimpleGraphArray(object):
             return False
         for v in self.vertices:
             index = np.searchsorted(self.neighbors(v), v)
-            if index <= len(self.neighbors(v)) and self.neighbors(v)[index] == v:
+            if index < len(self.neighbors(v)) and self.neighbors(v)[index] == v:
                 return True
         return False
 
@@ -175,17 +230,76 @@ class _SimpleGraphArray(object):
             return self_loops
         for v in self.vertices:
             index = np.searchsorted(self.neighbors(v), v)
-            if index <= len(self.neighbors(v)) and self.neighbors(v)[index] == v:
+            if index < len(self.neighbors(v)) and self.neighbors(v)[index] == v:
                 self_loops.append((v, v))
         return self_loops
 
     def number_of_self_loops(self):
-        return len(self.self_loop_edges())
+        return nnx_common.number_of_self_loops(self)
+
+    def freeze(self):
+        # immutable SimpleGraphCSR snapshot, built in O(V + E)
+        return nnx_csr.SimpleGraphCSR(nnx_common.graph_to_csr(self))
 
     def _get_generator_function(self):
         return SimpleGraphArray
 
 
+@numba.njit
+def _batch_candidates(src, dst, nvg):
+    # Distinct in-range undirected edges of a batch as (lo, hi) endpoint
+    # pairs, with the index of their first occurrence in src/dst.
+    m = len(src)
+    valid = np.empty(m, dtype=np.bool_)
+    for i in range(m):
+        valid[i] = src[i] >= 0 and dst[i] >= 0 and src[i] < nvg and dst[i] < nvg
+    idx = np.nonzero(valid)[0]
+    s = src[idx].astype(np.int64)
+    d = dst[idx].astype(np.int64)
+    lo = np.minimum(s, d)
+    hi = np.maximum(s, d)
+    order = nnx_common._edge_order(lo, hi, nvg)
+    order = order[nnx_common._first_of_runs(lo[order], hi[order])]
+    return idx[order], lo[order], hi[order]
+
+@numba.njit
+def _row_updates(lo, hi, nvg):
+    # both legs of every edge, grouped by row with sorted columns
+    mirror = lo != hi
+    rows = np.concatenate((lo, hi[mirror]))
+    cols = np.concatenate((hi, lo[mirror]))
+    order = nnx_common._edge_order(rows, cols, nvg)
+    return rows[order], cols[order]
+
+@numba.njit
+def _merge_sorted(a, b):
+    # merge two sorted arrays with no common elements
+    out = np.empty(len(a) + len(b), dtype=np.int64)
+    i = 0
+    j = 0
+    for k in range(len(out)):
+        if j == len(b) or (i < len(a) and a[i] < b[j]):
+            out[k] = a[i]
+            i += 1
+        else:
+            out[k] = b[j]
+            j += 1
+    return out
+
+@numba.njit
+def _difference_sorted(a, b):
+    # elements of sorted a that are not in sorted b, where b is a subset of a
+    out = np.empty(len(a) - len(b), dtype=np.int64)
+    j = 0
+    k = 0
+    for i in range(len(a)):
+        if j < len(b) and a[i] == b[j]:
+            j += 1
+        else:
+            out[k] = a[i]
+            k += 1
+    return out
+
 @numba.njit
 def sg_with_vertices(constructor=0):
     # Create SimpleGraph with n vertices and 0 edges
@@ -199,6 +313,14 @@ def sg_with_vertices(constructor=0):
 def _from_constructor_tuple(constructor):
     return _SimpleGraphArray(constructor[0], constructor[1])
 
+@numba.njit
+def _from_csr_constructor_tuple(constructor):
+    ne, offsets, indices = constructor
+    fadjlist = numba.typed.List()
+    for v in range(len(offsets) - 1):
+        fadjlist.append(indices[offsets[v]:offsets[v + 1]].copy())
+    return _SimpleGraphArray(ne, fadjlist)
+
 @numba.generated_jit(nopython=True)
 def SimpleGraphArray(constructor=0):
     if isinstance(constructor, numba.types.Integer) or isinstance(constructor, numba.types.Omitted):
@@ -207,6 +329,8 @@ def SimpleGraphArray(constructor=0):
     #     return sg_from_numpy_fadjlist
     elif constructor == nnx_types.simplegrapharray_const_type:
         return _from_constructor_tuple
+    elif nnx_types.is_csr_const_type(constructor):
+        return _from_csr_constructor_tuple
     else:
         raise Exception("Constructor with type {} Not Supported Yet".format(constructor))
 
@@ -0,0 +1,138 @@
+import numba
+from numba.types import int64
+from numba.experimental import jitclass
+import numpy as np
+
+import nnx.classes.types as nnx_types
+import nnx.classes.common as nnx_common
+
+# read-only, any layout: accepts fresh arrays, slices and read-only memory maps
+csr_array_type = numba.types.Array(int64, 1, 'A', readonly=True)
+
+simple_csr_spec = {
+    'ne': int64,
+    'offsets': csr_array_type,
+    'indices': csr_array_type
+}
+@jitclass(simple_csr_spec)
+class _SimpleGraphCSR(object):
+    # Immutable graph stored in compressed sparse row form: the sorted
+    # neighbors of v are indices[offsets[v]:offsets[v + 1]].
+    def __init__(self, ne, offsets, indices):
+        self.ne = ne
+        self.offsets = offsets
+        self.indices = indices
+
+    @property
+    def nv(self):
+        return len(self.offsets) - 1
+
+    @property
+    def vertices(self):
+        for i in range(self.nv):
+            #keep this as generator for now
+            yield(i)
+
+    @property
+    def edges(self):
+        for s in range(self.nv):
+            for d in self.neighbors(s):
+                if d < s:
+                    continue
+                yield (s, d)
+
+    def neighbors(self, v):
+        # zero-copy view into indices
+        return self.indices[self.offsets[v]:self.offsets[v + 1]]
+
+    def inneighbors(self, v):
+        return self.neighbors(v)
+
+    def outneighbors(self, v):
+        return self.neighbors(v)
+
+    def indegree(self, v):
+        return self.degree(v)
+
+    def outdegree(self, v):
+        return self.degree(v)
+
+    def degree(self, v):
+        return self.offsets[v + 1] - self.offsets[v]
+
+    def has_edge(self, s, d):
+        if max(s, d) >= self.nv:
+            return False #edge out of bounds
+        adj = self.neighbors(s)
+        index = np.searchsorted(adj, d)
+        return index < len(adj) and adj[index] == d
+
+    def has_edges(self, src, dst):
+        # vectorized has_edge over the pairs (src[i], dst[i])
+        return nnx_common.has_edges(self, src, dst)
+
+    def has_vertex(self, v):
+        if v >= self.nv:
+            return False
+        else:
+            return True
+
+    def is_directed(self):
+        return False
+
+    def is_multigraph(self):
+        return False
+
+    def has_self_loops(self):
+        for v in range(self.nv):
+            if self.has_edge(v, v):
+                return True
+        return False
+
+    def self_loop_edges(self):
+        self_loops = []
+        for v in range(self.nv):
+            if self.has_edge(v, v):
+                self_loops.append((v, v))
+        return self_loops
+
+    def number_of_self_loops(self):
+        return nnx_common.number_of_self_loops(self)
+
+    def freeze(self):
+        return self
+
+    def thaw(self, create_using):
+        # mutable copy built by create_using from the (ne, offsets, indices) tuple
+        return create_using((self.ne, self.offsets, self.indices))
+
+    def _get_generator_function(self):
+        return SimpleGraphCSR
+
+
+@numba.njit
+def csr_with_vertices(constructor=0):
+    # Create SimpleGraphCSR with n vertices and 0 edges
+    offsets = np.zeros(constructor + 1, dtype=np.int64)
+    indices = np.empty(0, dtype=np.int64)
+    return _SimpleGraphCSR(0, offsets, indices)
+
+@numba.njit
+def _from_csr_constructor_tuple(constructor):
+    return _SimpleGraphCSR(constructor[0], constructor[1], constructor[2])
+
+@numba.njit
+def _from_grapharray_constructor_tuple(constructor):
+    offsets, indices = nnx_common.fadjlist_to_csr(constructor[1])
+    return _SimpleGraphCSR(constructor[0], offsets, indices)
+
+@numba.generated_jit(nopython=True)
+def SimpleGraphCSR(constructor=0):
+    if isinstance(constructor, numba.types.Integer) or isinstance(constructor, numba.types.Omitted):
+        return csr_with_vertices
+    elif constructor == nnx_types.simplegrapharray_const_type:
+        return _from_grapharray_constructor_tuple
+    elif nnx_types.is_csr_const_type(constructor):
+        return _from_csr_constructor_tuple
+    else:
+        raise Exception("Constructor with type {} Not Supported Yet".format(constructor))
@@ -3,6 +3,8 @@ from numba.types import ListType, int64, Set
 from numba.experimental import jitclass
 
 import nnx.classes.types as nnx_types
+import nnx.classes.common as nnx_common
+import nnx.classes.simplegraphcsr as nnx_csr
 
 simple_g_spec = {
     'ne': int64,
@@ -122,6 +124,7 @@ class _SimpleGraphList(object):
             #remove from last vertex
             neigs = self.inneighbors(n).copy()
             for s in neigs:
+                self.rem_edge(s, n)
                 if s != n:
                     self.add_edge(s, v)
                 else:
@@ -153,7 +156,11 @@ class _SimpleGraphList(object):
         return self_loops
 
     def number_of_self_loops(self):
-        return len(self.self_loop_edges())
+        return nnx_common.number_of_self_loops(self)
+
+    def freeze(self):
+        # immutable SimpleGraphCSR snapshot, built in O(V + E)
+        return nnx_csr.SimpleGraphCSR(nnx_common.graph_to_csr(self))
 
     def _get_generator_function(self):
         return SimpleGraphList
@@ -171,11 +178,21 @@ def _from_grapharray_constructor_tuple(constructor):
     fadjlist = numba.typed.List([numba.typed.List(x) for x in constructor[1]])
     return _SimpleGraphList(constructor[0], fadjlist)
 
+@numba.njit
+def _from_csr_constructor_tuple(constructor):
+    ne, offsets, indices = constructor
+    fadjlist = numba.typed.List()
+    for v in range(len(offsets) - 1):
+        fadjlist.append(numba.typed.List(indices[offsets[v]:offsets[v + 1]]))
+    return _SimpleGraphList(ne, fadjlist)
+
 @numba.generated_jit(nopython=True)
 def SimpleGraphList(constructor=0):
     if isinstance(constructor, numba.types.Integer) or isinstance(constructor, numba.types.Omitted):
         return sg_with_vertices
     elif constructor == nnx_types.simplegrapharray_const_type:
         return _from_grapharray_constructor_tuple
+    elif nnx_types.is_csr_const_type(constructor):
+        return _from_csr_constructor_tuple
     else:
         raise Exception("Constructor with type {} Not Supported Yet".format(constructor))
\ No newline at end of file
@@ -0,0 +1,265 @@
+import numba
+from numba.types import int64
+from numba.experimental import jitclass
+import numpy as np
+
+import nnx.classes.types as nnx_types
+import nnx.classes.common as nnx_common
+import nnx.classes.simplegraphcsr as nnx_csr
+
+mock_fadj = numba.typed.List()
+mock_fadj.append(np.empty(0, dtype=np.int64))
+
+simple_gv_spec = {
+    'ne': int64,
+    'fadjlist': numba.typeof(mock_fadj),
+    'degs': int64[:]
+}
+@jitclass(simple_gv_spec)
+class _SimpleGraphVector(object):
+    # SimpleGraphArray with doubling spare capacity: only the sorted
+    # fadjlist[v][:degs[v]] is in use, and degs itself outgrows nv
+    def __init__(self, ne, fadjlist, degs):
+        self.ne = ne
+        self.fadjlist = fadjlist
+        self.degs = degs
+
+    @property
+    def nv(self):
+        return len(self.fadjlist)
+
+    @property
+    def vertices(self):
+        for i in range(self.nv):
+            #keep this as generator for now
+            yield(i)
+
+    @property
+    def edges(self):
+        for s in range(self.nv):
+            for d in self.neighbors(s):
+                if d < s:
+                    continue
+                yield (s, d)
+
+    def _check_vertex(self, v):
+        # degs has spare capacity, so indexing it alone does not bound v
+        if v < 0 or v >= self.nv:
+            raise IndexError('vertex out of range')
+
+    def neighbors(self, v):
+        self._check_vertex(v)
+        return self.fadjlist[v][:self.degs[v]]
+
+    def inneighbors(self, v):
+        return self.neighbors(v)
+
+    def outneighbors(self, v):
+        return self.neighbors(v)
+
+    def indegree(self, v):
+        return self.degree(v)
+
+    def outdegree(self, v):
+        return self.degree(v)
+
+    def degree(self, v):
+        self._check_vertex(v)
+        return self.degs[v]
+
+    def capacity(self, v):
+        self._check_vertex(v)
+        return len(self.fadjlist[v])
+
+    def _insert(self, s, d, index):
+        arr = self.fadjlist[s]
+        n = self.degs[s]
+        if n == len(arr):
+            grown = np.empty(max(4, 2 * n), dtype=np.int64)
+            grown[:index] = arr[:index]
+            grown[index + 1:n + 1] = arr[index:n]
+            arr = grown
+            self.fadjlist[s] = arr
+        else:
+            for k in range(n, index, -1):
+                arr[k] = arr[k - 1]
+        arr[index] = d
+        self.degs[s] = n + 1
+
+    def _delete(self, s, index):
+        arr = self.fadjlist[s]
+        n = self.degs[s] - 1
+        for k in range(index, n):
+            arr[k] = arr[k + 1]
+        self.degs[s] = n
+
+    def add_edge(self, s, d, add_nodes=False):
+        nvv = self.nv
+        m = max(s, d)
+        if m >= nvv:
+            if not add_nodes:
+                return False
+            self.add_vertices((m - nvv) + 1)
+        search_adjlist = self.neighbors(s)
+        index = np.searchsorted(search_adjlist, d)
+        if index < len(search_adjlist) and search_adjlist[index] == d:
+            return False # Edge already in graph
+        self._insert(s, d, index)
+        self.ne += 1
+        if s == d:
+            return True #self loop
+        self._insert(d, s, np.searchsorted(self.neighbors(d), s))
+        return True
+
+    def add_edges_from(self, edge_iter, add_nodes=False):
+        for e in edge_iter:
+            self.add_edge(e[0], e[1], add_nodes)
+
+    def rem_edge(self, s, d):
+        nvv = self.nv
+        if max(s, d) >= nvv:
+            return False
+        search_adjlist = self.neighbors(s)
+        index = np.searchsorted(search_adjlist, d)
+        if not(index < len(search_adjlist) and search_adjlist[index] == d):
+            #edge not in graph
+            return False
+        self._delete(s, index)
+        self.ne -= 1
+        if s != d:
+            self._delete(d, np.searchsorted(self.neighbors(d), s))
+        return True
+
+    def add_vertex(self):
+        #check for overflow?
+        nvv = self.nv
+        if nvv == len(self.degs):
+            degs = np.zeros(max(4, 2 * nvv), dtype=np.int64)
+            degs[:nvv] = self.degs
+            self.degs = degs
+        self.degs[nvv] = 0
+        self.fadjlist.append(np.empty(0, dtype=np.int64))
+
+    def add_vertices(self, n):
+        for _ in range(n):
+            self.add_vertex()
+
+    def has_edge(self, s, d):
+        if max(s, d) >= self.nv:
+            return False #edge out of bounds
+        if self.degs[d] < self.degs[s]:
+            s, d = d, s # search the shorter neighbor array
+        adj = self.neighbors(s)
+        index = np.searchsorted(adj, d)
+        return index < len(adj) and adj[index] == d
+
+    def has_edges(self, src, dst):
+        # vectorized has_edge over the pairs (src[i], dst[i])
+        return nnx_common.has_edges(self, src, dst)
+
+    def has_vertex(self, v):
+        if v >= self.nv:
+            return False
+        else:
+            return True
+
+    def rem_vertex(self, v):
+        n = self.nv - 1
+        if v > n:
+            return False
+        for d in self.neighbors(v).copy():
+            self.rem_edge(v, d)
+
+        if v != n:
+            # move the last vertex into slot v
+            neigs = self.neighbors(n).copy()
+            for d in neigs:
+                self.rem_edge(n, d)
+            for d in neigs:
+                if d == n:
+                    self.add_edge(v, v)
+                else:
+                    self.add_edge(v, d)
+
+        self.fadjlist.pop()
+        self.degs[n] = 0
+        return True
+
+    def shrink_to_fit(self):
+        # drop the spare capacity of every neighbor array
+        nvv = self.nv
+        for v in range(nvv):
+            if len(self.fadjlist[v]) != self.degs[v]:
+                self.fadjlist[v] = self.fadjlist[v][:self.degs[v]].copy()
+        self.degs = self.degs[:nvv].copy()
+
+    def compact(self):
+        self.shrink_to_fit()
+
+    def is_directed(self):
+        return False
+
+    def is_multigraph(self):
+        return False
+
+    def has_self_loops(self):
+        for v in range(self.nv):
+            if self.has_edge(v, v):
+                return True
+        return False
+
+    def self_loop_edges(self):
+        self_loops = []
+        for v in range(self.nv):
+            if self.has_edge(v, v):
+                self_loops.append((v, v))
+        return self_loops
+
+    def number_of_self_loops(self):
+        return nnx_common.number_of_self_loops(self)
+
+    def freeze(self):
+        # immutable SimpleGraphCSR snapshot, built in O(V + E)
+        return nnx_csr.SimpleGraphCSR(nnx_common.graph_to_csr(self))
+
+    def _get_generator_function(self):
+        return SimpleGraphVector
+
+
+@numba.njit
+def sgv_with_vertices(constructor=0):
+    # Create SimpleGraphVector with n vertices and 0 edges
+    fadjlist = numba.typed.List()
+    for _ in range(constructor):
+        fadjlist.append(np.empty(0, dtype=np.int64))
+    return _SimpleGraphVector(0, fadjlist, np.zeros(constructor, dtype=np.int64))
+
+@numba.njit
+def _from_csr_arrays(ne, offsets, indices):
+    nvg = len(offsets) - 1
+    fadjlist = numba.typed.List()
+    for v in range(nvg):
+        fadjlist.append(indices[offsets[v]:offsets[v + 1]].copy())
+    degs = offsets[1:] - offsets[:-1]
+    return _SimpleGraphVector(ne, fadjlist, degs)
+
+@numba.njit
+def _from_csr_constructor_tuple(constructor):
+    ne, offsets, indices = constructor
+    return _from_csr_arrays(ne, offsets, indices)
+
+@numba.njit
+def _from_grapharray_constructor_tuple(constructor):
+    offsets, indices = nnx_common.fadjlist_to_csr(constructor[1])
+    return _from_csr_arrays(constructor[0], offsets, indices)
+
+@numba.generated_jit(nopython=True)
+def SimpleGraphVector(constructor=0):
+    if isinstance(constructor, numba.types.Integer) or isinstance(constructor, numba.types.Omitted):
+        return sgv_with_vertices
+    elif constructor == nnx_types.simplegrapharray_const_type:
+        return _from_grapharray_constructor_tuple
+    elif nnx_types.is_csr_const_type(constructor):
+        return _from_csr_constructor_tuple
+    else:
+        raise Exception("Constructor with type {} Not Supported Yet".format(constructor))
@@ -0,0 +1,264 @@
+import numba
+from numba.types import int64
+from numba.experimental import jitclass
+import numpy as np
+
+import nnx.classes.types as nnx_types
+import nnx.classes.common as nnx_common
+import nnx.classes.simpleweightedgraphcsr as nnx_wcsr
+
+mock_fadj = numba.typed.List()
+mock_fadj.append(np.empty(0, dtype=np.int64))
+mock_wadj = numba.typed.List()
+mock_wadj.append(np.empty(0, dtype=np.float64))
+
+simple_wg_spec = {
+    'ne': int64,
+    'fadjlist': numba.typeof(mock_fadj),
+    'weightlist': numba.typeof(mock_wadj)
+}
+@jitclass(simple_wg_spec)
+class _SimpleWeightedGraphArray(object):
+    # base constructor, providing ne, fadjlist and weightlist, where
+    # weightlist[v][i] is the weight of the edge (v, fadjlist[v][i])
+    def __init__(self, ne, fadjlist, weightlist):
+        self.ne = ne
+        self.fadjlist = fadjlist
+        self.weightlist = weightlist
+
+    @property
+    def badj(self):
+        return self.fadjlist
+
+    @property
+    def nv(self):
+        return len(self.fadjlist)
+
+    @property
+    def vertices(self):
+        for i in range(self.nv):
+            #keep this as generator for now
+            yield(i)
+
+    @property
+    def edges(self):
+        for s in range(self.nv):
+            for d in self.neighbors(s):
+                if d < s:
+                    continue
+                yield (s, d)
+
+    def neighbors(self, v):
+        return self.fadjlist[v]
+
+    def neighbors_with_weights(self, v):
+        return self.fadjlist[v], self.weightlist[v]
+
+    def inneighbors(self, v):
+        return self.neighbors(v)
+
+    def outneighbors(self, v):
+        return self.neighbors(v)
+
+    def indegree(self, v):
+        return len(self.inneighbors(v))
+
+    def outdegree(self, v):
+        return len(self.outneighbors(v))
+
+    def degree(self, v):
+        return len(self.neighbors(v))
+
+    def get_weight(self, s, d):
+        # weight of edge (s, d), or nan if it is not in the graph
+        if max(s, d) >= self.nv:
+            return np.nan
+        adj = self.fadjlist[s]
+        index = np.searchsorted(adj, d)
+        if index < len(adj) and adj[index] == d:
+            return self.weightlist[s][index]
+        return np.nan
+
+    def _insert(self, s, d, weight):
+        search_adjlist = self.fadjlist[s]
+        index = np.searchsorted(search_adjlist, d)
+        self.fadjlist[s] = np.concatenate((search_adjlist[:index], np.array([d]), search_adjlist[index:]))
+        wlist = self.weightlist[s]
+        self.weightlist[s] = np.concatenate((wlist[:index], np.array([weight], dtype=np.float64), wlist[index:]))
+
+    def add_edge(self, s, d, add_nodes=False, weight=1.0):
+        nvv = self.nv
+        m = max(s, d)
+        if m >= nvv:
+            if not add_nodes:
+                return False
+            self.add_vertices((m - nvv) + 1)
+        search_adjlist = self.fadjlist[s]
+        index = np.searchsorted(search_adjlist, d)
+        if index < len(search_adjlist) and search_adjlist[index] == d:
+            return False # Edge already in graph
+        self._insert(s, d, weight)
+        self.ne += 1
+        if s == d:
+            return True #self loop
+        self._insert(d, s, weight)
+        return True
+
+    def add_edges_from(self, edge_iter, add_nodes=False):
+        for e in edge_iter:
+            self.add_edge(e[0], e[1], add_nodes)
+
+    def add_weighted_edges_from(self, edge_iter, add_nodes=False):
+        # edges of the form (s, d, weight)
+        for e in edge_iter:
+            self.add_edge(e[0], e[1], add_nodes, e[2])
+
+    def _delete(self, s, d):
+        search_adjlist = self.fadjlist[s]
+        index = np.searchsorted(search_adjlist, d)
+        self.fadjlist[s] = np.delete(search_adjlist, index)
+        self.weightlist[s] = np.delete(self.weightlist[s], index)
+
+    def rem_edge(self, s, d):
+        nvv = self.nv
+        if max(s, d) >= nvv:
+            return False
+        search_adjlist = self.fadjlist[s]
+        index = np.searchsorted(search_adjlist, d)
+        if not(index < len(search_adjlist) and search_adjlist[index] == d):
+            #edge not in graph
+            return False
+        self._delete(s, d)
+        self.ne -= 1
+        if s != d:
+            self._delete(d, s)
+        return True
+
+    def add_vertex(self):
+        #check for overflow?
+        self.fadjlist.append(np.empty(0, dtype=np.int64))
+        self.weightlist.append(np.empty(0, dtype=np.float64))
+
+    def add_vertices(self, n):
+        for _ in range(n):
+            self.add_vertex()
+
+    def has_edge(self, s, d):
+        if max(s, d) >= self.nv:
+            return False #edge out of bounds
+        adj = self.fadjlist[s]
+        index = np.searchsorted(adj, d)
+        return index < len(adj) and adj[index] == d
+
+    def has_edges(self, src, dst):
+        # vectorized has_edge over the pairs (src[i], dst[i])
+        return nnx_common.has_edges(self, src, dst)
+
+    def has_vertex(self, v):
+        if v >= self.nv:
+            return False
+        else:
+            return True
+
+    def rem_vertex(self, v):
+        n = self.nv - 1
+        if v > n:
+            return False
+        for d in self.neighbors(v).copy():
+            self.rem_edge(v, d)
+
+        if v != n:
+            # move the last vertex, with its weights, into slot v
+            neigs = self.neighbors(n).copy()
+            ws = self.weightlist[n].copy()
+            for d in neigs:
+                self.rem_edge(n, d)
+            for i in range(len(neigs)):
+                d = neigs[i]
+                if d == n:
+                    d = v
+                self.add_edge(v, d, False, ws[i])
+
+        self.fadjlist.pop()
+        self.weightlist.pop()
+        return True
+
+    def is_directed(self):
+        return False
+
+    def is_multigraph(self):
+        return False
+
+    def has_self_loops(self):
+        for v in range(self.nv):
+            if self.has_edge(v, v):
+                return True
+        return False
+
+    def self_loop_edges(self):
+        self_loops = []
+        for v in range(self.nv):
+            if self.has_edge(v, v):
+                self_loops.append((v, v))
+        return self_loops
+
+    def number_of_self_loops(self):
+        return nnx_common.number_of_self_loops(self)
+
+    def freeze(self):
+        # immutable SimpleWeightedGraphCSR snapshot, built in O(V + E);
+        # rows are already sorted, so the weights stay aligned
+        ne, offsets, indices = nnx_common.graph_to_csr(self)
+        return nnx_wcsr.SimpleWeightedGraphCSR((ne, offsets, indices, nnx_common.graph_weights(self)))
+
+    def _get_generator_function(self):
+        return SimpleWeightedGraphArray
+
+
+@numba.njit
+def swg_with_vertices(constructor=0):
+    # Create SimpleWeightedGraph with n vertices and 0 edges
+    fadjlist = numba.typed.List()
+    weightlist = numba.typed.List()
+    for _ in range(constructor):
+        fadjlist.append(np.empty(0, dtype=np.int64))
+        weightlist.append(np.empty(0, dtype=np.float64))
+    return _SimpleWeightedGraphArray(0, fadjlist, weightlist)
+
+@numba.njit
+def _from_weighted_csr_arrays(ne, offsets, indices, weights):
+    fadjlist = numba.typed.List()
+    weightlist = numba.typed.List()
+    for v in range(len(offsets) - 1):
+        fadjlist.append(indices[offsets[v]:offsets[v + 1]].copy())
+        weightlist.append(weights[offsets[v]:offsets[v + 1]].astype(np.float64))
+    return _SimpleWeightedGraphArray(ne, fadjlist, weightlist)
+
+@numba.njit
+def _from_weighted_csr_constructor_tuple(constructor):
+    ne, offsets, indices, weights = constructor
+    return _from_weighted_csr_arrays(ne, offsets, indices, weights)
+
+@numba.njit
+def _from_csr_constructor_tuple(constructor):
+    # unit weights
+    ne, offsets, indices = constructor
+    return _from_weighted_csr_arrays(ne, offsets, indices, np.ones(len(indices)))
+
+@numba.njit
+def _from_grapharray_constructor_tuple(constructor):
+    offsets, indices = nnx_common.fadjlist_to_csr(constructor[1])
+    return _from_weighted_csr_arrays(constructor[0], offsets, indices, np.ones(len(indices)))
+
+@numba.generated_jit(nopython=True)
+def SimpleWeightedGraphArray(constructor=0):
+    if isinstance(constructor, numba.types.Integer) or isinstance(constructor, numba.types.Omitted):
+        return swg_with_vertices
+    elif constructor == nnx_types.simplegrapharray_const_type:
+        return _from_grapharray_constructor_tuple
+    elif nnx_types.is_csr_const_type(constructor):
+        return _from_csr_constructor_tuple
+    elif nnx_types.is_weighted_csr_const_type(constructor):
+        return _from_weighted_csr_constructor_tuple
+    else:
+        raise Exception("Constructor with type {} Not Supported Yet".format(constructor))
@@ -4,4 +4,36 @@ import numpy as np
 def numpy_fadjlist_type():
     return numba.typeof((0, numba.typed.List([np.empty(0, dtype=np.int64)])))
 
-simplegrapharray_const_type = numpy_fadjlist_type()
\ No newline at end of file
+simplegrapharray_const_type = numpy_fadjlist_type()
+
+def _is_csr_tuple(constructor, narrays):
+    # (ne, arrays...) with any layout/readonly flavour of int64 arrays, so
+    # that slices and read-only memory maps can be passed without a copy
+    if not isinstance(constructor, numba.types.BaseTuple) or len(constructor) != narrays + 1:
+        return False
+    if not isinstance(constructor[0], numba.types.Integer):
+        return False
+    for i in range(1, narrays + 1):
+        arr = constructor[i]
+        if not isinstance(arr, numba.types.Array) or arr.ndim != 1:
+            return False
+        if arr.dtype != numba.types.int64:
+            return False
+    return True
+
+def is_csr_const_type(constructor):
+    # (ne, offsets, indices)
+    return _is_csr_tuple(constructor, 2)
+
+def is_bicsr_const_type(constructor):
+    # (ne, offsets, indices, boffsets, bindices) of a directed graph
+    return _is_csr_tuple(constructor, 4)
+
+def is_weighted_csr_const_type(constructor):
+    # (ne, offsets, indices, weights) with float64 weights aligned to indices
+    if not isinstance(constructor, numba.types.BaseTuple) or len(constructor) != 4:
+        return False
+    if not _is_csr_tuple(numba.types.Tuple(constructor.types[:3]), 2):
+        return False
+    w = constructor[3]
+    return isinstance(w, numba.types.Array) and w.ndim == 1 and w.dtype == numba.types.float64
@@ -1,6 +1,7 @@
 import numba
 import numpy as np
 import nnx
+import nnx.classes.common as nnx_common
 
 @numba.njit
 def from_numpy_matrix(adjm, create_using):
@@ -31,3 +32,25 @@ def from_edge_list(edge_list, create_using):
         g.add_edge(s, d)
     return g
 
+@numba.njit
+def from_edge_array(src, dst, n=None, create_using=nnx.SimpleGraphArray, weights=None):
+    """
+    from_edge_array(src, dst, n=None, create_using=SimpleGraphArray, weights=None)
+    Build a graph from the parallel integer arrays `src` and `dst`, where
+    `(src[i], dst[i])` is an edge. The adjacency is sorted, deduplicated and
+    (for undirected graphs) mirrored in bulk and handed to `create_using`
+    in a single constructor call, in O(E log E) and without per-edge
+    `add_edge` calls. `n` defaults to one more than the largest endpoint.
+    `weights`, aligned with `src`, requires a weighted graph class.
+    """
+    if n is None:
+        nvg = nnx_common.edge_array_nv(src, dst)
+    else:
+        nvg = n
+    directed = create_using(0).is_directed()
+    if weights is None:
+        ne, offsets, indices = nnx_common.edge_array_to_csr(src, dst, nvg, directed)
+        return create_using((ne, offsets, indices))
+    else:
+        ne, offsets, indices, w = nnx_common.weighted_edge_array_to_csr(src, dst, weights, nvg, directed)
+        return create_using((ne, offsets, indices, w))
@@ -0,0 +1,134 @@
+import numpy as np
+
+import nnx
+import nnx.classes.common as nnx_common
+
+_MAGIC = b'NNXGRAPH'
+_VERSION = 1
+_FLAG_DIRECTED = 1
+_FLAG_WEIGHTED = 2
+
+# fixed 64 byte little-endian header, followed by the offsets and indices arrays
+_HEADER_DTYPE = np.dtype([
+    ('magic', 'S8'),
+    ('version', '<u4'),
+    ('flags', '<u4'),
+    ('dtype', 'S8'),
+    ('nv', '<i8'),
+    ('ne', '<i8'),
+    ('nnz', '<i8'),
+    ('reserved', 'S16'),
+])
+
+def _csr_arrays(g):
+    if hasattr(g, 'offsets') and hasattr(g, 'indices'):
+        return g.ne, g.offsets, g.indices
+    return nnx_common.graph_to_csr(g)
+
+def _in_csr_arrays(g, offsets, indices):
+    if hasattr(g, 'boffsets') and hasattr(g, 'bindices'):
+        return g.boffsets, g.bindices
+    return nnx_common.transpose_csr(offsets, indices)
+
+def save_graph(g, path):
+    """Write a graph to `path` in the nnx binary format.
+
+    The file holds a 64 byte header (nv, ne, directedness and index dtype)
+    followed by the CSR offsets and indices arrays (and, for directed
+    graphs, the in-adjacency offsets and indices, or for weighted graphs
+    the float64 edge weights), so that `load_graph` can memory-map it
+    without parsing. Weighted directed graphs raise ValueError: nnx has no
+    weighted directed class for `load_graph` to return.
+
+    Parameters
+    ----------
+    g : nnx graph
+       Graph to write.
+    path : string
+       Filename to write.
+    """
+    weights = nnx_common.graph_weights(g)
+    if g.is_directed() and weights is not None:
+        raise ValueError("Weighted directed graphs are not supported by the binary format")
+    ne, offsets, indices = _csr_arrays(g)
+    arrays = [offsets, indices]
+    if g.is_directed():
+        arrays.extend(_in_csr_arrays(g, offsets, indices))
+    arrays = [np.asarray(a).astype('<i8', copy=False) for a in arrays]
+    offsets, indices = arrays[0], arrays[1]
+    if weights is not None:
+        arrays.append(np.asarray(weights).astype('<f8', copy=False))
+    header = np.zeros(1, dtype=_HEADER_DTYPE)
+    header['magic'] = _MAGIC
+    header['version'] = _VERSION
+    header['flags'] = ((_FLAG_DIRECTED if g.is_directed() else 0) |
+                       (_FLAG_WEIGHTED if weights is not None else 0))
+    header['dtype'] = offsets.dtype.str.encode('ascii')
+    header['nv'] = len(offsets) - 1
+    header['ne'] = ne
+    header['nnz'] = len(indices)
+    with open(path, 'wb') as f:
+        header.tofile(f)
+        for a in arrays:
+            a.tofile(f)
+
+def _read_array(path, dtype, offset, count, mmap):
+    if count == 0:
+        return np.empty(0, dtype=np.float64 if dtype.kind == 'f' else np.int64)
+    if mmap:
+        # read-only mapping: pages are shared by every process opening the file
+        arr = np.memmap(path, dtype=dtype, mode='r', offset=offset, shape=(count,))
+        arr = arr.view(np.ndarray)
+    else:
+        arr = np.fromfile(path, dtype=dtype, count=count, offset=offset)
+    if arr.dtype.kind == 'f':
+        return arr.astype(np.float64, copy=False)
+    if arr.dtype != np.int64:
+        arr = arr.astype(np.int64)
+    return arr
+
+def load_graph(path, mmap=True):
+    """Read a graph written by `save_graph`.
+
+    Parameters
+    ----------
+    path : string
+       Filename to read.
+    mmap : bool, optional
+       If True (default) the adjacency arrays are memory-mapped read-only
+       instead of being read into memory, so the graph opens in constant
+       time and its pages are shared between processes.
+
+    Returns
+    -------
+    A SimpleGraphCSR, or SimpleDiGraphCSR / SimpleWeightedGraphCSR for
+    directed / weighted graphs, backed by the file contents.
+    """
+    header = np.fromfile(path, dtype=_HEADER_DTYPE, count=1)
+    if len(header) != 1 or header['magic'][0] != _MAGIC:
+        raise ValueError("{} is not an nnx binary graph file".format(path))
+    if header['version'][0] > _VERSION:
+        raise ValueError("Unsupported nnx binary graph version {}".format(header['version'][0]))
+    flags = int(header['flags'][0])
+    if flags & ~(_FLAG_DIRECTED | _FLAG_WEIGHTED) or flags == _FLAG_DIRECTED | _FLAG_WEIGHTED:
+        raise ValueError("Unsupported nnx binary graph flags {}".format(flags))
+    dtype = np.dtype(header['dtype'][0].decode('ascii'))
+    nv = int(header['nv'][0])
+    ne = int(header['ne'][0])
+    nnz = int(header['nnz'][0])
+
+    offset = _HEADER_DTYPE.itemsize
+    offsets = _read_array(path, dtype, offset, nv + 1, mmap)
+    offset += (nv + 1) * dtype.itemsize
+    indices = _read_array(path, dtype, offset, nnz, mmap)
+    if flags & _FLAG_DIRECTED:
+        offset += nnz * dtype.itemsize
+        boffsets = _read_array(path, dtype, offset, nv + 1, mmap)
+        offset += (nv + 1) * dtype.itemsize
+        bindices = _read_array(path, dtype, offset, nnz, mmap)
+        return nnx.SimpleDiGraphCSR((ne, offsets, indices, boffsets, bindices))
+    if flags & _FLAG_WEIGHTED:
+        offset += nnz * dtype.itemsize
+        weights = _read_array(path, np.dtype('<f8'), offset, nnz, mmap)
+        return nnx.SimpleWeightedGraphCSR((ne, offsets, indices, weights))
+    return nnx.SimpleGraphCSR((ne, offsets, indices))
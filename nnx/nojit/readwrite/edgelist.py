@@ -1,5 +1,14 @@
+import bz2
+import codecs
+import gzip
+import io
+
+import numba
+import numpy as np
+
 import nnx
 
+
 def parse_edgelist(lines, comments='#', delimiter=None,
                    create_using=None):
     """Parse lines of an edge list representation of a graph.
@@ -13,6 +22,7 @@ def parse_edgelist(lines, comments='#', delimiter=None,
     delimiter : string, optional
        Separator for node labels
     create_using: NetworkX graph container, optional
+       A weighted container reads the third column as the edge weight.
 
     """
 
@@ -21,6 +31,7 @@ def parse_edgelist(lines, comments='#', delimiter=None,
         G=nnx.SimpleGraphArray()
     else:
         G=create_using()
+    weighted = _is_weighted(G)
 
     for line in lines:
         p=line.find(comments)
@@ -34,10 +45,236 @@ def parse_edgelist(lines, comments='#', delimiter=None,
             continue
         u=int(s.pop(0))
         v=int(s.pop(0))
-        d=s #TODO edge weights
-        G.add_edge(u, v, True)
+        if weighted and len(s):
+            G.add_edge(u, v, True, float(s[0]))
+        else:
+            G.add_edge(u, v, True)
     return G
 
+_NEWLINE = 10
+_INT64_MAX = np.iinfo(np.int64).max
+
+def _is_weighted(g):
+    return hasattr(g, 'neighbors_with_weights')
+
+@numba.njit
+def _is_separator(c, delimiter):
+    # whitespace always separates fields, as str.split would after int()
+    return c == delimiter or c == 32 or c == 9 or c == 13
+
+@numba.njit
+def _parse_float(buf, i, delimiter, comment):
+    # parse a decimal float token starting at buf[i]; return (value, end)
+    n = len(buf)
+    sign = 1.0
+    if buf[i] == 45 or buf[i] == 43: # '-' or '+'
+        if buf[i] == 45:
+            sign = -1.0
+        i += 1
+    mant = 0.0
+    ndigits = 0
+    scale = 0
+    while i < n and buf[i] >= 48 and buf[i] <= 57:
+        mant = mant * 10.0 + (np.int64(buf[i]) - 48)
+        ndigits += 1
+        i += 1
+    if i < n and buf[i] == 46: # '.'
+        i += 1
+        while i < n and buf[i] >= 48 and buf[i] <= 57:
+            mant = mant * 10.0 + (np.int64(buf[i]) - 48)
+            ndigits += 1
+            scale -= 1
+            i += 1
+    if ndigits == 0:
+        raise ValueError("Edge weights must be numbers")
+    if i < n and (buf[i] == 101 or buf[i] == 69): # 'e' or 'E'
+        i += 1
+        esign = 1
+        if i < n and (buf[i] == 45 or buf[i] == 43):
+            if buf[i] == 45:
+                esign = -1
+            i += 1
+        exp = 0
+        start = i
+        while i < n and buf[i] >= 48 and buf[i] <= 57:
+            if exp < 100000: # saturates, far beyond the float64 range
+                exp = exp * 10 + (np.int64(buf[i]) - 48)
+            i += 1
+        if i == start:
+            raise ValueError("Edge weights must be numbers")
+        scale += esign * exp
+    if i < n and buf[i] != _NEWLINE and buf[i] != comment and not _is_separator(buf[i], delimiter):
+        raise ValueError("Edge weights must be numbers")
+    # dividing by an exact power of ten rounds correctly for typical inputs
+    if scale < 0:
+        return sign * (mant / 10.0 ** (-scale)), i
+    return sign * (mant * 10.0 ** scale), i
+
+@numba.njit
+def _parse_edge_chunk(buf, comment, delimiter, weighted):
+    # (src, dst, weights) of every line in the uint8 buffer; comment and
+    # delimiter are byte values, or -1 for none
+    nlines = 1
+    for c in buf:
+        if c == _NEWLINE:
+            nlines += 1
+    src = np.empty(nlines, dtype=np.int64)
+    dst = np.empty(nlines, dtype=np.int64)
+    weights = np.empty(nlines if weighted else 0, dtype=np.float64)
+    ne = 0
+    n = len(buf)
+    i = 0
+    while i < n:
+        nfields = 0
+        u = 0
+        while i < n and buf[i] != _NEWLINE:
+            c = buf[i]
+            if _is_separator(c, delimiter):
+                i += 1
+                continue
+            if nfields == 2 and weighted and c != comment:
+                wv, i = _parse_float(buf, i, delimiter, comment)
+                weights[ne - 1] = wv
+                nfields += 1
+                continue
+            if c == comment or nfields >= 2:
+                # rest of the line is a comment or edge data
+                while i < n and buf[i] != _NEWLINE:
+                    i += 1
+                break
+            sign = 1
+            if c == 45 or c == 43: # '-' or '+'
+                if c == 45:
+                    sign = -1
+                i += 1
+            start = i
+            val = 0
+            while i < n and buf[i] >= 48 and buf[i] <= 57:
+                digit = np.int64(buf[i]) - 48
+                if val > (_INT64_MAX - digit) // 10:
+                    raise ValueError("Edge list node labels must fit in int64")
+                val = val * 10 + digit
+                i += 1
+            if i == start or (i < n and buf[i] != _NEWLINE and buf[i] != comment
+                              and not _is_separator(buf[i], delimiter)):
+                raise ValueError("Edge list node labels must be integers")
+            if nfields == 0:
+                u = sign * val
+            else:
+                src[ne] = u
+                dst[ne] = sign * val
+                if weighted:
+                    weights[ne] = 1.0
+                ne += 1
+            nfields += 1
+        i += 1
+    return src[:ne], dst[:ne], weights[:ne]
+
+def _is_sig(encoding):
+    # utf-8-sig writes a BOM in front of every encoded string and file
+    return codecs.lookup(encoding).name == 'utf-8-sig'
+
+def _byte_code(s, encoding):
+    if s is None:
+        return -1
+    if _is_sig(encoding):
+        encoding = 'utf-8'
+    b = s.encode(encoding)
+    if len(b) != 1:
+        raise ValueError("Only single-byte comment and delimiter markers are supported")
+    return b[0]
+
+def _ascii_compatible(encoding):
+    probe = b'0123456789+- \t\r\n'
+    try:
+        return probe.decode(encoding) == probe.decode('ascii')
+    except UnicodeDecodeError:
+        return False
+
+def _open_edgelist(path):
+    if hasattr(path, 'read'):
+        return path
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rb')
+    if path.endswith('.bz2'):
+        return bz2.open(path, 'rb')
+    return open(path, 'rb')
+
+def read_edgelist_arrays(path, comments='#', delimiter=None, encoding='utf-8',
+                         chunksize=1 << 24, weighted=False):
+    """Read the edges of an integer edge list file into NumPy arrays.
+
+    The file is read in blocks of `chunksize` bytes, cut at the last line
+    break, and every block is parsed by a single compiled call.
+
+    Parameters
+    ----------
+    path : file or string
+       File or filename to read. If a file is provided, it must be
+       opened in 'rb' mode.
+       Filenames ending in .gz or .bz2 will be uncompressed.
+    comments : string, optional
+       The single character used to indicate the start of a comment.
+    delimiter : string, optional
+       The single character used to separate values, in addition to
+       whitespace. The default is whitespace only.
+    encoding: string, optional
+       Specify which encoding to use when reading file. It must encode
+       digits and separators as ASCII.
+    chunksize : int, optional
+       Number of bytes parsed per compiled call.
+    weighted : bool, optional
+       Also parse the third column as float64 edge weights (1.0 where the
+       column is missing).
+
+    Returns
+    -------
+    src, dst : int64 arrays holding the first two columns of every edge line,
+       followed by a float64 weights array if `weighted` is True.
+    """
+    comment = _byte_code(comments, encoding)
+    delim = _byte_code(delimiter, encoding)
+    srcs = []
+    dsts = []
+    ws = []
+    f = _open_edgelist(path)
+    try:
+        tail = b''
+        if _is_sig(encoding):
+            tail = f.read(len(codecs.BOM_UTF8))
+            if tail == codecs.BOM_UTF8:
+                tail = b''
+        while True:
+            chunk = f.read(chunksize)
+            if not chunk:
+                break
+            if tail:
+                chunk = tail + chunk
+            cut = chunk.rfind(b'\n') + 1
+            tail = chunk[cut:]
+            if cut:
+                buf = np.frombuffer(memoryview(chunk)[:cut], dtype=np.uint8)
+                s, d, w = _parse_edge_chunk(buf, comment, delim, weighted)
+                srcs.append(s)
+                dsts.append(d)
+                ws.append(w)
+        if tail:
+            buf = np.frombuffer(tail, dtype=np.uint8)
+            s, d, w = _parse_edge_chunk(buf, comment, delim, weighted)
+            srcs.append(s)
+            dsts.append(d)
+            ws.append(w)
+    finally:
+        if f is not path:
+            f.close()
+    if not srcs:
+        srcs.append(np.empty(0, dtype=np.int64))
+        dsts.append(np.empty(0, dtype=np.int64))
+        ws.append(np.empty(0, dtype=np.float64))
+    if weighted:
+        return np.concatenate(srcs), np.concatenate(dsts), np.concatenate(ws)
+    return np.concatenate(srcs), np.concatenate(dsts)
+
 def read_edgelist(path, comments="#", delimiter=None, create_using=None, encoding='utf-8'):
     """Read a graph from a list of edges.
 
@@ -62,11 +299,24 @@ def read_edgelist(path, comments="#", delimiter=None, create_using=None, encodin
        Convert edge data from strings to specified type and use as 'weight'
     encoding: string, optional
        Specify which encoding to use when reading file.
-
-    
-    lines = (line.decode(encoding) for line in path)
     """
-    with open(path, 'rb') as f:
-        lines = (line.decode(encoding) for line in f)
-        return parse_edgelist(lines,comments=comments, delimiter=delimiter,
-                            create_using=create_using)
\ No newline at end of file
+    if not _ascii_compatible(encoding):
+        f = _open_edgelist(path)
+        lines = io.TextIOWrapper(f, encoding=encoding)
+        try:
+            return parse_edgelist(lines, comments=comments, delimiter=delimiter,
+                                  create_using=create_using)
+        finally:
+            if f is path:
+                lines.detach() # leave the caller's file open
+            else:
+                lines.close()
+    if create_using is None:
+        create_using = nnx.SimpleGraphArray
+    if _is_weighted(create_using(0)):
+        src, dst, w = read_edgelist_arrays(path, comments=comments, delimiter=delimiter,
+                                           encoding=encoding, weighted=True)
+        return nnx.from_edge_array(src, dst, create_using=create_using, weights=w)
+    src, dst = read_edgelist_arrays(path, comments=comments, delimiter=delimiter,
+                                    encoding=encoding)
+    return nnx.from_edge_array(src, dst, create_using=create_using)
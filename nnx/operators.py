@@ -1,36 +1,303 @@
 import numba
 import numpy as np
 
+import nnx.classes.common as nnx_common
+
+@numba.njit
+def _new_id(d, rl, sv, order):
+    # id of d in the subgraph or -1, read from the dense buffer rl, or when
+    # rl is None binary-searched in the sorted kept vertices sv
+    if rl is None:
+        j = np.searchsorted(sv, d)
+        if j < len(sv) and sv[j] == d:
+            return order[j]
+        return -1
+    return rl[d]
+
+@numba.njit
+def _relabeled_csr(g, vmap, rl, sv, order, weights):
+    # CSR adjacency of the subgraph induced by vmap, and the matching edge
+    # weights when weights holds those of g
+    nr = len(vmap)
+    offsets = np.zeros(nr + 1, dtype=np.int64)
+    for i in range(nr):
+        c = 0
+        for d in g.outneighbors(vmap[i]):
+            if _new_id(d, rl, sv, order) >= 0:
+                c += 1
+        offsets[i + 1] = offsets[i] + c
+    indices = np.empty(offsets[nr], dtype=np.int64)
+    if weights is None:
+        w = np.empty(0, dtype=np.float64)
+    else:
+        eoff = nnx_common.edge_offsets(g)
+        w = np.empty(offsets[nr], dtype=np.float64)
+    ne = 0
+    for i in range(nr):
+        k0 = offsets[i]
+        k = k0
+        if weights is not None:
+            e = eoff[vmap[i]]
+        for d in g.outneighbors(vmap[i]):
+            j = _new_id(d, rl, sv, order)
+            if j >= 0:
+                indices[k] = j
+                if weights is not None:
+                    w[k] = weights[e]
+                k += 1
+            if weights is not None:
+                e += 1
+        if weights is None:
+            indices[k0:k] = np.sort(indices[k0:k])
+        else:
+            perm = np.argsort(indices[k0:k], kind='mergesort')
+            indices[k0:k] = indices[k0:k][perm]
+            w[k0:k] = w[k0:k][perm]
+        row = indices[k0:k]
+        if g.is_directed():
+            ne += len(row)
+        else:
+            ne += len(row) - np.searchsorted(row, i)
+    return ne, offsets, indices, w
+
+@numba.njit
+def _rebuilt(g, ne, offsets, indices, weights, w):
+    # a graph of the type of g, with the edge weights w when g is weighted
+    if weights is None:
+        return g._get_generator_function()((ne, offsets, indices))
+    return g._get_generator_function()((ne, offsets, indices, w))
+
+@numba.njit
+def _dense_relabel(vmap, rl):
+    # mark vmap in the caller's all -1 buffer rl, restoring it on error
+    for i in range(len(vmap)):
+        v = vmap[i]
+        if rl[v] >= 0:
+            for j in range(i):
+                rl[vmap[j]] = -1
+            raise Exception("Vertices in subgraph list must be unique")
+        rl[v] = i
+
 @numba.njit
-def induced_subgraph(g, vlist):
+def induced_subgraph(g, vlist, relabel=None):
+    """
+    induced_subgraph(g, vlist, relabel=None)
+    Return `(h, vmap)`, where `h` is the graph of the type of `g` induced
+    by the unique vertices `vlist`, with vertex i of `h` being vertex
+    vmap[i] of `g`. Kept vertices are found by binary search in a sorted
+    copy of `vlist`; pass `relabel=np.full(g.nv, -1)` to use that dense
+    buffer instead, which is reset to -1 on return. Edge weights are
+    carried over.
+    """
     vlen = len(vlist)
-    h = g._get_generator_function()(vlen)
-    vset = set(vlist)
-    if len(vset) != vlen:
-        raise Exception("Vertices in subgraph list must be unique")
-    newid = dict()
-#     vmap = np.full(len(vlist), -1) #comment out vmap as it seems it's just vlist...
-    # NOTE: vmap might be important if passing a list of edges instead. might be good to keep it in that case
-    for i, v in enumerate(vlist):
-        newid[v] = i
-#         vmap[i] = v
-    
-    for s in vlist:
-        for d in g.outneighbors(s):
-            if d in vset and g.has_edge(s, d):
-                h.add_edge(newid[s], newid[d])
-    
-    return h #, vmap #commented out right now, can get through vlist?
-
-@numba.njit
-def intersect(g, h):
+    nvg = g.nv
+    vmap = np.empty(vlen, dtype=np.int64)
+    for i in range(vlen):
+        v = vlist[i]
+        if v < 0 or v >= nvg:
+            raise Exception("Vertices in subgraph list must be in the graph")
+        vmap[i] = v
+    weights = nnx_common.graph_weights(g)
+    if relabel is None:
+        order = np.argsort(vmap, kind='mergesort')
+        sv = vmap[order]
+        for i in range(1, vlen):
+            if sv[i] == sv[i - 1]:
+                raise Exception("Vertices in subgraph list must be unique")
+        ne, offsets, indices, w = _relabeled_csr(g, vmap, relabel, sv, order, weights)
+    else:
+        _dense_relabel(vmap, relabel)
+        ne, offsets, indices, w = _relabeled_csr(g, vmap, relabel, vmap, vmap, weights)
+        for v in vmap:
+            relabel[v] = -1
+    return _rebuilt(g, ne, offsets, indices, weights, w), vmap
+
+@numba.generated_jit(nopython=True)
+def _pair_weights(g, s, d):
+    # weights of the edges (s[i], d[i]) of a weighted g, None otherwise
+    if isinstance(g, numba.types.ClassInstanceType) and 'get_weight' in g.jit_methods:
+        def impl(g, s, d):
+            w = np.empty(len(s), dtype=np.float64)
+            for i in range(len(s)):
+                w[i] = g.get_weight(s[i], d[i])
+            return w
+        return impl
+    return lambda g, s, d: None
+
+@numba.njit
+def _edge_array_graph(g, s, d, nvg, w):
+    # a graph of the type of g from edge arrays, weighted when w is given
+    if w is None:
+        ne, offsets, indices = nnx_common.edge_array_to_csr(s, d, nvg, g.is_directed())
+        return g._get_generator_function()((ne, offsets, indices))
+    ne, offsets, indices, ws = nnx_common.weighted_edge_array_to_csr(s, d, w, nvg, g.is_directed())
+    return g._get_generator_function()((ne, offsets, indices, ws))
+
+@numba.njit
+def edge_subgraph(g, src, dst):
+    """
+    edge_subgraph(g, src, dst)
+    Return `(h, vmap)`, where `h` is the graph of the type of `g` made of
+    the edges (src[i], dst[i]) of `g` and their endpoints, with vertex i
+    of `h` being vertex vmap[i] of `g` (vmap is sorted). Pairs that are not
+    edges of `g` are ignored. Edge weights are carried over.
+    """
+    if len(src) != len(dst):
+        raise Exception("src and dst must have the same length")
+    keep = np.zeros(len(src), dtype=np.bool_)
+    for i in range(len(src)):
+        keep[i] = src[i] >= 0 and dst[i] >= 0 and g.has_edge(src[i], dst[i])
+    s = src[keep].astype(np.int64)
+    d = dst[keep].astype(np.int64)
+    vmap = np.unique(np.concatenate((s, d)))
+    s = np.searchsorted(vmap, s)
+    d = np.searchsorted(vmap, d)
+    return _edge_array_graph(g, s, d, len(vmap), _pair_weights(g, vmap[s], vmap[d])), vmap
+
+# set operations on the sorted neighbor arrays of two graphs
+_INTERSECT = 0
+_UNION = 1
+_DIFFERENCE = 2
+_SYMMETRIC_DIFFERENCE = 3
+
+@numba.generated_jit(nopython=True)
+def _sorted_csr(g):
+    # (offsets, indices) with sorted rows; CSR-backed graphs are not copied
+    if isinstance(g, numba.types.ClassInstanceType) and 'offsets' in g.struct:
+        return lambda g: (g.offsets, g.indices)
+    def impl(g):
+        _, offsets, indices = nnx_common.graph_to_csr(g)
+        return offsets, indices
+    return impl
+
+@numba.njit
+def _merge_rows(a, b, op, out, k, fill):
+    # merge sorted rows a and b by op, writing to out[k:] when fill;
+    # return the end position
+    i = 0
+    j = 0
+    la = len(a)
+    lb = len(b)
+    while i < la and j < lb:
+        x = a[i]
+        y = b[j]
+        if x == y:
+            keep = op == _INTERSECT or op == _UNION
+            i += 1
+            j += 1
+        elif x < y:
+            keep = op != _INTERSECT
+            i += 1
+        else:
+            x = y
+            keep = op == _UNION or op == _SYMMETRIC_DIFFERENCE
+            j += 1
+        if keep:
+            if fill:
+                out[k] = x
+            k += 1
+    if op != _INTERSECT:
+        for i in range(i, la):
+            if fill:
+                out[k] = a[i]
+            k += 1
+    if op == _UNION or op == _SYMMETRIC_DIFFERENCE:
+        for j in range(j, lb):
+            if fill:
+                out[k] = b[j]
+            k += 1
+    return k
+
+@numba.njit
+def _row(offsets, indices, v):
+    # row v of a CSR adjacency, empty past its last vertex
+    if v >= len(offsets) - 1:
+        return indices[0:0]
+    return indices[offsets[v]:offsets[v + 1]]
+
+@numba.njit
+def _set_operation_csr(goff, gind, hoff, hind, nr, op):
+    empty = np.empty(0, dtype=np.int64)
+    offsets = np.zeros(nr + 1, dtype=np.int64)
+    for v in range(nr):
+        offsets[v + 1] = _merge_rows(_row(goff, gind, v), _row(hoff, hind, v), op, empty, 0, False)
+    offsets = np.cumsum(offsets)
+    indices = np.empty(offsets[nr], dtype=np.int64)
+    for v in range(nr):
+        _merge_rows(_row(goff, gind, v), _row(hoff, hind, v), op, indices, offsets[v], True)
+    return offsets, indices
+
+@numba.njit(parallel=True)
+def _set_operation_csr_parallel(goff, gind, hoff, hind, nr, op):
+    empty = np.empty(0, dtype=np.int64)
+    offsets = np.zeros(nr + 1, dtype=np.int64)
+    for v in numba.prange(nr):
+        offsets[v + 1] = _merge_rows(_row(goff, gind, v), _row(hoff, hind, v), op, empty, 0, False)
+    offsets = np.cumsum(offsets)
+    indices = np.empty(offsets[nr], dtype=np.int64)
+    for v in numba.prange(nr):
+        _merge_rows(_row(goff, gind, v), _row(hoff, hind, v), op, indices, offsets[v], True)
+    return offsets, indices
+
+@numba.njit
+def _set_operation(g, h, nr, op, parallel):
     if g.is_multigraph() != h.is_multigraph():
-        raise Exception("Intersection requires both operands to be graphs or multigraphs")
-    gnv = g.nv
-    hnv = h.nv
-    
-    r = g._get_generator_function()(min(gnv, hnv))
-    for s, d in g.edges:
-        if h.has_edge(s, d):
-            r.add_edge(s, d)
-    return r
\ No newline at end of file
+        raise Exception("Set operations require both operands to be graphs or multigraphs")
+    if g.is_directed() != h.is_directed():
+        raise Exception("Set operations require both operands to be directed or undirected")
+    if nnx_common._has_weights(g) or nnx_common._has_weights(h):
+        raise Exception("Set operations are not implemented for weighted graphs")
+    goff, gind = _sorted_csr(g)
+    hoff, hind = _sorted_csr(h)
+    if parallel:
+        offsets, indices = _set_operation_csr_parallel(goff, gind, hoff, hind, nr, op)
+    else:
+        offsets, indices = _set_operation_csr(goff, gind, hoff, hind, nr, op)
+    if g.is_directed():
+        ne = len(indices)
+    else:
+        # count each undirected edge once, from its lower endpoint
+        ne = 0
+        for v in range(nr):
+            row = indices[offsets[v]:offsets[v + 1]]
+            ne += len(row) - np.searchsorted(row, v)
+    return g._get_generator_function()((ne, offsets, indices))
+
+@numba.njit
+def intersect(g, h, parallel=False):
+    """
+    intersect(g, h, parallel=False)
+    Return a graph of the type of `g`, with min(g.nv, h.nv) vertices and
+    the edges present in both `g` and `h`. Sorted neighbor arrays are
+    merged vertex by vertex: a counting pass sizes the output, a second
+    pass fills it. With `parallel=True` both passes run over vertices in
+    parallel. Edge weights are not carried over.
+    """
+    return _set_operation(g, h, min(g.nv, h.nv), _INTERSECT, parallel)
+
+@numba.njit
+def union(g, h, parallel=False):
+    """
+    union(g, h, parallel=False)
+    Return a graph of the type of `g`, with max(g.nv, h.nv) vertices and
+    the edges present in `g` or `h`. See `intersect`.
+    """
+    return _set_operation(g, h, max(g.nv, h.nv), _UNION, parallel)
+
+@numba.njit
+def difference(g, h, parallel=False):
+    """
+    difference(g, h, parallel=False)
+    Return a graph of the type of `g`, with g.nv vertices and the edges
+    of `g` that are not in `h`. See `intersect`.
+    """
+    return _set_operation(g, h, g.nv, _DIFFERENCE, parallel)
+
+@numba.njit
+def symmetric_difference(g, h, parallel=False):
+    """
+    symmetric_difference(g, h, parallel=False)
+    Return a graph of the type of `g`, with max(g.nv, h.nv) vertices and
+    the edges present in exactly one of `g` and `h`. See `intersect`.
+    """
+    return _set_operation(g, h, max(g.nv, h.nv), _SYMMETRIC_DIFFERENCE, parallel)
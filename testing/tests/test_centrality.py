@@ -0,0 +1,129 @@
+# Tests the centrality measures on small graphs with known values
+import nnx
+import numpy as np
+import pytest
+
+from nnx.classes.common import graph_weights
+
+def _random_graph(nv, ne, seed, cls, weighted=False):
+    # random graph with integer weights in [1, 3], so equal-length paths tie
+    rng = np.random.RandomState(seed)
+    src, dst = rng.randint(0, nv, ne), rng.randint(0, nv, ne)
+    if weighted:
+        return nnx.from_edge_array(src, dst, n=nv, create_using=cls, weights=rng.randint(1, 4, ne).astype(np.float64))
+    return nnx.from_edge_array(src, dst, n=nv, create_using=cls)
+
+def _reference_betweenness(g, weights):
+    # all-pairs distances and path counts, then sum sigma(s, v) sigma(v, t)
+    # / sigma(s, t) over the pairs (s, t) with v on a shortest s-t path
+    nv = g.nv
+    W = np.full((nv, nv), np.inf)
+    k = 0
+    for u in range(nv):
+        for v in g.outneighbors(u):
+            if u != v:
+                W[u, v] = weights[k]
+            k += 1
+    D = W.copy()
+    np.fill_diagonal(D, 0.0)
+    for m in range(nv):
+        D = np.minimum(D, D[:, m:m + 1] + D[m:m + 1, :])
+    sigma = np.zeros((nv, nv))
+    for s in range(nv):
+        sigma[s, s] = 1.0
+        for v in sorted(range(nv), key=lambda x: D[s, x]):
+            if v != s and D[s, v] < np.inf:
+                sigma[s, v] = sum(sigma[s, u] for u in range(nv) if D[s, u] + W[u, v] == D[s, v])
+    bc = np.zeros(nv)
+    for s in range(nv):
+        for t in range(nv):
+            if s == t or D[s, t] == np.inf:
+                continue
+            for v in range(nv):
+                if v != s and v != t and D[s, v] + D[v, t] == D[s, t]:
+                    bc[v] += sigma[s, v] * sigma[v, t] / sigma[s, t]
+    if not g.is_directed():
+        bc /= 2.0
+    return bc
+
+class TestBetweenness:
+
+    def test_path(self):
+        g = nnx.path_graph(4, create_using=nnx.SimpleGraphArray)
+        for parallel in (False, True):
+            bc = nnx.betweenness_centrality(g, parallel=parallel)
+            assert np.allclose(bc, [0.0, 2.0 / 3.0, 2.0 / 3.0, 0.0])
+        bc = nnx.betweenness_centrality(g, normalized=False)
+        assert np.allclose(bc, [0.0, 2.0, 2.0, 0.0])
+
+    def test_weighted_and_sampled(self):
+        g = nnx.balanced_tree(2, 3)
+        exact = nnx.betweenness_centrality(g)
+        ones = np.ones(2 * g.ne)
+        assert np.allclose(nnx.betweenness_centrality(g, weights=ones), exact)
+        assert np.allclose(nnx.betweenness_centrality(g, k=g.nv, seed=1), exact)
+
+    def test_weighted_graph(self):
+        g = _random_graph(25, 60, 0, nnx.SimpleWeightedGraphArray, weighted=True)
+        expected = _reference_betweenness(g, graph_weights(g))
+        for parallel in (False, True):
+            bc = nnx.betweenness_centrality(g, parallel=parallel, normalized=False)
+            assert np.allclose(bc, expected)
+
+    def test_directed(self):
+        g = _random_graph(25, 70, 1, nnx.SimpleDiGraphArray)
+        ones = np.ones(g.ne)
+        weights = np.random.RandomState(2).randint(1, 4, g.ne).astype(np.float64)
+        for w in (None, weights):
+            expected = _reference_betweenness(g, ones if w is None else w)
+            for parallel in (False, True):
+                bc = nnx.betweenness_centrality(g, weights=w, parallel=parallel, normalized=False)
+                assert np.allclose(bc, expected)
+        bc = nnx.betweenness_centrality(g, weights=weights)
+        assert np.allclose(bc, _reference_betweenness(g, weights) / ((g.nv - 1) * (g.nv - 2)))
+
+class TestDistanceCentrality:
+
+    def test_path(self):
+        g = nnx.path_graph(4, create_using=nnx.SimpleGraphArray)
+        for parallel in (False, True):
+            c = nnx.closeness_centrality(g, parallel=parallel)
+            assert np.allclose(c, [0.5, 0.75, 0.75, 0.5])
+            h = nnx.harmonic_centrality(g, parallel=parallel)
+            assert np.allclose(h, [11.0 / 6.0, 2.5, 2.5, 11.0 / 6.0])
+
+    def test_sampled(self):
+        g = nnx.balanced_tree(2, 3)
+        c, eps = nnx.approximate_closeness_centrality(g, g.nv, seed=3)
+        assert np.allclose(c, nnx.closeness_centrality(g))
+        assert eps > 0
+        h, eps = nnx.approximate_harmonic_centrality(g, g.nv, seed=3)
+        assert np.allclose(h, nnx.harmonic_centrality(g))
+
+    def test_sampled_directed(self):
+        # with every vertex a pivot the estimates are exact
+        g = _random_graph(30, 80, 4, nnx.SimpleDiGraphArray)
+        for parallel in (False, True):
+            c, _ = nnx.approximate_closeness_centrality(g, g.nv, seed=5, parallel=parallel)
+            assert np.allclose(c, nnx.closeness_centrality(g))
+            h, _ = nnx.approximate_harmonic_centrality(g, g.nv, seed=5, parallel=parallel)
+            assert np.allclose(h, nnx.harmonic_centrality(g))
+
+    def test_sampled_within_eps(self):
+        g = nnx.balanced_tree(2, 6)
+        exact_c = nnx.closeness_centrality(g)
+        exact_h = nnx.harmonic_centrality(g)
+        last = np.inf
+        for k in (8, 32, 96):
+            c, eps = nnx.approximate_closeness_centrality(g, k, seed=k)
+            assert 0 < eps < last
+            assert np.all(np.abs(1.0 / c - 1.0 / exact_c) <= eps)
+            h, eps = nnx.approximate_harmonic_centrality(g, k, seed=k)
+            assert np.all(np.abs(h - exact_h) <= eps)
+            last = eps
+
+    def test_sampled_bad_k(self):
+        g = nnx.path_graph(3, create_using=nnx.SimpleGraphArray)
+        for k in (0, 4):
+            with pytest.raises(Exception):
+                nnx.approximate_closeness_centrality(g, k)
@@ -0,0 +1,32 @@
+# Tests triangle counting and clustering coefficients
+import nnx
+import numpy as np
+
+class TestCluster:
+
+    def test_complete(self):
+        g = nnx.complete_graph(5)
+        assert np.array_equal(nnx.triangles(g), np.full(5, 6))
+        assert np.allclose(nnx.clustering(g), 1.0)
+        assert np.isclose(nnx.transitivity(g), 1.0)
+
+    def test_triangle_with_tail(self):
+        g = nnx.from_edge_array(np.array([0, 1, 0, 2, 3]), np.array([1, 2, 2, 3, 3]))
+        for parallel in (False, True):
+            assert np.array_equal(nnx.triangles(g, parallel), [1, 1, 1, 0])
+            assert np.allclose(nnx.clustering(g, parallel), [1.0, 1.0, 1.0 / 3.0, 0.0])
+        assert np.isclose(nnx.average_clustering(g), 7.0 / 12.0)
+        assert np.isclose(nnx.average_clustering(g, count_zeros=False), 7.0 / 9.0)
+        assert np.isclose(nnx.transitivity(g), 0.6)
+
+    def test_random(self):
+        rng = np.random.RandomState(0)
+        g = nnx.from_edge_array(rng.randint(0, 40, 300), rng.randint(0, 40, 300), n=40)
+        A = np.zeros((40, 40), dtype=np.int64)
+        for u in range(40):
+            for v in g.neighbors(u):
+                if u != v:
+                    A[u, v] = 1
+        expected = np.diag(A @ A @ A) // 2
+        for parallel in (False, True):
+            assert np.array_equal(nnx.triangles(g, parallel), expected)
@@ -0,0 +1,120 @@
+# Tests the connected component engines against a plain python search
+import nnx
+import numpy as np
+import pytest
+
+def _random_edges(nv, ne, seed):
+    rng = np.random.RandomState(seed)
+    return rng.randint(0, nv, ne), rng.randint(0, nv, ne)
+
+def _reference_labels(nv, src, dst):
+    # weakly connected labels numbered by smallest member vertex
+    adj = [[] for _ in range(nv)]
+    for s, d in zip(src, dst):
+        adj[s].append(d)
+        adj[d].append(s)
+    labels = np.full(nv, -1)
+    k = 0
+    for u in range(nv):
+        if labels[u] != -1:
+            continue
+        labels[u] = k
+        stack = [u]
+        while stack:
+            for v in adj[stack.pop()]:
+                if labels[v] == -1:
+                    labels[v] = k
+                    stack.append(v)
+        k += 1
+    return labels
+
+class TestComponentLabels:
+
+    def test_engines_agree_with_reference(self):
+        src, dst = _random_edges(300, 200, 0)
+        expected = _reference_labels(300, src, dst)
+        for cls in (nnx.SimpleGraphArray, nnx.SimpleDiGraphArray):
+            g = nnx.from_edge_array(src, dst, n=300, create_using=cls)
+            for parallel in (False, True):
+                labels, sizes = nnx.connected_component_labels(g, parallel)
+                assert labels.dtype == np.int32
+                assert np.array_equal(labels, expected)
+                assert np.array_equal(sizes, np.bincount(expected))
+
+    def test_directed_chain_is_weakly_connected(self):
+        g = nnx.from_edge_array(np.array([3, 2, 1]), np.array([2, 1, 0]), create_using=nnx.SimpleDiGraphArray)
+        for parallel in (False, True):
+            labels, sizes = nnx.connected_component_labels(g, parallel)
+            assert np.array_equal(labels, [0, 0, 0, 0])
+            assert np.array_equal(sizes, [4])
+
+    def test_edge_array(self):
+        src, dst = _random_edges(100, 60, 1)
+        labels, sizes = nnx.edge_array_component_labels(src, dst, 120)
+        assert np.array_equal(labels, _reference_labels(120, src, dst))
+        assert sizes.sum() == 120
+        labels, _ = nnx.edge_array_component_labels(np.array([4]), np.array([1]))
+        assert np.array_equal(labels, [0, 1, 2, 3, 1])
+        with pytest.raises(Exception, match='same length'):
+            nnx.edge_array_component_labels(np.array([0, 1]), np.array([1]))
+
+class TestDynamicConnectivity:
+
+    def _check(self, dc):
+        labels, sizes = nnx.connected_component_labels(dc.graph)
+        assert dc.number_of_components() == len(sizes)
+        first = np.full(len(sizes), -1)
+        for v in range(dc.graph.nv):
+            if first[labels[v]] == -1:
+                first[labels[v]] = v
+            assert dc.component_of(v) == first[labels[v]]
+
+    def test_inserts_and_removals(self):
+        rng = np.random.RandomState(2)
+        dc = nnx.DynamicConnectivity(nnx.SimpleGraphArray(40))
+        self._check(dc)
+        for s, d in rng.randint(0, 40, (30, 2)):
+            dc.add_edge(s, d)
+        self._check(dc)
+        assert dc.same_component(0, 0)
+        for s, d in rng.randint(0, 40, (30, 2)):
+            dc.rem_edge(s, d)
+        self._check(dc)
+        dc.add_edge(3, 39)
+        dc.add_edge(39, 1)
+        dc.rem_vertex(3)
+        # the last vertex moved into slot 3 and took its edges along
+        g = dc.graph
+        assert g.nv == 39
+        assert g.has_edge(3, 1)
+        assert all(len(g.neighbors(v)) == 0 or g.neighbors(v).max() < 39 for v in range(39))
+        assert g.ne == sum(len(g.neighbors(v)) + (v in g.neighbors(v)) for v in range(39)) // 2
+        self._check(dc)
+
+    def test_grows_with_add_nodes(self):
+        dc = nnx.DynamicConnectivity(nnx.SimpleGraphArray(2))
+        assert not dc.add_edge(0, 5)
+        assert dc.add_edge(0, 5, True)
+        dc.add_vertices(3)
+        assert dc.graph.nv == 9
+        assert dc.number_of_components() == 8
+        assert dc.same_component(0, 5)
+        assert not dc.same_component(0, 8)
+        self._check(dc)
+
+    def test_ids_beyond_nv(self):
+        # parent has spare capacity after growing, but those ids are not vertices
+        dc = nnx.DynamicConnectivity(nnx.SimpleGraphArray(3))
+        dc.add_vertex()
+        assert len(dc.parent) > dc.graph.nv
+        assert not dc.same_component(4, 4)
+        with pytest.raises(Exception, match='not in the graph'):
+            dc.component_of(4)
+
+    def test_direct_mutation_with_mark_dirty(self):
+        dc = nnx.DynamicConnectivity(nnx.from_edge_array(np.array([0, 2]), np.array([1, 3])))
+        assert dc.number_of_components() == 2
+        dc.graph.add_edge(1, 2)
+        dc.mark_dirty()
+        assert dc.number_of_components() == 1
+        self._check(dc)
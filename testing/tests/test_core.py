@@ -0,0 +1,25 @@
+# Tests core numbers and k-cores
+import nnx
+import numpy as np
+
+class TestCore:
+
+    def test_core_number(self):
+        g = nnx.from_edge_array(np.array([0, 1, 0, 2, 3]), np.array([1, 2, 2, 3, 4]))
+        assert np.array_equal(nnx.core_number(g), [2, 2, 2, 1, 1])
+        h, vmap = nnx.k_core(g)
+        assert np.array_equal(vmap, [0, 1, 2])
+        assert h.ne == 3
+        h, vmap = nnx.k_core(g, 1)
+        assert h.nv == 5
+
+    def test_k_core_keeps_weights(self):
+        src = np.array([0, 1, 0, 2, 3])
+        dst = np.array([1, 2, 2, 3, 4])
+        for cls in (nnx.SimpleWeightedGraphArray, nnx.SimpleWeightedGraphCSR):
+            g = nnx.from_edge_array(src, dst, create_using=cls, weights=np.array([2.5, 1.5, 4.0, 1.0, 1.0]))
+            h, vmap = nnx.k_core(g)
+            assert np.array_equal(vmap, [0, 1, 2])
+            assert h.get_weight(0, 1) == 2.5
+            assert h.get_weight(2, 1) == 1.5
+            assert h.get_weight(0, 2) == 4.0
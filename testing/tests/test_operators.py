@@ -0,0 +1,82 @@
+# Tests the graph set operators
+import nnx
+import numpy as np
+import pytest
+
+def _edge_set(g):
+    return {(s, d) for s in range(g.nv) for d in g.neighbors(s) if s <= d}
+
+class TestSetOperators:
+
+    def test_operators(self):
+        g = nnx.from_edge_array(np.array([0, 1, 2, 3]), np.array([1, 2, 3, 3]))
+        h = nnx.from_edge_array(np.array([0, 2, 4]), np.array([1, 3, 5]))
+        a = _edge_set(g)
+        b = _edge_set(h)
+        for parallel in (False, True):
+            r = nnx.intersect(g, h, parallel)
+            assert r.nv == 4 and _edge_set(r) == a & b and r.ne == len(a & b)
+            r = nnx.union(g, h, parallel)
+            assert r.nv == 6 and _edge_set(r) == a | b and r.ne == len(a | b)
+            r = nnx.difference(g, h, parallel)
+            assert r.nv == 4 and _edge_set(r) == a - b and r.ne == len(a - b)
+            r = nnx.symmetric_difference(g, h, parallel)
+            assert _edge_set(r) == a ^ b and r.ne == len(a ^ b)
+
+    def test_rejects_weighted(self):
+        g = nnx.from_edge_array(np.array([0, 1]), np.array([1, 2]))
+        w = nnx.from_edge_array(np.array([0, 1]), np.array([1, 2]), create_using=nnx.SimpleWeightedGraphArray,
+                                weights=np.array([2.5, 3.0]))
+        for op in (nnx.intersect, nnx.union, nnx.difference, nnx.symmetric_difference):
+            with pytest.raises(Exception):
+                op(w, w)
+            with pytest.raises(Exception):
+                op(g, w)
+
+class TestSubgraphs:
+
+    def test_induced_subgraph(self):
+        g = nnx.balanced_tree(2, 3)
+        vlist = np.array([4, 1, 9, 0, 10])
+        h, vmap = nnx.induced_subgraph(g, vlist)
+        assert np.array_equal(vmap, vlist)
+        assert h.nv == 5
+        expected = {(i, j) for i in range(5) for j in range(5)
+                    if i <= j and g.has_edge(vmap[i], vmap[j])}
+        assert _edge_set(h) == expected
+        assert h.ne == len(expected)
+        # a dense relabel buffer gives the same graph and is left all -1
+        relabel = np.full(g.nv, -1)
+        k, kmap = nnx.induced_subgraph(g, vlist, relabel)
+        assert np.array_equal(kmap, vmap)
+        assert _edge_set(k) == expected
+        assert np.all(relabel == -1)
+        for bad in (np.array([1, 4, 1]), np.array([1, 99])):
+            for buf in (None, relabel):
+                with pytest.raises(Exception):
+                    nnx.induced_subgraph(g, bad, buf)
+                assert np.all(relabel == -1)
+
+    def test_edge_subgraph(self):
+        g = nnx.balanced_tree(2, 3)
+        h, vmap = nnx.edge_subgraph(g, np.array([0, 4, 2]), np.array([2, 9, 3]))
+        assert np.array_equal(vmap, np.array([0, 2, 4, 9]))
+        assert _edge_set(h) == {(0, 1), (2, 3)}
+
+    def test_weighted(self):
+        src = np.array([0, 1, 2, 3, 0])
+        dst = np.array([1, 2, 3, 0, 2])
+        ws = np.array([2.5, 1.0, 3.5, 4.0, 6.0])
+        for cls in (nnx.SimpleWeightedGraphArray, nnx.SimpleWeightedGraphCSR):
+            g = nnx.from_edge_array(src, dst, create_using=cls, weights=ws)
+            for buf in (None, np.full(g.nv, -1)):
+                h, vmap = nnx.induced_subgraph(g, np.array([2, 0, 3]), buf)
+                assert h.ne == 3
+                for i in range(h.nv):
+                    for j in h.neighbors(i):
+                        assert h.get_weight(i, j) == g.get_weight(vmap[i], vmap[j])
+            h, vmap = nnx.edge_subgraph(g, np.array([3, 1]), np.array([0, 2]))
+            assert np.array_equal(vmap, [0, 1, 2, 3])
+            assert h.ne == 2
+            assert h.get_weight(0, 3) == 4.0
+            assert h.get_weight(2, 1) == 1.0
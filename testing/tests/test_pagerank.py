@@ -0,0 +1,71 @@
+# Tests the PageRank variants against a dense power iteration
+import nnx
+import numpy as np
+
+SRC = np.array([0, 0, 1, 2, 2, 3, 4])
+DST = np.array([1, 2, 2, 0, 3, 4, 3])
+
+def _digraph():
+    # vertex 5 has no out-edges
+    return nnx.from_edge_array(SRC, DST, n=6, create_using=nnx.SimpleDiGraphArray)
+
+def _dense_pagerank(nv, src, dst, w, alpha=0.85, p=None):
+    if p is None:
+        p = np.full(nv, 1.0 / nv)
+    M = np.zeros((nv, nv))
+    for s, d, x in zip(src, dst, w):
+        M[d, s] += x
+    outw = M.sum(axis=0)
+    dangling = outw == 0
+    M[:, ~dangling] /= outw[~dangling]
+    x = np.full(nv, 1.0 / nv)
+    for _ in range(1000):
+        x = alpha * (M @ x) + (1 - alpha + alpha * x[dangling].sum()) * p
+    return x
+
+class TestPagerankSpmv:
+
+    def test_against_dense(self):
+        g = _digraph()
+        x, residuals, converged = nnx.pagerank_spmv(g, e=1e-12, n=500)
+        assert converged
+        assert np.allclose(x, _dense_pagerank(6, SRC, DST, np.ones(7)), atol=1e-9)
+        assert np.allclose(x, nnx.pagerank(g, e=1e-12, n=500), atol=1e-9)
+
+    def test_warm_start(self):
+        g = _digraph()
+        x, cold, _ = nnx.pagerank_spmv(g, e=1e-10, n=500)
+        y, warm, converged = nnx.pagerank_spmv(g, e=1e-10, n=500, x0=x)
+        assert converged
+        assert len(warm) < len(cold)
+        assert np.allclose(x, y, atol=1e-8)
+
+    def test_zero_out_weight_is_dangling(self):
+        g = _digraph()
+        # the edges are stored in source order, so vertex 4's only
+        # out-edge (4, 3) is the last entry
+        w = np.array([1.0, 2.0, 1.0, 1.0, 3.0, 1.0, 0.0])
+        x, _, converged = nnx.pagerank_spmv(g, e=1e-12, n=500, weights=w)
+        assert converged
+        assert np.all(np.isfinite(x))
+        assert np.allclose(x, _dense_pagerank(6, SRC, DST, w), atol=1e-9)
+
+class TestPagerankParallel:
+
+    def test_parallel_matches_serial(self):
+        for g in (_digraph(), nnx.balanced_tree(2, 5)):
+            serial = nnx.pagerank(g, e=1e-12, n=500)
+            assert np.allclose(nnx.pagerank(g, e=1e-12, n=500, parallel=True), serial, atol=1e-9)
+
+    def test_personalized_batch(self):
+        g = _digraph()
+        seeds = np.zeros((6, 3))
+        seeds[0, 0] = 1.0
+        seeds[3, 1] = 2.0
+        seeds[:, 2] = 1.0
+        X, residuals, converged = nnx.personalized_pagerank_batch(g, seeds, 0.85, 500, 1e-12)
+        assert converged
+        assert residuals.shape[1] == 3
+        for j in range(3):
+            x, _, _ = nnx.pagerank_spmv(g, e=1e-12, n=500, personalization=seeds[:, j])
+            assert np.allclose(X[:, j], x, atol=1e-9)
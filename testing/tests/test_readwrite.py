@@ -0,0 +1,96 @@
+# Tests the edge list and binary graph formats
+import bz2
+import codecs
+import gzip
+import pytest
+import nnx
+import numpy as np
+
+class TestBinaryFormat:
+
+    def test_roundtrip(self, tmp_path):
+        g = nnx.balanced_tree(3, 3)
+        path = str(tmp_path / "tree.nnx")
+        nnx.save_graph(g, path)
+        for mmap in (True, False):
+            h = nnx.load_graph(path, mmap=mmap)
+            assert h.nv == g.nv
+            assert h.ne == g.ne
+            for v in range(g.nv):
+                assert np.array_equal(h.neighbors(v), g.neighbors(v))
+            assert np.allclose(nnx.pagerank(h), nnx.pagerank(g))
+            assert np.array_equal(nnx.bfs_traversal(h, [0]), nnx.bfs_traversal(g, [0]))
+
+    def test_directed_roundtrip(self, tmp_path):
+        g = nnx.from_edge_array(np.array([0, 0, 1, 2, 3, 3]), np.array([1, 2, 2, 0, 3, 4]),
+                                create_using=nnx.SimpleDiGraphArray)
+        path = str(tmp_path / "digraph.nnx")
+        nnx.save_graph(g, path)
+        for mmap in (True, False):
+            h = nnx.load_graph(path, mmap=mmap)
+            assert h.is_directed()
+            assert h.nv == g.nv
+            assert h.ne == g.ne
+            for v in range(g.nv):
+                assert np.array_equal(h.outneighbors(v), g.outneighbors(v))
+                assert np.array_equal(h.inneighbors(v), g.inneighbors(v))
+
+    def test_rejects_bad_files(self, tmp_path):
+        path = str(tmp_path / "bad.nnx")
+        with open(path, 'wb') as f:
+            f.write(b"NOTAGRAPH" + bytes(64))
+        with pytest.raises(ValueError):
+            nnx.load_graph(path)
+
+EDGELIST = b"# header\n0 1\n\n1 2 # trailing comment\n  2\t3\n3 0\n"
+
+class TestEdgelist:
+
+    def test_chunks(self, tmp_path):
+        path = tmp_path / "g.txt"
+        path.write_bytes(EDGELIST)
+        for chunksize in (1, 3, 7, 1 << 24):
+            src, dst = nnx.read_edgelist_arrays(str(path), chunksize=chunksize)
+            assert np.array_equal(src, [0, 1, 2, 3])
+            assert np.array_equal(dst, [1, 2, 3, 0])
+
+    def test_no_trailing_newline_and_delimiter(self, tmp_path):
+        path = tmp_path / "g.csv"
+        path.write_bytes(b"0,1\n1,2")
+        src, dst = nnx.read_edgelist_arrays(str(path), delimiter=',')
+        assert np.array_equal(src, [0, 1])
+        assert np.array_equal(dst, [1, 2])
+
+    def test_compressed(self, tmp_path):
+        for ext, mod in (('.gz', gzip), ('.bz2', bz2)):
+            path = str(tmp_path / ("g.txt" + ext))
+            with mod.open(path, 'wb') as f:
+                f.write(EDGELIST)
+            g = nnx.read_edgelist(path)
+            assert g.ne == 4
+            assert g.has_edge(3, 0)
+            with mod.open(path, 'wb') as f:
+                f.write(EDGELIST.decode('ascii').encode('utf-16'))
+            g = nnx.read_edgelist(path, encoding='utf-16')
+            assert g.ne == 4
+            assert g.has_edge(2, 3)
+
+    def test_bom(self, tmp_path):
+        path = tmp_path / "g.txt"
+        path.write_bytes(codecs.BOM_UTF8 + EDGELIST)
+        for chunksize in (1, 1 << 24):
+            src, dst = nnx.read_edgelist_arrays(str(path), encoding='utf-8-sig', chunksize=chunksize)
+            assert np.array_equal(src, [0, 1, 2, 3])
+            assert np.array_equal(dst, [1, 2, 3, 0])
+        path.write_bytes(b"0 1\n1 2\n")
+        g = nnx.read_edgelist(str(path), encoding='utf-8-sig')
+        assert g.ne == 2
+
+    def test_errors(self, tmp_path):
+        path = tmp_path / "g.txt"
+        path.write_bytes(b"0 99999999999999999999\n")
+        with pytest.raises(ValueError):
+            nnx.read_edgelist_arrays(str(path))
+        path.write_bytes(b"0 x\n")
+        with pytest.raises(ValueError):
+            nnx.read_edgelist_arrays(str(path))
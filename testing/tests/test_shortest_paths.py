@@ -0,0 +1,166 @@
+# Tests the weighted single-source searches against a plain python Dijkstra
+import heapq
+
+import nnx
+import numpy as np
+import pytest
+
+from nnx.algorithms.shortest_paths.weighted import _heap_push_or_decrease, _heap_pop
+
+def _random_weighted(nv, ne, seed, directed, integral=False):
+    # random graph with one weight per stored edge, in adjacency order;
+    # both directions of an undirected edge get the same weight
+    rng = np.random.RandomState(seed)
+    cls = nnx.SimpleDiGraphArray if directed else nnx.SimpleGraphArray
+    g = nnx.from_edge_array(rng.randint(0, nv, ne), rng.randint(0, nv, ne), n=nv, create_using=cls)
+    if integral:
+        W = rng.randint(0, 6, (nv, nv)).astype(np.float64)
+    else:
+        W = rng.uniform(0.1, 5.0, (nv, nv))
+    if not directed:
+        W = np.minimum(W, W.T)
+    return g, np.array([W[u, v] for u in range(nv) for v in g.outneighbors(u)])
+
+def _reference_dists(g, srcs, weights):
+    adj = []
+    k = 0
+    for u in range(g.nv):
+        row = []
+        for v in g.outneighbors(u):
+            row.append((v, weights[k]))
+            k += 1
+        adj.append(row)
+    dists = np.full(g.nv, np.inf)
+    H = []
+    for s in srcs:
+        dists[s] = 0.0
+        H.append((0.0, s))
+    heapq.heapify(H)
+    while H:
+        d, u = heapq.heappop(H)
+        if d > dists[u]:
+            continue
+        for v, w in adj[u]:
+            if d + w < dists[v]:
+                dists[v] = d + w
+                heapq.heappush(H, (d + w, v))
+    return dists
+
+def _check_parents(g, weights, parents, dists, srcs):
+    eoff = nnx.classes.common.edge_offsets(g)
+    for v in range(g.nv):
+        if v in srcs or dists[v] == np.inf or dists[v] == -1:
+            assert parents[v] == -1
+            continue
+        u = parents[v]
+        k = eoff[u] + list(g.outneighbors(u)).index(v)
+        assert np.isclose(dists[u] + weights[k], dists[v])
+
+class TestIndexedHeap:
+
+    def test_pops_in_key_order(self):
+        rng = np.random.RandomState(0)
+        n = 50
+        keys = rng.uniform(0, 100, n)
+        heap = np.empty(n, dtype=np.int64)
+        pos = np.full(n, -1, dtype=np.int64)
+        size = 0
+        for v in range(n):
+            size = _heap_push_or_decrease(heap, pos, keys, size, v)
+        # lower some keys while they are queued
+        for v in range(0, n, 3):
+            keys[v] -= 50.0
+            size = _heap_push_or_decrease(heap, pos, keys, size, v)
+        assert size == n
+        out = []
+        while size > 0:
+            v, size = _heap_pop(heap, pos, keys, size)
+            assert pos[v] == -2
+            out.append(v)
+        assert sorted(out) == list(range(n))
+        assert np.all(np.diff(keys[out]) >= 0)
+
+class TestDijkstraWeighted:
+
+    def test_against_reference(self):
+        for directed in (False, True):
+            g, weights = _random_weighted(60, 120, 1, directed)
+            srcs = np.array([0, 17])
+            parents, dists, _ = nnx.dijkstra_shortest_paths_weighted(g, srcs, weights)
+            assert np.allclose(dists, _reference_dists(g, srcs, weights))
+            _check_parents(g, weights, parents, dists, srcs)
+
+    def test_unit_weights_and_allpaths(self):
+        # 0 reaches 3 through 1 and through 2
+        g = nnx.from_edge_array(np.array([0, 0, 1, 2]), np.array([1, 2, 3, 3]))
+        parents, dists, preds = nnx.dijkstra_shortest_paths_weighted(g, np.array([0]), allpaths=True)
+        assert np.array_equal(dists, [0.0, 1.0, 1.0, 2.0])
+        assert sorted(preds[3]) == [1, 2]
+        assert len(preds[0]) == 0
+        _, _, preds = nnx.dijkstra_shortest_paths_weighted(g, np.array([0]))
+        assert len(preds) == 0
+
+    def test_rejects_bad_weights(self):
+        g = nnx.from_edge_array(np.array([0]), np.array([1]))
+        with pytest.raises(Exception, match='one entry per edge'):
+            nnx.dijkstra_shortest_paths_weighted(g, np.array([0]), np.ones(3))
+        with pytest.raises(Exception, match='non-negative'):
+            nnx.dijkstra_shortest_paths_weighted(g, np.array([0]), np.array([1.0, -1.0]))
+
+class TestDial:
+
+    def test_against_reference(self):
+        for directed in (False, True):
+            g, weights = _random_weighted(60, 120, 2, directed, integral=True)
+            srcs = np.array([5])
+            parents, dists, _ = nnx.dial_shortest_paths(g, srcs, weights)
+            expected = _reference_dists(g, srcs, weights)
+            reached = expected != np.inf
+            assert np.array_equal(dists[reached], expected[reached])
+            assert np.all(dists[~reached] == -1)
+            _check_parents(g, weights, parents, dists, srcs)
+            heap_parents, heap_dists, _ = nnx.dijkstra_shortest_paths_weighted(g, srcs, weights)
+            assert np.array_equal(dists[reached], heap_dists[reached])
+
+    def test_rejects_fractional_weights(self):
+        g = nnx.from_edge_array(np.array([0]), np.array([1]))
+        with pytest.raises(Exception, match='integer edge weights'):
+            nnx.dial_shortest_paths(g, np.array([0]), np.array([1.5, 1.5]))
+
+def _check_path(g, weights, path, s, t, d):
+    eoff = nnx.classes.common.edge_offsets(g)
+    assert path[0] == s and path[-1] == t
+    total = 0.0
+    for u, v in zip(path[:-1], path[1:]):
+        assert g.has_edge(u, v)
+        total += 1.0 if weights is None else weights[eoff[u] + list(g.outneighbors(u)).index(v)]
+    assert np.isclose(total, d)
+
+class TestShortestPath:
+
+    def test_modes_against_reference(self):
+        pairs = [(0, 9), (3, 40), (12, 12), (7, 59), (25, 2)]
+        for directed in (False, True):
+            g, weights = _random_weighted(60, 100, 3, directed)
+            sc = nnx.shortest_path_scratch(g)
+            for w in (None, weights):
+                ref_w = np.ones(len(weights)) if w is None else w
+                for s, t in pairs:
+                    expected = _reference_dists(g, [s], ref_w)[t]
+                    for bidirectional in (False, True):
+                        d = nnx.shortest_path_length(g, s, t, w, bidirectional)
+                        assert np.isclose(d, expected) or d == expected == np.inf
+                        # reused scratch gives the same answer as a fresh one
+                        path = nnx.shortest_path(g, s, t, w, bidirectional, sc)
+                        if expected == np.inf:
+                            assert len(path) == 0
+                        else:
+                            _check_path(g, w, path, s, t, expected)
+
+    def test_scratch_checks(self):
+        g = nnx.from_edge_array(np.array([0, 1]), np.array([1, 2]))
+        sc = nnx.shortest_path_scratch(nnx.from_edge_array(np.array([0]), np.array([1])))
+        with pytest.raises(Exception, match='different graph'):
+            nnx.shortest_path(g, 0, 2, None, False, sc)
+        with pytest.raises(Exception, match='vertices of the graph'):
+            nnx.shortest_path(g, 0, 3)
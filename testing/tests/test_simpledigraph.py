@@ -0,0 +1,93 @@
+# Tests the directed graph classes against a python edge set
+import nnx
+import numpy as np
+
+from nnx.classes.common import transpose_csr
+
+SRC = np.array([0, 0, 1, 2, 3, 3, 4, 5])
+DST = np.array([1, 2, 2, 0, 3, 4, 1, 4])
+DIGRAPH_CLASSES = (nnx.SimpleDiGraphSet, nnx.SimpleDiGraphList, nnx.SimpleDiGraphArray, nnx.SimpleDiGraphCSR)
+
+def _check(g, edges):
+    assert g.is_directed()
+    assert g.ne == len(edges)
+    for v in range(g.nv):
+        outs = sorted(d for s, d in edges if s == v)
+        ins = sorted(s for s, d in edges if d == v)
+        assert sorted(g.outneighbors(v)) == outs
+        assert sorted(g.inneighbors(v)) == ins
+        assert g.outdegree(v) == len(outs)
+        assert g.indegree(v) == len(ins)
+        assert g.degree(v) == len(outs) + len(ins)
+    for s in range(g.nv):
+        for d in range(g.nv):
+            assert g.has_edge(s, d) == ((s, d) in edges)
+
+class TestSimpleDiGraph:
+
+    def test_structure(self):
+        edges = set(zip(SRC, DST))
+        for cls in DIGRAPH_CLASSES:
+            g = nnx.from_edge_array(SRC, DST, create_using=cls)
+            _check(g, edges)
+            assert g.has_self_loops()
+            assert g.number_of_self_loops() == 1
+
+    def test_mutation(self):
+        for cls in DIGRAPH_CLASSES[:3]:
+            g = nnx.from_edge_array(SRC, DST, create_using=cls)
+            edges = set(zip(SRC, DST))
+            assert g.add_edge(2, 1)
+            assert not g.add_edge(2, 1)
+            assert not g.add_edge(2, 9)
+            assert g.add_edge(7, 2, True)
+            edges |= {(2, 1), (7, 2)}
+            assert g.rem_edge(0, 1)
+            assert not g.rem_edge(0, 1)
+            edges.discard((0, 1))
+            _check(g, edges)
+            # vertex 7 moves into slot 1
+            assert g.rem_vertex(1)
+            edges = {(1 if s == 7 else s, 1 if d == 7 else d) for s, d in edges if 1 not in (s, d)}
+            assert g.nv == 7
+            _check(g, edges)
+
+    def test_freeze_thaw(self):
+        edges = set(zip(SRC, DST))
+        for cls in DIGRAPH_CLASSES[:3]:
+            h = nnx.from_edge_array(SRC, DST, create_using=cls).freeze()
+            _check(h, edges)
+            for create_using in DIGRAPH_CLASSES[:3]:
+                _check(h.thaw(create_using), edges)
+
+    def test_connected_components(self):
+        # weakly connected: every edge counts in both directions
+        g = nnx.from_edge_array(np.array([1, 2, 3, 5]), np.array([0, 1, 2, 4]), create_using=nnx.SimpleDiGraphArray)
+        comps = nnx.connected_components(g)
+        assert sorted(sorted(c) for c in comps) == [[0, 1, 2, 3], [4, 5]]
+        for cls in DIGRAPH_CLASSES:
+            h = nnx.from_edge_array(SRC, DST, n=7, create_using=cls)
+            assert sorted(sorted(c) for c in nnx.connected_components(h)) == [[0, 1, 2, 3, 4, 5], [6]]
+
+    def test_transpose_csr(self):
+        g = nnx.from_edge_array(SRC, DST, create_using=nnx.SimpleDiGraphCSR)
+        toffsets, tindices = transpose_csr(g.offsets, g.indices)
+        assert np.array_equal(toffsets, g.boffsets)
+        assert np.array_equal(tindices, g.bindices)
+        for v in range(g.nv):
+            row = tindices[toffsets[v]:toffsets[v + 1]]
+            assert np.array_equal(row, np.sort(row))
+            assert sorted(row) == sorted(s for s, d in zip(SRC, DST) if d == v)
+        # transposing twice gives back the original
+        ooffsets, oindices = transpose_csr(toffsets, tindices)
+        assert np.array_equal(ooffsets, g.offsets)
+        assert np.array_equal(oindices, g.indices)
+
+    def test_has_edges(self):
+        edges = set(zip(SRC, DST))
+        src = np.array([0, 1, 3, 3, 4, 2, 0, 9, -1], dtype=np.int64)
+        dst = np.array([1, 0, 3, 4, 1, 0, 2, 0, 0], dtype=np.int64)
+        expected = [(s, d) in edges for s, d in zip(src, dst)]
+        for cls in DIGRAPH_CLASSES[2:]:
+            g = nnx.from_edge_array(SRC, DST, create_using=cls)
+            assert np.array_equal(g.has_edges(src, dst), expected)
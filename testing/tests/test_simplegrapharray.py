@@ -0,0 +1,51 @@
+# Tests batched edge mutation against the sequential add_edge/rem_edge
+import nnx
+import numpy as np
+
+def _same_graph(g, h):
+    assert g.nv == h.nv
+    assert g.ne == h.ne
+    for v in range(g.nv):
+        assert np.array_equal(g.neighbors(v), h.neighbors(v))
+
+def _random_batch(nv, m, seed):
+    rng = np.random.RandomState(seed)
+    return rng.randint(0, nv, m), rng.randint(0, nv, m)
+
+class TestBatchMutation:
+
+    def test_add_matches_sequential(self):
+        g = nnx.from_edge_array(*_random_batch(30, 40, 0), n=30)
+        h = nnx.from_edge_array(*_random_batch(30, 40, 0), n=30)
+        # repeats, reversed pairs, self loops and edges already present
+        src, dst = _random_batch(30, 200, 1)
+        src[:3] = [4, 7, 7]
+        dst[:3] = [7, 4, 7]
+        flags = g.add_edges_batch(src, dst)
+        expected = [h.add_edge(s, d) for s, d in zip(src, dst)]
+        assert np.array_equal(flags, expected)
+        _same_graph(g, h)
+
+    def test_add_out_of_range(self):
+        src = np.array([0, 1, 6, 2])
+        dst = np.array([1, 5, 2, 2])
+        g = nnx.SimpleGraphArray(3)
+        h = nnx.SimpleGraphArray(3)
+        flags = g.add_edges_batch(src, dst)
+        assert np.array_equal(flags, [h.add_edge(s, d) for s, d in zip(src, dst)])
+        _same_graph(g, h)
+        # add_nodes grows the graph to the largest endpoint first
+        g = nnx.SimpleGraphArray(3)
+        h = nnx.SimpleGraphArray(3)
+        flags = g.add_edges_batch(src, dst, True)
+        assert np.array_equal(flags, [h.add_edge(s, d, True) for s, d in zip(src, dst)])
+        assert g.nv == 7
+        _same_graph(g, h)
+
+    def test_rem_matches_sequential(self):
+        g = nnx.from_edge_array(*_random_batch(30, 120, 2), n=30)
+        h = nnx.from_edge_array(*_random_batch(30, 120, 2), n=30)
+        src, dst = _random_batch(32, 300, 3)
+        flags = g.rem_edges_batch(src, dst)
+        assert np.array_equal(flags, [h.rem_edge(s, d) for s, d in zip(src, dst)])
+        _same_graph(g, h)
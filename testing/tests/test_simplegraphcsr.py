@@ -0,0 +1,49 @@
+# Tests the immutable CSR graph class against the mutable array class
+import nnx
+import numpy as np
+
+def _graph_pair():
+    g = nnx.balanced_tree(2, 4)
+    # the CSR class is immutable, so build it from the array graph's lists
+    h = nnx.SimpleGraphCSR((g.ne, g.fadjlist))
+    return g, h
+
+class TestSimpleGraphCSR:
+
+    def test_structure(self):
+        g, h = _graph_pair()
+        assert h.nv == g.nv
+        assert h.ne == g.ne
+        for v in range(g.nv):
+            assert np.array_equal(h.neighbors(v), g.neighbors(v))
+        assert h.has_edge(0, 1)
+        assert not h.has_edge(1, 2)
+        assert not h.has_self_loops()
+
+    def test_has_edges(self):
+        g, h = _graph_pair()
+        src = np.array([0, 1, 2, 1, 5, 30, 0, 1], dtype=np.int64)
+        dst = np.array([1, 0, 6, 2, 11, 14, 1, 40], dtype=np.int64)
+        expected = np.array([g.has_edge(s, d) for s, d in zip(src, dst)])
+        assert np.array_equal(g.has_edges(src, dst), expected)
+        assert np.array_equal(h.has_edges(src, dst), expected)
+
+    def test_algorithms(self):
+        g, h = _graph_pair()
+        assert np.array_equal(nnx.bfs_traversal(h, [0]), nnx.bfs_traversal(g, [0]))
+        assert np.array_equal(nnx.dfs_traversal(h, 0), nnx.dfs_traversal(g, 0))
+        assert np.allclose(nnx.pagerank(h), nnx.pagerank(g))
+        assert len(nnx.connected_components(h)) == 1
+
+    def test_freeze_thaw(self):
+        g, _ = _graph_pair()
+        h = g.freeze()
+        assert h.ne == g.ne
+        for create_using in (nnx.SimpleGraphArray, nnx.SimpleGraphList, nnx.SimpleGraphSet):
+            k = h.thaw(create_using)
+            assert k.ne == g.ne
+            for v in range(g.nv):
+                assert sorted(k.neighbors(v)) == list(g.neighbors(v))
+        k = h.thaw(nnx.SimpleGraphArray)
+        k.add_edge(1, 2)
+        assert not h.has_edge(1, 2)
@@ -0,0 +1,43 @@
+# Tests the capacity-managed graph class against the array class
+import nnx
+import numpy as np
+import pytest
+
+class TestSimpleGraphVector:
+
+    def test_edits(self):
+        g = nnx.SimpleGraphArray(5)
+        h = nnx.SimpleGraphVector(5)
+        for s, d in [(0, 4), (0, 1), (0, 3), (2, 0), (1, 3), (4, 4)]:
+            assert h.add_edge(s, d) == g.add_edge(s, d)
+        assert not h.add_edge(1, 0)
+        assert h.rem_edge(0, 3)
+        g.rem_edge(0, 3)
+        assert h.ne == g.ne
+        for v in range(g.nv):
+            assert np.array_equal(h.neighbors(v), g.neighbors(v))
+            assert h.degree(v) == g.degree(v)
+        assert h.capacity(0) > h.degree(0)
+        h.shrink_to_fit()
+        assert h.capacity(0) == h.degree(0)
+        assert np.array_equal(h.neighbors(0), np.array([1, 2, 4]))
+
+    def test_rem_vertex(self):
+        h = nnx.path_graph(4, create_using=nnx.SimpleGraphVector)
+        h.add_edge(3, 3)
+        assert h.rem_vertex(1)
+        assert h.nv == 3
+        assert np.array_equal(h.neighbors(1), np.array([1, 2]))
+        assert not h.has_edge(0, 1)
+
+    def test_bounded_by_nv(self):
+        # degs keeps spare capacity after growing and after rem_vertex
+        h = nnx.SimpleGraphVector(3)
+        h.add_vertex()
+        assert h.degree(3) == 0
+        assert h.rem_vertex(3)
+        for f in (h.degree, h.indegree, h.outdegree, h.neighbors, h.capacity):
+            with pytest.raises(IndexError):
+                f(3)
+            with pytest.raises(IndexError):
+                f(5)
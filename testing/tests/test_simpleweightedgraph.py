@@ -0,0 +1,103 @@
+# Tests the weighted graph classes and the code paths that read their weights
+import nnx
+import numba
+import numpy as np
+import pytest
+
+from nnx.algorithms.shortest_paths.weighted import standard_distance
+from nnx.classes.common import graph_weights, weighted_edge_array_to_csr
+
+SRC = np.array([0, 1, 2, 3, 0, 1, 4])
+DST = np.array([1, 2, 3, 0, 2, 0, 4])
+W = np.array([1.0, 2.0, 3.0, 4.0, 5.0, 9.0, 0.5])
+@numba.njit
+def _double_distance(s, d):
+    return 2.0
+
+WEIGHTED_CLASSES = (nnx.SimpleWeightedGraphArray, nnx.SimpleWeightedGraphCSR)
+
+def _expected_weights():
+    # (1, 0) repeats (0, 1): the first occurrence keeps its weight
+    return {(0, 1): 1.0, (1, 2): 2.0, (2, 3): 3.0, (0, 3): 4.0, (0, 2): 5.0, (4, 4): 0.5}
+
+def _check(g, expected):
+    assert g.ne == len(expected)
+    for v in range(g.nv):
+        nbrs, ws = g.neighbors_with_weights(v)
+        assert np.array_equal(nbrs, g.neighbors(v))
+        for d, w in zip(nbrs, ws):
+            assert expected[(min(v, d), max(v, d))] == w
+            assert g.get_weight(v, d) == w
+    assert np.isnan(g.get_weight(1, 4))
+    assert np.isnan(g.get_weight(0, 9))
+
+class TestSimpleWeightedGraph:
+
+    def test_weighted_edge_array_to_csr(self):
+        ne, offsets, indices, w = weighted_edge_array_to_csr(SRC, DST, W, 5, False)
+        assert ne == 6
+        assert np.array_equal(offsets, [0, 3, 5, 8, 10, 11])
+        assert np.array_equal(indices, [1, 2, 3, 0, 2, 0, 1, 3, 0, 2, 4])
+        assert np.array_equal(w, [1.0, 5.0, 4.0, 1.0, 2.0, 5.0, 2.0, 3.0, 4.0, 3.0, 0.5])
+        ne, offsets, indices, w = weighted_edge_array_to_csr(SRC, DST, W, 5, True)
+        assert ne == 7
+        assert np.array_equal(indices, [1, 2, 0, 2, 3, 0, 4])
+        assert np.array_equal(w, [1.0, 5.0, 9.0, 2.0, 3.0, 4.0, 0.5])
+
+    def test_structure(self):
+        for cls in WEIGHTED_CLASSES:
+            g = nnx.from_edge_array(SRC, DST, create_using=cls, weights=W)
+            _check(g, _expected_weights())
+            assert np.array_equal(graph_weights(g), weighted_edge_array_to_csr(SRC, DST, W, 5, False)[3])
+
+    def test_mutation_and_freeze(self):
+        g = nnx.from_edge_array(SRC, DST, create_using=nnx.SimpleWeightedGraphArray, weights=W)
+        expected = _expected_weights()
+        assert g.add_edge(1, 3, False, 7.0)
+        assert not g.add_edge(3, 1, False, 8.0)
+        g.add_weighted_edges_from([(5, 0, 6.0)], True)
+        assert g.rem_edge(2, 0)
+        assert not g.rem_edge(2, 0)
+        expected[(1, 3)] = 7.0
+        expected[(0, 5)] = 6.0
+        del expected[(0, 2)]
+        assert g.nv == 6
+        _check(g, expected)
+        h = g.freeze()
+        _check(h, expected)
+        _check(h.thaw(nnx.SimpleWeightedGraphArray), expected)
+
+    def test_read_edgelist(self, tmp_path):
+        path = tmp_path / "weighted.txt"
+        path.write_bytes(b"0 1 1.0\n1 2 2\n2 3 3e0\n3 0 4.0\n0 2 5.0\n1 0 9.0\n4 4 0.5\n")
+        for cls in WEIGHTED_CLASSES:
+            g = nnx.read_edgelist(str(path), create_using=cls)
+            _check(g, _expected_weights())
+        # a missing weight column reads as 1.0
+        path.write_bytes(b"0 1\n1 2 2.5\n")
+        src, dst, w = nnx.read_edgelist_arrays(str(path), weighted=True)
+        assert np.array_equal(w, [1.0, 2.5])
+
+    def test_generators_use_unit_weights(self):
+        for cls in WEIGHTED_CLASSES:
+            g = nnx.complete_graph(4, cls)
+            assert g.ne == 6
+            assert np.all(graph_weights(g) == 1.0)
+
+    def test_algorithms_read_weights(self):
+        for cls in WEIGHTED_CLASSES:
+            g = nnx.from_edge_array(SRC, DST, create_using=cls, weights=W)
+            w = graph_weights(g)
+            x, _, _ = nnx.pagerank_spmv(g, e=1e-10, n=500, weights=w)
+            assert np.allclose(nnx.pagerank(g, e=1e-10, n=500), x)
+            assert np.allclose(nnx.pagerank(g, e=1e-10, n=500, parallel=True), x)
+            u = nnx.from_edge_array(SRC, DST)
+            assert not np.allclose(nnx.pagerank(u, e=1e-10, n=500), x)
+            _, dists, _ = nnx.dijkstra_shortest_paths_weighted(g, np.array([1]))
+            assert np.array_equal(dists, [1.0, 0.0, 2.0, 5.0, np.inf])
+            parents, dists, preds = nnx.dijkstra_shortest_paths(g, [1], False, standard_distance)
+            assert np.array_equal(dists, [1.0, 0.0, 2.0, 5.0, np.inf])
+            assert list(preds[3]) == [parents[3]]
+            with pytest.raises(Exception):
+                nnx.dijkstra_shortest_paths(g, [1], False, _double_distance)
+            assert nnx.shortest_path_length(g, 1, 3, w, True) == 5.0
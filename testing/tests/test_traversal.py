@@ -0,0 +1,92 @@
+# Tests the breadth-first traversals against a plain python BFS
+import nnx
+import numpy as np
+
+def _random_edges(nv, ne, seed):
+    rng = np.random.RandomState(seed)
+    return rng.randint(0, nv, ne), rng.randint(0, nv, ne)
+
+def _reference_dists(nv, src, dst, sources, directed):
+    adj = [[] for _ in range(nv)]
+    for s, d in zip(src, dst):
+        adj[s].append(d)
+        if not directed:
+            adj[d].append(s)
+    dists = np.full(nv, -1)
+    frontier = list(sources)
+    dists[frontier] = 0
+    level = 0
+    while frontier:
+        level += 1
+        nxt = []
+        for u in frontier:
+            for v in adj[u]:
+                if dists[v] == -1:
+                    dists[v] = level
+                    nxt.append(v)
+        frontier = nxt
+    return dists
+
+def _check_parents(g, ss, parents, dists):
+    for s in ss:
+        assert parents[s] == s
+    for v in range(g.nv):
+        if dists[v] > 0:
+            assert g.has_edge(parents[v], v)
+            assert dists[parents[v]] == dists[v] - 1
+        elif dists[v] == -1:
+            assert parents[v] == -1
+
+class TestBfsDirectionOptimizing:
+
+    def test_undirected(self):
+        src, dst = _random_edges(200, 300, 0)
+        g = nnx.from_edge_array(src, dst, n=200)
+        ss = np.array([0, 5])
+        expected = _reference_dists(200, src, dst, ss, False)
+        # the defaults, always top-down and always bottom-up after level 0
+        for alpha, beta in ((15, 18), (1e9, 1), (1e-9, 1e-9)):
+            parents, dists = nnx.bfs_direction_optimizing(g, ss, alpha, beta)
+            assert np.array_equal(dists, expected)
+            _check_parents(g, ss, parents, dists)
+
+    def test_directed(self):
+        src, dst = _random_edges(100, 150, 1)
+        g = nnx.from_edge_array(src, dst, n=100, create_using=nnx.SimpleDiGraphArray)
+        ss = np.array([3])
+        expected = _reference_dists(100, src, dst, ss, True)
+        for alpha, beta in ((15, 18), (1e-9, 1e-9)):
+            parents, dists = nnx.bfs_direction_optimizing(g, ss, alpha, beta)
+            assert np.array_equal(dists, expected)
+            _check_parents(g, ss, parents, dists)
+
+    def test_matches_bfs_traversal_reach(self):
+        g = nnx.from_edge_array(np.array([0, 1, 3]), np.array([1, 2, 4]))
+        parents, dists = nnx.bfs_direction_optimizing(g, np.array([0, 0]))
+        assert np.array_equal(dists, [0, 1, 2, -1, -1])
+        assert np.array_equal(parents, nnx.bfs_traversal(g, np.array([0])))
+
+class TestMultiSourceBfs:
+
+    def test_undirected_batches(self):
+        # 70 sources span two 64-bit batches
+        src, dst = _random_edges(120, 150, 2)
+        g = nnx.from_edge_array(src, dst, n=120)
+        sources = np.arange(0, 140, 2) % 120
+        dists = nnx.multi_source_bfs(g, sources)
+        assert dists.shape == (70, 120)
+        assert dists.dtype == np.int32
+        for i, s in enumerate(sources):
+            assert np.array_equal(dists[i], _reference_dists(120, src, dst, [s], False))
+
+    def test_directed(self):
+        src, dst = _random_edges(50, 80, 3)
+        g = nnx.from_edge_array(src, dst, n=50, create_using=nnx.SimpleDiGraphArray)
+        sources = np.array([0, 7, 7, 49])
+        dists = nnx.multi_source_bfs(g, sources)
+        for i, s in enumerate(sources):
+            assert np.array_equal(dists[i], _reference_dists(50, src, dst, [s], True))
+
+    def test_no_sources(self):
+        g = nnx.from_edge_array(np.array([0]), np.array([1]))
+        assert nnx.multi_source_bfs(g, np.empty(0, dtype=np.int64)).shape == (0, 2)
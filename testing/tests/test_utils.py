@@ -1,6 +1,8 @@
 # Tests the basic utils
 import nnx
 import numba
+import numpy as np
+import nnx.classes.common as nnx_common
 from testing import assert_graphs_equal
 
 class _GenericTest:
@@ -30,4 +32,52 @@ class TestGraphsEqual(_GenericTest):
     def test_graphs_not_equal(self):
         g = nnx.from_edge_list(numba.typed.List([(0,1), (1,2)]), create_using=nnx.SimpleGraphArray)
         h = nnx.path_graph(4, create_using=nnx.SimpleGraphArray)
-        self._test_not_equal(g, h)
\ No newline at end of file
+        self._test_not_equal(g, h)
+
+    def test_graphs_equal_from_edge_array(self):
+        src = np.array([2, 0, 1, 1], dtype=np.int64)
+        dst = np.array([3, 1, 2, 0], dtype=np.int64)
+        g = nnx.from_edge_array(src, dst, create_using=nnx.SimpleGraphArray)
+        h = nnx.path_graph(4, create_using=nnx.SimpleGraphArray)
+        self._test_equal(g, h)
+        assert g.ne == h.ne
+
+class TestGraphStatistics:
+
+    def test_statistics(self):
+        g = nnx.from_edge_array(np.array([0, 1, 0, 2, 3]), np.array([1, 2, 2, 3, 3]))
+        assert np.array_equal(nnx.degrees(g), [2, 2, 3, 2])
+        assert np.array_equal(nnx.degree_histogram(g), [0, 0, 3, 1])
+        assert np.isclose(nnx.density(g), 5.0 / 6.0)
+        assert nnx.number_of_self_loops(g) == 1
+        assert g.has_self_loops()
+        assert g.self_loop_edges() == [(3, 3)]
+        h = nnx.path_graph(3, create_using=nnx.SimpleGraphArray)
+        assert not h.has_self_loops()
+        assert nnx.number_of_self_loops(h) == 0
+
+    def test_number_of_self_loops_all_classes(self):
+        src = np.array([0, 1, 2, 2, 4])
+        dst = np.array([0, 2, 2, 3, 1])
+        for cls in (nnx.SimpleGraphArray, nnx.SimpleGraphList, nnx.SimpleGraphSet, nnx.SimpleGraphCSR,
+                    nnx.SimpleGraphVector, nnx.SimpleDiGraphArray, nnx.SimpleDiGraphList,
+                    nnx.SimpleDiGraphSet, nnx.SimpleDiGraphCSR):
+            g = nnx.from_edge_array(src, dst, create_using=cls)
+            assert g.number_of_self_loops() == 2
+            assert nnx_common.number_of_self_loops(g) == 2
+
+class TestEdgeArrayToCSR:
+
+    def test_dedup_and_mirror(self):
+        src = np.array([2, 0, 1, 1, 2, 3])
+        dst = np.array([3, 1, 2, 0, 3, 3])
+        ne, offsets, indices = nnx_common.edge_array_to_csr(src, dst, 4, False)
+        assert ne == 4
+        assert np.array_equal(offsets, [0, 1, 3, 5, 7])
+        assert np.array_equal(indices, [1, 0, 2, 1, 3, 2, 3])
+
+    def test_edge_order_large_nv(self):
+        # the s * nv + d key would overflow int64 here
+        s = np.array([5, 1, 5, 1])
+        d = np.array([3, 9, 1, 2])
+        assert np.array_equal(nnx_common._edge_order(s, d, 4000000000), [3, 1, 2, 0])